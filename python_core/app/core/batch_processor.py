@@ -1,6 +1,5 @@
 import asyncio
 import time
-import json
 import gzip
 import threading
 from typing import Dict, List, Any, Optional, Callable, Union
@@ -9,6 +8,8 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 import logging
 
+from .serialization import dumps as json_dumps
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -101,23 +102,22 @@ class DataBatch:
     
     def to_json(self, compress: bool = None) -> Union[str, bytes]:
         """배치를 JSON으로 직렬화 (선택적 압축)"""
-        data = self.to_dict()
-        json_str = json.dumps(data, separators=(',', ':'))
+        # orjson(있으면)으로 한 번만 UTF-8 bytes로 직렬화 - 압축 시 다시 encode하지 않음
+        json_bytes = json_dumps(self.to_dict())
         
         # 압축 여부 결정
         if compress is None:
-            compress = self.enable_compression and len(json_str) > self.compression_threshold
+            compress = self.enable_compression and len(json_bytes) > self.compression_threshold
         
         if compress:
-            return gzip.compress(json_str.encode('utf-8'))
+            return gzip.compress(json_bytes)
         else:
-            return json_str
+            return json_bytes.decode('utf-8')
     
     def get_size_bytes(self) -> int:
         """배치 크기 (바이트) 반환"""
         try:
-            json_str = json.dumps(self.to_dict())
-            return len(json_str.encode('utf-8'))
+            return len(json_dumps(self.to_dict()))
         except:
             return 0
 
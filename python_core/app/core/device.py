@@ -2,7 +2,7 @@
 import asyncio
 import logging
 from bleak import BleakScanner, BleakClient
-from typing import Callable, Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from collections import deque
 from bleak.backends.device import BLEDevice
 from bleak.backends.characteristic import BleakGATTCharacteristic
@@ -112,7 +112,8 @@ class DeviceManager:
         self.bat_sample_count = 0
         self.last_sample_log_time = time.time()
 
-        self.processed_data_callbacks = []
+        # 콜백은 이벤트 루프에서 직접 await됨 - 순회 중 등록/해제되어도 안전하도록 튜플로 교체(copy-on-write)
+        self.processed_data_callbacks: Tuple[Callable, ...] = ()
 
         # 스캔 캐시 (스캔 결과를 일정 시간 캐시)
         self._cached_devices: List[Any] = []
@@ -614,7 +615,7 @@ class DeviceManager:
             if platform.system() == 'Windows':
                 self.logger.info(f"[WINDOWS DEBUG] EEG callback called! Data length: {len(data)} bytes")
             
-            self.logger.debug(f"Received EEG data: {len(data)} bytes")
+            self.logger.debug("Received EEG data: %d bytes", len(data))
             if len(data) < 8:  # Minimum expected data length (4 bytes timestamp + 4 bytes EEG)
                 self.logger.warning(f"EEG data too short: {len(data)} bytes")
                 return
@@ -625,7 +626,9 @@ class DeviceManager:
             # 데이터 구조: 7바이트 단위로 반복 (1바이트 leadoff + 3바이트 ch1 + 3바이트 ch2)
             num_samples = (len(data) - 4) // 7
 
-            self.logger.debug(f"EEG data: base_timestamp={base_timestamp}, num_samples={num_samples}")
+            self.logger.debug("EEG data: base_timestamp=%s, num_samples=%d", base_timestamp, num_samples)
+            # 샘플 단위 디버그 로그는 DEBUG가 켜져 있을 때만 (패킷마다 한 번만 확인)
+            debug_samples = self.logger.isEnabledFor(logging.DEBUG)
 
             samples_to_add = []
             for i in range(num_samples):
@@ -663,7 +666,8 @@ class DeviceManager:
                     "leadoff_ch2": leadoff_ch2
                 }
                 samples_to_add.append(sample)
-                self.logger.debug(f"EEG sample {i}: {sample}")
+                if debug_samples:
+                    self.logger.debug("EEG sample %d: %s", i, sample)
 
             if samples_to_add:
                 # Raw data buffer에 추가
@@ -700,7 +704,7 @@ class DeviceManager:
     async def _handle_ppg(self, sender, data: bytearray):
         """Handle incoming PPG data, storing in buffer."""
         try:
-            self.logger.debug(f"Received PPG data: {len(data)} bytes")
+            self.logger.debug("Received PPG data: %d bytes", len(data))
             if len(data) < 8:  # Minimum expected data length (4 bytes timestamp + 4 bytes PPG)
                 self.logger.warning(f"PPG data too short: {len(data)} bytes")
                 return
@@ -711,7 +715,9 @@ class DeviceManager:
             # 데이터 구조: 4바이트 타임스탬프 + 6바이트씩 반복 (3바이트 red + 3바이트 ir)
             num_samples = (len(data) - 4) // 6
 
-            self.logger.debug(f"PPG data: base_timestamp={base_timestamp}, num_samples={num_samples}")
+            self.logger.debug("PPG data: base_timestamp=%s, num_samples=%d", base_timestamp, num_samples)
+            # 샘플 단위 디버그 로그는 DEBUG가 켜져 있을 때만 (패킷마다 한 번만 확인)
+            debug_samples = self.logger.isEnabledFor(logging.DEBUG)
 
             samples_to_add = []
             for sample_idx in range(num_samples):
@@ -733,7 +739,8 @@ class DeviceManager:
                     "ir": ir_raw
                 }
                 samples_to_add.append(sample)
-                self.logger.debug(f"PPG sample {sample_idx}: {sample}")
+                if debug_samples:
+                    self.logger.debug("PPG sample %d: %s", sample_idx, sample)
 
             if samples_to_add:
                 # Raw data buffer에 추가
@@ -751,7 +758,7 @@ class DeviceManager:
                 
                 # SignalProcessor 버퍼에 추가
                 self.signal_processor.add_to_buffer("ppg", samples_to_add)
-                self.logger.debug(f"Added {len(samples_to_add)} PPG samples to SignalProcessor buffer")
+                self.logger.debug("Added %d PPG samples to SignalProcessor buffer", len(samples_to_add))
                 
                 # Process PPG data in a separate task
                 processed_data = await self.signal_processor.process_ppg_data()
@@ -767,7 +774,7 @@ class DeviceManager:
     async def _handle_acc(self, sender, data: bytearray):
         """Handle incoming accelerometer data, storing in buffer."""
         try:
-            self.logger.debug(f"Received ACC data: {len(data)} bytes")
+            self.logger.debug("Received ACC data: %d bytes", len(data))
             if len(data) < 10:  # Minimum expected data length (4 bytes timestamp + 6 bytes ACC)
                 self.logger.warning(f"ACC data too short: {len(data)} bytes")
                 return
@@ -776,7 +783,9 @@ class DeviceManager:
             base_timestamp = time_raw / TIMESTAMP_CLOCK
             num_samples = (len(data) - 4) // 6  # Each sample is 6 bytes (2 bytes per axis)
 
-            self.logger.debug(f"ACC data: base_timestamp={base_timestamp}, num_samples={num_samples}")
+            self.logger.debug("ACC data: base_timestamp=%s, num_samples=%d", base_timestamp, num_samples)
+            # 샘플 단위 디버그 로그는 DEBUG가 켜져 있을 때만 (패킷마다 한 번만 확인)
+            debug_samples = self.logger.isEnabledFor(logging.DEBUG)
 
             samples_to_add = []
             for i in range(num_samples):
@@ -798,7 +807,8 @@ class DeviceManager:
                     "z": z_raw
                 }
                 samples_to_add.append(sample)
-                self.logger.debug(f"ACC sample {i}: {sample}")
+                if debug_samples:
+                    self.logger.debug("ACC sample %d: %s", i, sample)
 
             if samples_to_add:
                 # Raw data buffer에 추가
@@ -816,7 +826,7 @@ class DeviceManager:
                 
                 # SignalProcessor 버퍼에 추가
                 self.signal_processor.add_to_buffer("acc", samples_to_add)
-                self.logger.debug(f"Added {len(samples_to_add)} ACC samples to SignalProcessor buffer")
+                self.logger.debug("Added %d ACC samples to SignalProcessor buffer", len(samples_to_add))
 
                 processed_data = await self.signal_processor.process_acc_data()
                 if processed_data:
@@ -957,28 +967,28 @@ class DeviceManager:
         """Get a copy of the EEG buffer and clear it."""
         buffer_copy = self._eeg_buffer.copy()
         self._eeg_buffer.clear()
-        self.logger.debug(f"Getting and clearing EEG buffer: {len(buffer_copy)} samples")
+        self.logger.debug("Getting and clearing EEG buffer: %d samples", len(buffer_copy))
         return buffer_copy
 
     def get_and_clear_ppg_buffer(self) -> List[Any]:
         """Get a copy of the PPG buffer and clear it."""
         buffer_copy = self._ppg_buffer.copy()
         self._ppg_buffer.clear()
-        self.logger.debug(f"Getting and clearing PPG buffer: {len(buffer_copy)} samples")
+        self.logger.debug("Getting and clearing PPG buffer: %d samples", len(buffer_copy))
         return buffer_copy
 
     def get_and_clear_acc_buffer(self) -> List[Any]:
         """Get a copy of the accelerometer buffer and clear it."""
         buffer_copy = self._acc_buffer.copy()
         self._acc_buffer.clear()
-        self.logger.debug(f"Getting and clearing ACC buffer: {len(buffer_copy)} samples")
+        self.logger.debug("Getting and clearing ACC buffer: %d samples", len(buffer_copy))
         return buffer_copy
 
     def get_and_clear_battery_buffer(self) -> List[Any]:
         """Get a copy of the battery buffer and clear it."""
         buffer_copy = self._battery_buffer.copy()
         self._battery_buffer.clear()
-        self.logger.debug(f"Getting and clearing battery buffer: {len(buffer_copy)} samples")
+        self.logger.debug("Getting and clearing battery buffer: %d samples", len(buffer_copy))
         return buffer_copy
 
     # Legacy method - use specific getters instead
@@ -1026,13 +1036,13 @@ class DeviceManager:
     def add_processed_data_callback(self, callback):
         """Add a callback function to be called when data is processed"""
         if callback not in self.processed_data_callbacks:
-            self.processed_data_callbacks.append(callback)
+            self.processed_data_callbacks = self.processed_data_callbacks + (callback,)
             self.logger.info("Added new processed data callback")
 
     def remove_processed_data_callback(self, callback):
         """Remove a callback function"""
         if callback in self.processed_data_callbacks:
-            self.processed_data_callbacks.remove(callback)
+            self.processed_data_callbacks = tuple(cb for cb in self.processed_data_callbacks if cb != callback)
             self.logger.info("Removed processed data callback")
 
     async def _notify_processed_data(self, data_type: str, processed_data: dict):
@@ -1054,7 +1064,8 @@ class DeviceManager:
                 ws_available = hasattr(self, 'ws_server') and self.ws_server is not None
                 recorder_available = ws_available and self.ws_server.data_recorder is not None
                 is_recording = recorder_available and self.ws_server.data_recorder.is_recording
-                self.logger.debug(f"[DATA_STORAGE_DEBUG] Not recording - ws_server: {ws_available}, data_recorder: {recorder_available}, is_recording: {is_recording}")
+                self.logger.debug("[DATA_STORAGE_DEBUG] Not recording - ws_server: %s, data_recorder: %s, is_recording: %s",
+                                  ws_available, recorder_available, is_recording)
         except Exception as e:
             self.logger.error(f"Error saving processed data: {e}")
         
@@ -1085,7 +1096,8 @@ class DeviceManager:
                 ws_available = hasattr(self, 'ws_server') and self.ws_server is not None
                 recorder_available = ws_available and self.ws_server.data_recorder is not None
                 is_recording = recorder_available and self.ws_server.data_recorder.is_recording
-                self.logger.debug(f"[DATA_STORAGE_DEBUG] Not recording raw data - ws_server: {ws_available}, data_recorder: {recorder_available}, is_recording: {is_recording}")
+                self.logger.debug("[DATA_STORAGE_DEBUG] Not recording raw data - ws_server: %s, data_recorder: %s, is_recording: %s",
+                                  ws_available, recorder_available, is_recording)
         except Exception as e:
             self.logger.error(f"Error saving raw data: {e}")
         
@@ -1100,19 +1112,40 @@ class DeviceManager:
         """Get a copy of the processed EEG buffer and clear it."""
         buffer_copy = self._processed_eeg_buffer.copy()
         self._processed_eeg_buffer.clear()
-        self.logger.debug(f"Getting and clearing processed EEG buffer: {len(buffer_copy)} samples")
+        self.logger.debug("Getting and clearing processed EEG buffer: %d samples", len(buffer_copy))
         return buffer_copy
 
     async def get_and_clear_processed_ppg_buffer(self) -> List[Any]:
         """Get a copy of the processed PPG buffer and clear it."""
         buffer_copy = self._processed_ppg_buffer.copy()
         self._processed_ppg_buffer.clear()
-        self.logger.debug(f"Getting and clearing processed PPG buffer: {len(buffer_copy)} samples")
+        self.logger.debug("Getting and clearing processed PPG buffer: %d samples", len(buffer_copy))
         return buffer_copy
 
     async def get_and_clear_processed_acc_buffer(self) -> List[Any]:
         """Get a copy of the processed ACC buffer and clear it."""
         buffer_copy = self._processed_acc_buffer.copy()
         self._processed_acc_buffer.clear()
-        self.logger.debug(f"Getting and clearing processed ACC buffer: {len(buffer_copy)} samples")
+        self.logger.debug("Getting and clearing processed ACC buffer: %d samples", len(buffer_copy))
         return buffer_copy
+
+    def get_and_clear_sensor_buffers(self, sensor_type: str) -> Tuple[List[Any], List[Any]]:
+        """Get and clear the raw and processed buffers of a sensor in one call.
+
+        Both buffers are only touched from the event loop, so the current lists
+        are handed over as-is and replaced with fresh ones instead of copied.
+        Raw buffers only ever hold the sample dicts built in the _handle_* callbacks,
+        each with a "timestamp" key, so callers can use them without per-sample checks.
+        """
+        if sensor_type == 'eeg':
+            raw, self._eeg_buffer = self._eeg_buffer, []
+            processed, self._processed_eeg_buffer = self._processed_eeg_buffer, []
+        elif sensor_type == 'ppg':
+            raw, self._ppg_buffer = self._ppg_buffer, []
+            processed, self._processed_ppg_buffer = self._processed_ppg_buffer, []
+        elif sensor_type == 'acc':
+            raw, self._acc_buffer = self._acc_buffer, []
+            processed, self._processed_acc_buffer = self._processed_acc_buffer, []
+        else:
+            raise ValueError(f"Unknown sensor type: {sensor_type}")
+        return raw, processed
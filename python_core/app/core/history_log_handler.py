@@ -33,9 +33,9 @@ class HistoryLogHandler(logging.Handler):
     def emit(self, record: logging.LogRecord):
         """로그 레코드를 처리하여 데이터베이스에 저장"""
         try:
-            # 현재 스레드 ID 가져오기
-            thread_id = threading.get_ident()
-            process_id = os.getpid()
+            # 로그를 남긴 스레드/프로세스 ID (큐 리스너 스레드에서 처리되어도 원래 값 유지)
+            thread_id = record.thread
+            process_id = record.process
             
             # 추가 데이터 수집
             extra_data = {}
@@ -85,8 +85,13 @@ class HistoryLogManager:
         self.handler = HistoryLogHandler(self.db_manager)
         self._configured_loggers = set()
     
-    def setup_logging(self, logger_names: Optional[list] = None, level: int = logging.INFO):
-        """로깅 설정"""
+    def setup_logging(self, logger_names: Optional[list] = None, level: int = logging.INFO,
+                      attach_handler: bool = True):
+        """로깅 설정
+
+        attach_handler=False이면 로거 레벨만 설정하고 핸들러는 붙이지 않는다
+        (호출한 쪽이 self.handler를 QueueListener 등 별도 경로로 연결하는 경우).
+        """
         if logger_names is None:
             # 기본 로거들 설정
             logger_names = [
@@ -105,6 +110,12 @@ class HistoryLogManager:
         self.handler.setFormatter(formatter)
         self.handler.setLevel(level)
         
+        if not attach_handler:
+            for logger_name in logger_names:
+                logging.getLogger(logger_name).setLevel(level)
+            # 이 시점에는 루트 핸들러가 없으므로 logging.info를 호출하지 않음 (basicConfig 자동 설정 방지)
+            return
+        
         # 각 로거에 핸들러 추가
         for logger_name in logger_names:
             logger = logging.getLogger(logger_name)
@@ -157,8 +168,9 @@ def get_history_log_manager() -> HistoryLogManager:
         _history_log_manager = HistoryLogManager()
     return _history_log_manager
 
-def setup_history_logging(logger_names: Optional[list] = None, level: int = logging.INFO):
+def setup_history_logging(logger_names: Optional[list] = None, level: int = logging.INFO,
+                          attach_handler: bool = True):
     """히스토리 로깅 시스템 설정"""
     manager = get_history_log_manager()
-    manager.setup_logging(logger_names, level)
+    manager.setup_logging(logger_names, level, attach_handler)
     return manager 
\ No newline at end of file
@@ -3,8 +3,11 @@ Link Band SDK 통합 로그 관리 시스템
 중앙 집중식 로그 설정 및 컨텍스트 기반 로깅 제공
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import time
 from enum import Enum
 from typing import Optional, Dict, Any
@@ -61,11 +64,23 @@ class LogTags:
     ERROR = "ERROR"
     SYSTEM = "SYSTEM"
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps exc_info so the listener-side handlers format tracebacks."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 인자는 호출 시점 값으로 메시지에 병합, 포맷팅/IO는 리스너 스레드에서 수행
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class LinkBandLogger:
     """Link Band SDK 통합 로거"""
     
     _instance = None
     _configured = False
+    _queue_listener: Optional[logging.handlers.QueueListener] = None
+    _atexit_registered = False
     
     def __new__(cls):
         if cls._instance is None:
@@ -95,13 +110,11 @@ class LinkBandLogger:
             console_log_level = log_level
         
         # 기존 핸들러 제거 (중복 방지)
+        self._stop_queue_listener()
         root_logger = logging.getLogger()
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
         
-        # 루트 로거 설정
-        root_logger.setLevel(logging.DEBUG)  # 가장 낮은 레벨로 설정
-        
         # 콘솔 핸들러 (간단한 포맷)
         console_handler = logging.StreamHandler()
         console_formatter = logging.Formatter(
@@ -110,7 +123,7 @@ class LinkBandLogger:
         )
         console_handler.setFormatter(console_formatter)
         console_handler.setLevel(console_log_level)
-        root_logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # 파일 핸들러 (상세한 포맷)
         if log_file:
@@ -120,15 +133,31 @@ class LinkBandLogger:
             )
             file_handler.setFormatter(file_formatter)
             file_handler.setLevel(log_level)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
         
         # 히스토리 로그 시스템 활성화
         if enable_history:
             try:
-                setup_history_logging()
+                # 히스토리 핸들러는 개별 로거에 붙이지 않고 리스너 스레드에서만 처리
+                # (DB 저장이 이벤트 루프를 막지 않고, 같은 레코드가 두 번 저장되지 않도록)
+                history_manager = setup_history_logging(attach_handler=False)
+                handlers.append(history_manager.handler)
             except Exception as e:
                 # 히스토리 로그 실패해도 기본 로깅은 계속
                 print(f"Warning: History logging setup failed: {e}")
+
+        # 루트 로거 레벨은 핸들러 중 가장 낮은 레벨로 설정
+        # (아무 핸들러도 출력하지 않는 DEBUG 레코드는 생성/포맷팅 자체를 건너뜀)
+        root_logger.setLevel(min(handler.level or logging.DEBUG for handler in handlers))
+
+        # 루트 로거에는 큐 핸들러만 두고 콘솔/파일/히스토리 출력은 별도 스레드에서 처리
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(_DeferredQueueHandler(log_queue))
+        self._queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._queue_listener.start()
+        if not LinkBandLogger._atexit_registered:
+            atexit.register(self._stop_queue_listener)
+            LinkBandLogger._atexit_registered = True
         
         # 외부 라이브러리 로그 레벨 조정
         logging.getLogger('uvicorn').setLevel(logging.WARNING)
@@ -153,6 +182,12 @@ class LinkBandLogger:
         logger_name = f"{context.value}.{name}"
         return logging.getLogger(logger_name)
     
+    def _stop_queue_listener(self):
+        """Flush pending records and stop the background log listener."""
+        if self._queue_listener is not None:
+            self._queue_listener.stop()
+            self._queue_listener = None
+
     def is_configured(self) -> bool:
         """로그 시스템 설정 여부 확인"""
         return self._configured
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import time
 import psutil
 from datetime import datetime
@@ -11,6 +10,7 @@ from .buffer_manager import global_buffer_manager
 from .batch_processor import global_batch_processor
 from .streaming_optimizer import global_streaming_optimizer
 from .alert_manager import global_alert_manager, Alert
+from .serialization import dumps_text as json_dumps_text
 
 logger = logging.getLogger(__name__)
 
@@ -651,7 +651,7 @@ class MonitoringService:
             
             logger.info(f"[MONITORING_BROADCAST] Message prepared: {len(str(message))} chars")
             
-            message_json = json.dumps(message)
+            message_json = json_dumps_text(message)
             broadcast_success = False
             
             # 1. 독립 WebSocket 서버 클라이언트들에게 브로드캐스트
@@ -683,19 +683,15 @@ class MonitoringService:
                     fastapi_subscriptions = getattr(self.ws_server, 'fastapi_client_subscriptions', {})
                     logger.info(f"[MONITORING_BROADCAST] FastAPI subscriptions: {fastapi_subscriptions}")
                     
-                    for client_id, websocket in connected_clients.items():
-                        try:
-                            # 해당 클라이언트가 monitoring_metrics를 구독했는지 확인
-                            client_channels = fastapi_subscriptions.get(client_id, set())
-                            if message_type in client_channels:
-                                await websocket.send_json(message)
-                                fastapi_success_count += 1
-                                logger.info(f"[MONITORING_BROADCAST] Successfully sent to FastAPI subscriber {client_id}")
-                            else:
-                                # 구독하지 않은 클라이언트에게는 전송하지 않음
-                                logger.debug(f"[MONITORING_BROADCAST] Client {client_id} not subscribed to {message_type}")
-                        except Exception as client_error:
-                            logger.error(f"[MONITORING_BROADCAST] Error sending to FastAPI client {client_id}: {client_error}")
+                    # 해당 메시지 타입을 구독한 클라이언트에게만 전송
+                    subscriber_ids = [
+                        client_id for client_id in connected_clients
+                        if message_type in fastapi_subscriptions.get(client_id, ())
+                    ]
+                    # 이미 직렬화한 message_json을 구독 클라이언트의 송신 큐에 넣음: 전송은 클라이언트별 writer 태스크가
+                    # 담당하므로 느린 클라이언트가 나머지를 지연시키지 않고, 큐가 가득 차면 가장 오래된 메시지를 버림
+                    fastapi_success_count = self.ws_server._enqueue_for_fastapi(message_json, subscriber_ids)
+                    logger.debug("[MONITORING_BROADCAST] Queued message for FastAPI subscribers: %s", subscriber_ids)
                     
                     if fastapi_success_count > 0:
                         logger.info(f"[MONITORING_BROADCAST] Successfully broadcasted to {fastapi_success_count}/{fastapi_client_count} FastAPI subscribers")
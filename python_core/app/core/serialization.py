@@ -0,0 +1,41 @@
+import json
+from typing import Any, Union
+
+# orjson 사용 가능 여부 확인 (없으면 표준 json으로 대체)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for NumPy arrays/scalars when orjson is not installed."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+
+def dumps_text(obj: Any) -> str:
+    """Serialize obj to a JSON str (for APIs that send text frames)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode('utf-8')
+    return json.dumps(obj, default=_json_default)
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Deserialize JSON from str or bytes (orjson.JSONDecodeError subclasses json.JSONDecodeError)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
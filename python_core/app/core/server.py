@@ -2,30 +2,38 @@ import asyncio
 import json
 import logging
 import websockets
+from websockets.protocol import State
+from websockets.extensions.permessage_deflate import ServerPerMessageDeflateFactory
 import time # For timestamping batched data
-from typing import Set, Dict, Any, Optional, List, Callable
+from typing import Set, Dict, Any, Optional, List, Callable, Awaitable, Tuple, Union
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum, auto
 from datetime import datetime
-from app.core.device import DeviceManager, DeviceStatus
+from app.core.device import DeviceManager, DeviceStatus, EEG_SAMPLE_RATE, PPG_SAMPLE_RATE, ACC_SAMPLE_RATE
 from app.core.device_registry import DeviceRegistry
 from bleak import BleakScanner
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uuid
+import weakref
 from app.core.utils import ensure_port_available
 from app.data.data_recorder import DataRecorder
 from app.core.signal_processing import SignalProcessor
 from app.core.error_handler import ErrorHandler, ErrorType, ErrorSeverity, global_error_handler
 from app.core.data_stream_manager import DataStreamManager
+import os
 import socket
 import platform
+import numpy as np
 from .buffer_manager import BufferManager, global_buffer_manager
 from .batch_processor import BatchProcessor, global_batch_processor
 from .performance_monitor import PerformanceMonitor, global_performance_monitor
 from .streaming_optimizer import StreamingOptimizer, global_streaming_optimizer, StreamPriority
 from .monitoring_service import global_monitoring_service
 from .streaming_monitor import StreamingMonitor
+from .serialization import dumps as json_dumps, dumps_text as json_dumps_text, loads as json_loads
 
 # Link Band SDK 통합 로깅 사용
 from .logging_config import (
@@ -35,9 +43,63 @@ from .logging_config import (
 
 logger = get_websocket_logger(__name__)
 
+# numba 사용 가능 여부 확인 (없으면 NumPy 구현 사용)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # 전역 변수 (좋은 방법은 아니지만 테스트 목적)
 _current_server_instance = None
 
+# 스트림 로그 주기 (초)
+STREAM_LOG_INTERVAL = 1.0
+RATE_LOG_INTERVAL = 5
+RATE_WINDOW_SIZE = 60
+# 센서별 스트림 전송 주기 (초): EEG 25Hz, PPG 50Hz, ACC ~30Hz
+STREAM_SEND_INTERVALS = {'eeg': 0.04, 'ppg': 0.02, 'acc': 0.033}
+# 연결은 되었지만 실측 레이트가 아직 없을 때 get_device_status가 보고하는 기대 샘플링 레이트 (Hz)
+EXPECTED_SAMPLING_RATES = {'eeg': 250.0, 'ppg': 50.0, 'acc': 30.0, 'bat': 1.0}
+# 버퍼가 계속 비어 있을 때 전송 주기를 지수적으로 늘리는 상한 (초) - 데이터가 들어오면 기본 주기로 복귀
+STREAM_IDLE_MAX_INTERVAL = 0.5
+# 패킷 도착 지터로 생기는 간헐적 빈 틱에는 backoff하지 않도록, 이 횟수만큼 연속으로 비어야 backoff 시작
+STREAM_IDLE_BACKOFF_AFTER = 5
+# 센서 스트림 드라이버가 한 번 깨어났을 때 함께 처리할 센서의 도래 시각 허용 범위 (초)
+STREAM_COALESCE_WINDOW = 0.01
+# 센서 데이터가 이 시간(초) 동안 없으면 해당 센서 스트림 종료
+SENSOR_NO_DATA_TIMEOUT = 5.0
+# 레이트 윈도우 최대 샘플 수 (정격 샘플링 레이트 기준 2배 여유, 버스트 시에도 메모리 상한 유지)
+RATE_WINDOW_MAX_SAMPLES = {
+    'eeg': RATE_WINDOW_SIZE * EEG_SAMPLE_RATE * 2,
+    'ppg': RATE_WINDOW_SIZE * PPG_SAMPLE_RATE * 2,
+    'acc': RATE_WINDOW_SIZE * ACC_SAMPLE_RATE * 2,
+    'bat': RATE_WINDOW_SIZE * 20,
+}
+
+# 닫힌 클라이언트 연결 정리 주기 (초)
+CLIENT_REAP_INTERVAL = 5.0
+
+# FastAPI 클라이언트별 송신 큐 크기 (가득 차면 가장 오래된 메시지부터 버림)
+CLIENT_SEND_QUEUE_SIZE = 256
+# 독립 WebSocket 연결의 송신 버퍼 상한 (바이트) - 넘으면 느린 연결에는 브로드캐스트 프레임을 버림
+CLIENT_MAX_WRITE_BUFFER = 256 * 1024
+# "multi" 프레임 하나에 합칠 최대 메시지 수 (multi 기능을 요청한 클라이언트에만 적용)
+MULTI_FRAME_MAX_ITEMS = 64
+# 디바이스 콜백 데이터 송신 큐 크기와 한 번에 묶어 보낼 최대 메시지 수
+PROCESSED_QUEUE_SIZE = 1024
+PROCESSED_BATCH_MAX_ITEMS = 128
+# 독립 WebSocket 서버의 permessage-deflate 사용 여부 (기본 비활성화: 로컬 연결에서는 압축 CPU 비용이 더 큼)
+# 원격 클라이언트 등 대역폭이 제한된 환경에서는 LINKBAND_WS_COMPRESSION=1로 활성화
+WS_COMPRESSION_ENABLED = os.getenv('LINKBAND_WS_COMPRESSION', '').lower() in ('1', 'true', 'deflate')
+# 압축 시 연결별 zlib 메모리를 줄이기 위한 설정 (window 2KB, memLevel 4)
+WS_COMPRESSION_WINDOW_BITS = 11
+WS_COMPRESSION_MEM_LEVEL = 4
+# 상태 변경 알림이 없을 때 주기적 상태 업데이트(블루투스 상태 확인 포함) 간격 (초)
+STATUS_POLL_INTERVAL = 10.0
+# handle_data에서 누락된 센서 키의 기본값 (매 패킷마다 빈 리스트를 만들지 않도록)
+_EMPTY = ()
+
 class EventType(Enum):
     DEVICE_DISCONNECTED = "device_disconnected"
     ERROR = "error"
@@ -55,6 +117,165 @@ class EventType(Enum):
     DATA_RECEIVED = "data_received"
     STATUS = "status"
 
+# 이벤트 메시지의 고정 부분 ({"type":"event","event_type":"...","data":) 을 미리 인코딩
+_EVENT_PREFIX: Dict[EventType, bytes] = {
+    et: b'{"type":"event","event_type":' + json_dumps(et.value) + b',"data":' for et in EventType
+}
+
+def _event_frame(event_type: EventType, data: Dict[str, Any]) -> bytes:
+    """Encode an event message as {"type":"event","event_type":...,"data":...}."""
+    return _EVENT_PREFIX[event_type] + json_dumps(data) + b'}'
+
+# 블루투스 상태 이벤트는 값이 두 가지뿐이므로 미리 인코딩
+_BLUETOOTH_STATUS_FRAMES: Dict[bool, bytes] = {
+    available: _event_frame(EventType.BLUETOOTH_STATUS, {
+        "available": available,
+        "message": "Bluetooth is available" if available else "Bluetooth is turned off"
+    })
+    for available in (True, False)
+}
+
+# DATA_RECEIVED 이벤트의 {"type":"<data_type>","data": 부분을 data_type별로 한 번만 인코딩
+_DATA_RECEIVED_PREFIX: Dict[str, bytes] = {}
+
+# 디바이스 매니저가 클라이언트 형식 그대로 넘겨주는 data_type (추가 래핑 없이 직렬화만 수행)
+_PASSTHROUGH_DATA_TYPES = frozenset(("raw_data_broadcast", "processed_data_broadcast"))
+
+def _data_received_frame(data_type: str, data: Any, timestamp: float) -> bytes:
+    """Encode a DATA_RECEIVED event without building the intermediate {'type','data','timestamp'} dict."""
+    prefix = _DATA_RECEIVED_PREFIX.get(data_type)
+    if prefix is None:
+        prefix = _DATA_RECEIVED_PREFIX[data_type] = (
+            _EVENT_PREFIX[EventType.DATA_RECEIVED] + b'{"type":' + json_dumps(data_type) + b',"data":'
+        )
+    return prefix + json_dumps(data) + b',"timestamp":' + json_dumps(timestamp) + b'}}'
+
+# 알려진 센서 타입의 prefix는 import 시점에 미리 생성
+for _data_type in ("eeg", "ppg", "acc", "battery"):
+    _data_received_frame(_data_type, None, 0.0)
+del _data_type
+
+def _stream_frame_prefix(kind: str, sensor: str, device_id: str) -> bytes:
+    """Pre-encode the fixed part of a stream message up to its "timestamp" value.
+
+    {"type":"<kind>_data","sensor_type":...,"device_id":...,"timestamp":<ts>,"data":<data>} 에서
+    스트림 태스크 동안 바뀌지 않는 앞부분을 한 번만 인코딩한다.
+    """
+    return (b'{"type":' + json_dumps(f"{kind}_data") + b',"sensor_type":' + json_dumps(sensor)
+            + b',"device_id":' + json_dumps(device_id) + b',"timestamp":')
+
+def _broadcast_frame(connections, data: bytes, binary: bool = False) -> None:
+    """Write one encoded frame to every open connection's send buffer (websockets.broadcast와 같은 방식).
+
+    websockets.broadcast는 송신 버퍼가 아무리 쌓여도 계속 기록하므로, 버퍼가 CLIENT_MAX_WRITE_BUFFER를
+    넘은 느린 연결에는 이 프레임을 버려 연결별 메모리를 제한하고 다른 클라이언트에 영향이 없도록 한다.
+    """
+    for connection in connections:
+        if connection.protocol.state is not State.OPEN or connection.fragmented_send_waiter is not None:
+            continue
+        transport = connection.transport
+        if transport is not None and transport.get_write_buffer_size() > CLIENT_MAX_WRITE_BUFFER:
+            logger.debug("Dropping broadcast frame for slow client %s", connection.remote_address)
+            continue
+        try:
+            if binary:
+                connection.protocol.send_binary(data)
+            else:
+                connection.protocol.send_text(data)
+            connection.send_data()
+        except Exception as e:
+            connection.logger.warning("skipped broadcast: failed to write message: %s", e)
+
+def _broadcast_text(connections, data: bytes) -> None:
+    """Send already UTF-8 encoded JSON to every open connection as a text frame.
+
+    websockets.broadcast는 str만 text 프레임으로 보내므로, orjson bytes를 str로 디코딩했다가
+    다시 인코딩하지 않도록 bytes를 그대로 text 프레임으로 보낸다.
+    """
+    _broadcast_frame(connections, data)
+
+def _raw_binary_frame(message_data: Dict[str, Any]) -> Optional[bytes]:
+    """Pack a raw_data message into a binary frame for clients that opted in with {"binary": true}.
+
+    레이아웃: JSON 헤더 + b'\\x00' + float64 timestamps (count개) + float32 값 (count x len(fields), 행 우선).
+    헤더는 {"type","sensor_type","timestamp","count","fields"} 이며 timestamp 외의 샘플 키가 fields 순서로 들어간다.
+    샘플 timestamp는 float32로는 정밀도가 부족하므로 float64로 보낸다.
+    """
+    samples = message_data.get("data")
+    if not samples or not isinstance(samples, list) or not isinstance(samples[0], dict):
+        return None
+    fields = [key for key in samples[0] if key != "timestamp"]
+    count = len(samples)
+    timestamps = np.fromiter((sample["timestamp"] for sample in samples), dtype=np.float64, count=count)
+    values = np.array([[sample[field] for field in fields] for sample in samples], dtype=np.float32)
+    header = json_dumps({
+        "type": message_data.get("type"),
+        "sensor_type": message_data.get("sensor_type"),
+        "timestamp": message_data.get("timestamp"),
+        "count": count,
+        "fields": fields,
+    })
+    return b''.join((header, b'\x00', timestamps.tobytes(), values.tobytes()))
+
+# 브로드캐스트 시 주기적 상태 업데이트를 즉시 깨우는 이벤트 (연결/스트리밍/등록 상태 변경)
+_STATUS_CHANGING_EVENTS = frozenset((
+    EventType.DEVICE_CONNECTED,
+    EventType.DEVICE_DISCONNECTED,
+    EventType.STREAM_STARTED,
+    EventType.STREAM_STOPPED,
+    EventType.REGISTERED_DEVICES,
+))
+
+# status 메시지 템플릿 (동적 필드만 % 포맷팅, stream_engine_status는 미리 직렬화한 JSON)
+_STATUS_TEMPLATE = (
+    '{"type":"status","timestamp":%r,"data":{"connected_devices":%d,'
+    '"connected_clients":%d,"stream_engine_status":%s}}'
+)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _interval_stats(timestamps):
+        """Mean and standard deviation of consecutive timestamp intervals."""
+        n = timestamps.shape[0] - 1
+        mean = (timestamps[n] - timestamps[0]) / n
+        var = 0.0
+        for i in range(n):
+            d = timestamps[i + 1] - timestamps[i] - mean
+            var += d * d
+        return mean, (var / n) ** 0.5
+else:
+    def _interval_stats(timestamps):
+        """Mean and standard deviation of consecutive timestamp intervals."""
+        intervals = np.diff(timestamps)
+        return float(intervals.mean()), float(intervals.std())
+
+@dataclass(slots=True)
+class AttemptInfo:
+    """자동 연결 시도 기록 (시각은 time.monotonic 기준)"""
+    count: int = 0
+    last_attempt: float = float('-inf')
+
+@dataclass(slots=True)
+class SensorStream:
+    """센서 스트림 드라이버의 센서별 상태 (시각은 이벤트 루프의 monotonic 시간 기준)"""
+    sensor: str
+    label: str
+    send_interval: float
+    counters: Dict[str, Any]
+    raw_record_type: str
+    processed_record_type: str
+    raw_prefix: bytes
+    processed_prefix: bytes
+    windows_debug: bool
+    next_due: float
+    last_data_tick: float
+    consecutive_no_data: int = 0
+
+@dataclass(slots=True)
+class SensorStats:
+    """센서별 실측 샘플링 레이트 (_update_sampling_rate가 갱신)"""
+    samples_per_sec: float = 0.0
+
 class WebSocketServer:
     def __init__(self, 
                  host: str = "127.0.0.1",  # localhost 대신 명시적으로 127.0.0.1 사용 (Windows 호환성)
@@ -66,12 +287,15 @@ class WebSocketServer:
         self.host = host
         self.port = port
         self.clients: Set[websockets.WebSocketServerProtocol] = set()
+        # remote_address -> 연결 (같은 주소의 이전 연결을 O(1)로 찾기 위함, handle_client에서만 갱신)
+        self._clients_by_addr: Dict[Tuple[str, int], websockets.WebSocketServerProtocol] = {}
+        # 전송 실패로 표시된 클라이언트 (_reap_dead_clients에서 일괄 정리)
+        self._dead_clients: Set[websockets.WebSocketServerProtocol] = set()
         self.is_streaming = False
         self.server: Optional[websockets.WebSocketServer] = None
+        # EEG/PPG/ACC는 하나의 드라이버 태스크('sensors'), 배터리는 별도 태스크
         self.stream_tasks: Dict[str, Optional[asyncio.Task]] = {
-            'eeg': None,
-            'ppg': None,
-            'acc': None,
+            'sensors': None,
             'battery': None
         }
         # 클라이언트별 채널 구독 정보
@@ -80,6 +304,7 @@ class WebSocketServer:
         self.device_registry = device_registry
         self.auto_connect_task: Optional[asyncio.Task] = None
         self.periodic_task: Optional[asyncio.Task] = None  # 주기적 상태 업데이트 태스크
+        self.reaper_task: Optional[asyncio.Task] = None  # 닫힌 클라이언트 정리 태스크
         
         # 에러 핸들링 및 스트림 관리 시스템 추가
         self.error_handler = global_error_handler
@@ -91,20 +316,64 @@ class WebSocketServer:
             'bat': {'samples_per_sec': 0},
             'bat_level': 0
         }
-        self.device_sampling_stats = {
-            'eeg': {'samples_per_sec': 0},
-            'ppg': {'samples_per_sec': 0},
-            'acc': {'samples_per_sec': 0},
-            'bat': {'samples_per_sec': 0},
-            'bat_level': 0
+        self.device_sampling_stats: Dict[str, SensorStats] = {
+            sensor: SensorStats() for sensor in ('eeg', 'ppg', 'acc', 'bat')
+        }
+        self.bat_level = 0  # 배터리 스트림이 마지막으로 브로드캐스트한 레벨
+        # 스트림 루프는 카운터만 증가시키고, 로그 출력은 call_later 타이머에서 처리
+        self.stream_log_counters: Dict[str, Dict[str, Any]] = {
+            sensor: {'total': 0, 'since_last_log': 0, 'raw_len': 0, 'processed_len': 0, 'level': None}
+            for sensor in ('eeg', 'ppg', 'acc', 'bat')
+        }
+        # 센서별 최근 RATE_WINDOW_SIZE초 샘플 타임스탬프 (_update_sampling_rate가 관리)
+        self._rate_windows: Dict[str, deque] = {
+            sensor: deque(maxlen=RATE_WINDOW_MAX_SAMPLES[sensor]) for sensor in ('eeg', 'ppg', 'acc', 'bat')
+        }
+        self._stream_log_handles: Dict[str, asyncio.TimerHandle] = {}
+        # 배터리 스트림 메시지 템플릿 - 매 틱 dict를 새로 만들지 않고 timestamp/data만 갱신
+        # (EEG/PPG/ACC는 _stream_frame_prefix로 고정 부분을 미리 인코딩)
+        self._msg_templates: Dict[str, Dict[str, Any]] = {}
+        self._msg_templates['bat'] = {
+            "type": "sensor_data", "sensor_type": "bat", "device_id": None, "timestamp": 0, "data": None
         }
         self.connected_clients: Dict[str, WebSocket] = {}
-        self.event_callbacks: Dict[str, List[Callable]] = {
-            EventType.DEVICE_CONNECTED.value: [],
-            EventType.DEVICE_DISCONNECTED.value: [],
-            EventType.DATA_RECEIVED.value: [],
-            EventType.ERROR.value: [],
-            EventType.STATUS.value: []
+        # FastAPI 클라이언트별 송신 큐와 writer 태스크 (connected_clients와 같은 client_id 키)
+        self._client_queues: Dict[str, asyncio.Queue] = {}
+        self._client_writers: Dict[str, asyncio.Task] = {}
+        # {"type":"capabilities","multi":true}로 묶음 프레임 수신을 요청한 클라이언트
+        self._multi_frame_clients: Set[str] = set()
+        # 독립 WebSocket 서버에서 multi 프레임을 요청한 연결 (연결이 사라지면 자동 제거)
+        self._multi_frame_ws = weakref.WeakSet()
+        # {"type":"capabilities","binary":true}로 raw 센서 데이터를 binary 프레임으로 받기로 한 연결
+        self._binary_frame_ws = weakref.WeakSet()
+        # 디바이스 콜백 데이터는 큐에 쌓고 drain 태스크가 준비된 것을 한 번에 전송
+        self._processed_queue: asyncio.Queue = asyncio.Queue(maxsize=PROCESSED_QUEUE_SIZE)
+        self.processed_drain_task: Optional[asyncio.Task] = None
+        # 주기적 상태 브로드캐스트: 내용이 이전과 같으면 직렬화된 프레임을 재사용
+        self._last_status_data: Optional[Dict[str, Any]] = None
+        self._last_status_frame: Optional[bytes] = None
+        # 상태가 바뀌면 set되어 _periodic_status_update가 다음 주기를 기다리지 않고 바로 전송
+        self._status_dirty = asyncio.Event()
+        # command 이름 -> 핸들러 (handle_client_message에서 dict 조회로 디스패치)
+        self._cmd_handlers: Dict[str, Callable[[Any, Dict[str, Any]], Awaitable[None]]] = {
+            "check_device_connection": self._cmd_check_device_connection,
+            "check_bluetooth_status": self._cmd_check_bluetooth_status,
+            "scan_devices": self._cmd_scan_devices,
+            "connect_device": self._cmd_connect_device,
+            "disconnect_device": self._cmd_disconnect_device,
+            "start_streaming": self._cmd_start_streaming,
+            "stop_streaming": self._cmd_stop_streaming,
+            "get_device_status": self._cmd_get_device_status,
+            "get_stream_status": self._cmd_get_stream_status,
+            "health_check": self._cmd_health_check,
+        }
+        # 콜백은 변경 시마다 새 튜플로 교체 (순회 중 변경되어도 안전하도록 copy-on-write)
+        self.event_callbacks: Dict[str, Tuple[Callable, ...]] = {
+            EventType.DEVICE_CONNECTED.value: (),
+            EventType.DEVICE_DISCONNECTED.value: (),
+            EventType.DATA_RECEIVED.value: (),
+            EventType.ERROR.value: (),
+            EventType.STATUS.value: ()
         }
         # Ensure device_manager is available before adding callback
         if self.device_manager:
@@ -115,8 +384,6 @@ class WebSocketServer:
         self.data_recorder = data_recorder
         self.loop = None
         self.server_task = None
-        self.acc_timestamps: Dict[str, List[float]] = {}
-        self.ecg_timestamps: Dict[str, List[float]] = {}
         self.server_initialized = False
         
         # 모니터링 서비스 통합
@@ -148,10 +415,28 @@ class WebSocketServer:
         logger.info("WebSocket connections will now be accepted")
         logger.info("========================================")
 
+    def _start_processed_drain(self):
+        """Start the task that forwards queued device callback payloads (no-op if already running)."""
+        if self.processed_drain_task is None or self.processed_drain_task.done():
+            self.processed_drain_task = asyncio.create_task(self._drain_processed_data())
+
+    def _stop_processed_drain(self):
+        """Cancel the device callback drain task (대기 중인 payload는 버림)."""
+        if self.processed_drain_task is not None:
+            self.processed_drain_task.cancel()
+            self.processed_drain_task = None
+
     async def initialize(self):
         """Initialize the WebSocket server."""
         logger.info("Initializing WebSocket server...")
 
+        if NUMBA_AVAILABLE:
+            # 첫 샘플링 레이트 로그에서 JIT 컴파일이 일어나지 않도록 미리 한 번 호출
+            _interval_stats(np.zeros(2, dtype=np.float64))
+
+        # 디바이스 콜백 데이터 drain 태스크는 FastAPI 전용 모드(port=None)에서도 필요하므로 포트 확인 전에 시작
+        self._start_processed_drain()
+
         # If port is None, we're using FastAPI WebSocket endpoints only
         if self.port is None:
             logger.info("Port is None, skipping standalone WebSocket server initialization")
@@ -180,14 +465,7 @@ class WebSocketServer:
             self.auto_connect_task = None
 
         # Cancel all streaming tasks
-        for sensor_type, task in self.stream_tasks.items():
-            if task:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-                self.stream_tasks[sensor_type] = None
+        await self._cancel_stream_tasks()
 
         # Clear all clients
         for client in list(self.clients):
@@ -224,6 +502,16 @@ class WebSocketServer:
                 'compression': None,       # 압축 비활성화 (안정성 향상)
                 'family': socket.AF_INET   # IPv4 강제 사용 (IPv6 연결 방지)
             }
+            if WS_COMPRESSION_ENABLED:
+                # 숫자 배열 JSON은 압축률이 높으므로 원격 연결에서는 전송량을 크게 줄일 수 있음
+                server_kwargs['extensions'] = [
+                    ServerPerMessageDeflateFactory(
+                        server_max_window_bits=WS_COMPRESSION_WINDOW_BITS,
+                        client_max_window_bits=WS_COMPRESSION_WINDOW_BITS,
+                        compress_settings={"memLevel": WS_COMPRESSION_MEM_LEVEL},
+                    )
+                ]
+                logger.info("[WEBSOCKET_SERVER_DEBUG] permessage-deflate enabled for standalone WebSocket server")
             
             # 플랫폼별 추가 설정
             if platform.system() == 'Windows':
@@ -248,6 +536,10 @@ class WebSocketServer:
             # Start periodic status update
             logger.info(f"[WEBSOCKET_SERVER_DEBUG] Starting periodic status update task")
             self.periodic_task = asyncio.create_task(self._periodic_status_update())
+
+            # broadcast는 전송 실패를 알려주지 않으므로 닫힌 연결은 별도 태스크에서 정리
+            if self.reaper_task is None or self.reaper_task.done():
+                self.reaper_task = asyncio.create_task(self._reap_dead_clients())
             
             logger.info(f"[WEBSOCKET_SERVER_DEBUG] WebSocket server initialized on {self.host}:{self.port}")
             logger.info(f"[WEBSOCKET_SERVER_DEBUG] Server object: {self.server}")
@@ -264,14 +556,18 @@ class WebSocketServer:
         """주기적으로 모든 클라이언트에게 상태를 업데이트합니다."""
         logger.info("[PERIODIC_DEBUG] Starting periodic status updates")
         try:
+            status_changed = False
             while True:
                 try:
                     if len(self.clients) > 0:
                         logger.info(f"[PERIODIC_DEBUG] Sending periodic updates to {len(self.clients)} clients")
+                        # 블루투스 상태와 디바이스 상태를 같은 틱에 함께 전송 (multi 클라이언트는 한 프레임)
+                        frames = []
                         
-                        # Check Bluetooth status
-                        is_bluetooth_available = await self._check_bluetooth_status()
-                        await self._broadcast_bluetooth_status(is_bluetooth_available)
+                        # Check Bluetooth status (상태 변경으로 깨어난 경우에는 주기 확인까지 생략)
+                        if not status_changed:
+                            is_bluetooth_available = await self._check_bluetooth_status()
+                            frames.append(_BLUETOOTH_STATUS_FRAMES[bool(is_bluetooth_available)])
                         
                         # Send device status
                         is_connected = self.device_manager.is_connected()
@@ -291,7 +587,11 @@ class WebSocketServer:
                             "clients_connected": len(self.clients),
                             "battery": battery_data[-1] if battery_data else None
                         }
-                        await self.broadcast_event(EventType.DEVICE_INFO, status_data)
+                        if status_data != self._last_status_data:
+                            self._last_status_data = status_data
+                            self._last_status_frame = _event_frame(EventType.DEVICE_INFO, status_data)
+                        frames.append(self._last_status_frame)
+                        self._broadcast_frames(frames)
                     else:
                         logger.debug("[PERIODIC_DEBUG] No clients connected, skipping periodic update")
                         
@@ -301,7 +601,13 @@ class WebSocketServer:
                 except Exception as e:
                     logger.error(f"[PERIODIC_DEBUG] Error in periodic status update: {e}", exc_info=True)
                 
-                await asyncio.sleep(10)  # 10초마다 체크
+                # 상태 변경 알림이 오면 바로, 아니면 STATUS_POLL_INTERVAL마다 체크
+                try:
+                    await asyncio.wait_for(self._status_dirty.wait(), timeout=STATUS_POLL_INTERVAL)
+                    status_changed = True
+                except asyncio.TimeoutError:
+                    status_changed = False
+                self._status_dirty.clear()
         except asyncio.CancelledError:
             logger.info("[PERIODIC_DEBUG] Periodic status update task cancelled during shutdown")
         except Exception as e:
@@ -326,7 +632,7 @@ class WebSocketServer:
                     "message": "Server is still initializing, please wait...",
                     "retry_after": 5
                 }
-                await websocket.send(json.dumps(wait_message))
+                await websocket.send(json_dumps_text(wait_message))
                 logger.info(f"[CONNECTION_DEBUG] Sent initialization message to {client_address}")
             except Exception as e:
                 logger.error(f"[CONNECTION_DEBUG] Failed to send wait message to {client_address}: {e}")
@@ -348,7 +654,7 @@ class WebSocketServer:
                             "message": f"Server initialization in progress... ({waited:.0f}s elapsed)",
                             "retry_after": 5
                         }
-                        await websocket.send(json.dumps(update_message))
+                        await websocket.send(json_dumps_text(update_message))
                         logger.info(f"[CONNECTION_DEBUG] Sent update message to {client_address} ({waited:.0f}s elapsed)")
                     except Exception as e:
                         logger.error(f"[CONNECTION_DEBUG] Failed to send update message: {e}")
@@ -363,7 +669,7 @@ class WebSocketServer:
                         "message": "Server initialization timeout",
                         "retry_after": 30
                     }
-                    await websocket.send(json.dumps(error_message))
+                    await websocket.send(json_dumps_text(error_message))
                     await asyncio.sleep(1)  # Give time for message to be sent
                 except Exception:
                     pass
@@ -378,24 +684,26 @@ class WebSocketServer:
                         "status": "ready", 
                         "message": "Server is now ready for connections"
                     }
-                    await websocket.send(json.dumps(ready_message))
+                    await websocket.send(json_dumps_text(ready_message))
                     logger.info(f"[CONNECTION_DEBUG] Sent ready message to {client_address}")
                 except Exception as e:
                     logger.error(f"[CONNECTION_DEBUG] Failed to send ready message: {e}")
 
         # 같은 주소의 이전 연결을 제거
-        for client in list(self.clients):
-            if client.remote_address == websocket.remote_address:
-                try:
-                    await client.close(1000, "New connection from same address")
-                    self.clients.remove(client)
-                    logger.info(f"Removed existing connection from {client.remote_address}")
-                except Exception as e:
-                    logger.error(f"Error closing existing connection: {e}")
+        previous = self._clients_by_addr.get(client_address)
+        if previous is not None and previous in self.clients:
+            self.clients.discard(previous)
+            try:
+                await previous.close(1000, "New connection from same address")
+                logger.info(f"Removed existing connection from {client_address}")
+            except Exception as e:
+                logger.error(f"Error closing existing connection: {e}")
 
         try:
             # 새 연결 추가
             self.clients.add(websocket)
+            self._clients_by_addr[client_address] = websocket
+            self._status_dirty.set()
             logger.info(f"[CONNECTION_DEBUG] Client connected from {client_address}. Total clients: {len(self.clients)}")
             logger.info(f"[CONNECTION_DEBUG] WebSocket state: {getattr(websocket, 'state', 'unknown')}")
 
@@ -421,23 +729,13 @@ class WebSocketServer:
                     try:
                         # Use recv() with timeout to handle messages
                         message = await asyncio.wait_for(websocket.recv(), timeout=1.0)
-                        print(f"[WEBSOCKET_MESSAGE_DEBUG] Raw message received from {client_address}: {message}")
-                        print(f"[WEBSOCKET_MESSAGE_DEBUG] Message type: {type(message)}")
-                        print(f"[WEBSOCKET_MESSAGE_DEBUG] Message length: {len(message) if hasattr(message, '__len__') else 'N/A'}")
-                        logger.info(f"[MESSAGE_LOOP_DEBUG] Raw message received from {client_address}: {message}")
-                        logger.info(f"[MESSAGE_LOOP_DEBUG] Message type: {type(message)}")
-                        logger.info(f"[MESSAGE_LOOP_DEBUG] Message length: {len(message) if hasattr(message, '__len__') else 'N/A'}")
-                        
-                        # Handle both text and binary messages
-                        if isinstance(message, bytes):
-                            logger.info(f"[MESSAGE_LOOP_DEBUG] Converting bytes message to string")
-                            message = message.decode('utf-8')
-                            logger.info(f"[MESSAGE_LOOP_DEBUG] Decoded message: {message}")
+                        # 매 프레임마다 실행되므로 lazy %-포맷 DEBUG 로그 하나만 남김
+                        logger.debug("[MESSAGE_LOOP_DEBUG] Message received from %s (%s, len=%d)",
+                                     client_address, type(message).__name__, len(message))
                         
+                        # text(str)와 binary(bytes) 프레임 모두 디코딩 없이 그대로 전달 (handle_client_message에서 처리)
                         try:
-                            logger.info(f"[MESSAGE_LOOP_DEBUG] About to call handle_client_message for {client_address}")
                             await self.handle_client_message(websocket, message)
-                            logger.info(f"[MESSAGE_LOOP_DEBUG] handle_client_message completed successfully for {client_address}")
                         except Exception as e:
                             logger.error(f"[MESSAGE_LOOP_DEBUG] Error handling message from {client_address}: {e}")
                             logger.error(f"[MESSAGE_LOOP_DEBUG] Exception type: {type(e)}")
@@ -471,6 +769,9 @@ class WebSocketServer:
         except Exception as e:
             logger.error(f"Error handling client {client_address}: {e}", exc_info=True)
         finally:
+            # 같은 주소로 새 연결이 이미 등록된 경우에는 그 항목을 유지
+            if self._clients_by_addr.get(client_address) is websocket:
+                del self._clients_by_addr[client_address]
             if websocket in self.clients:
                 self.clients.remove(websocket)
                 try:
@@ -561,10 +862,11 @@ class WebSocketServer:
         """Stop the WebSocket server."""
         # Remove callback before stopping
         self.device_manager.remove_processed_data_callback(self._handle_processed_data)
+        self._stop_processed_drain()
         
         # Cleanup connections
         for client_id in list(self.connected_clients.keys()):
-            await self.handle_client_disconnect(client_id)
+            self.handle_client_disconnect(client_id)
         
         # Stop stream engine
         if hasattr(self, 'stream_engine'):
@@ -585,6 +887,12 @@ class WebSocketServer:
             
             if hasattr(self, 'periodic_task') and self.periodic_task:
                 tasks_to_cancel.append(self.periodic_task)
+
+            if self.reaper_task:
+                tasks_to_cancel.append(self.reaper_task)
+
+            if self.processed_drain_task:
+                tasks_to_cancel.append(self.processed_drain_task)
             
             # Cancel all background tasks
             for task in tasks_to_cancel:
@@ -628,7 +936,7 @@ class WebSocketServer:
             # 4. Cleanup connected_clients dict
             if hasattr(self, 'connected_clients'):
                 for client_id in list(self.connected_clients.keys()):
-                    await self.handle_client_disconnect(client_id)
+                    self.handle_client_disconnect(client_id)
                 self.connected_clients.clear()
             
             # 5. Stop the WebSocket server
@@ -711,13 +1019,14 @@ class WebSocketServer:
         """Periodically check and connect to registered devices"""
         device_logger = get_device_logger("auto_connect")
         device_logger.info(f"[{LogTags.AUTO_CONNECT}:{LogTags.START}] Auto-connect loop started")
-        connection_attempts = {}  # 각 디바이스별 연결 시도 횟수 추적
-        last_scan_time = 0
+        connection_attempts: Dict[str, AttemptInfo] = {}  # 각 디바이스별 연결 시도 횟수 추적
+        # 간격 계산은 시스템 시계 변경에 영향받지 않도록 monotonic 시계 사용
+        last_scan_time = float('-inf')
         scan_interval = 30  # 30초마다 스캔
         
         while True:
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
                 
                 # 연결된 디바이스가 없으면 등록된 디바이스 중 하나를 연결
                 if not self.device_manager.is_connected():
@@ -735,6 +1044,21 @@ class WebSocketServer:
                         
                         # 스캔된 디바이스들 가져오기
                         scanned_devices = getattr(self.device_manager, '_cached_devices', [])
+                        # 이름 -> 현재 플랫폼 주소 (같은 이름이 여러 개면 처음 스캔된 것 사용)
+                        scanned_by_name = {}
+                        for scanned_device in scanned_devices:
+                            scanned_by_name.setdefault(
+                                getattr(scanned_device, 'name', None) or 'Unknown',
+                                getattr(scanned_device, 'address', None)
+                            )
+                        scanned_addresses = set(scanned_by_name.values())
+
+                        # DeviceManager는 BLE 클라이언트를 하나만 가지므로 connect는 순차로 시도하되,
+                        # 최근 스캔에서 발견된 디바이스를 먼저 시도해 없는 디바이스의 연결 타임아웃을 기다리지 않음
+                        registered_devices = sorted(
+                            registered_devices,
+                            key=lambda d: not (d.get('address') in scanned_addresses or d.get('name', '') in scanned_by_name)
+                        )
                         
                         for device in registered_devices:
                             address = device.get('address')
@@ -744,51 +1068,42 @@ class WebSocketServer:
                                 continue
                             
                             # 연결 시도 횟수 제한 (3번 실패 후 60초 대기)
-                            if address not in connection_attempts:
-                                connection_attempts[address] = {'count': 0, 'last_attempt': 0}
-                            
-                            attempt_info = connection_attempts[address]
+                            attempt_info = connection_attempts.get(address)
+                            if attempt_info is None:
+                                attempt_info = connection_attempts[address] = AttemptInfo()
                             
                             # 3번 연속 실패 후 60초 대기
-                            if attempt_info['count'] >= 3:
-                                if current_time - attempt_info['last_attempt'] < 60:
+                            if attempt_info.count >= 3:
+                                if current_time - attempt_info.last_attempt < 60:
                                     continue  # 아직 대기 시간
                                 else:
-                                    attempt_info['count'] = 0  # 대기 시간 끝, 재시도
+                                    attempt_info.count = 0  # 대기 시간 끝, 재시도
                             
                             # 마지막 시도로부터 최소 15초 간격 유지
-                            if current_time - attempt_info['last_attempt'] < 15:
+                            if current_time - attempt_info.last_attempt < 15:
                                 continue
                             
                             # 크로스 플랫폼 주소 매칭: 이름으로 현재 플랫폼의 주소 찾기
                             target_address = address
-                            if device_name and scanned_devices:
-                                # 스캔된 디바이스 중에서 같은 이름을 가진 디바이스 찾기
-                                for scanned_device in scanned_devices:
-                                    scanned_name = getattr(scanned_device, 'name', None) or 'Unknown'
-                                    scanned_addr = getattr(scanned_device, 'address', None)
-                                    
-                                    # 정확한 이름 매칭만 허용 (등록된 디바이스만 연결)
-                                    if scanned_name == device_name:
-                                        if scanned_addr != address:
-                                            device_logger.info(f"[{LogTags.AUTO_CONNECT}] Cross-platform address update: {device_name}", 
-                                                              extra={"registered_addr": address, "current_addr": scanned_addr})
-                                            # 레지스트리의 주소 업데이트
-                                            self.device_registry.update_device_address(address, scanned_addr, device_name)
-                                            target_address = scanned_addr
-                                        else:
-                                            target_address = scanned_addr
-                                        break
+                            # 정확한 이름 매칭만 허용 (등록된 디바이스만 연결)
+                            if device_name and device_name in scanned_by_name:
+                                scanned_addr = scanned_by_name[device_name]
+                                if scanned_addr != address:
+                                    device_logger.info(f"[{LogTags.AUTO_CONNECT}] Cross-platform address update: {device_name}", 
+                                                      extra={"registered_addr": address, "current_addr": scanned_addr})
+                                    # 레지스트리의 주소 업데이트
+                                    self.device_registry.update_device_address(address, scanned_addr, device_name)
+                                target_address = scanned_addr
                             
                             device_logger.info(f"[{LogTags.AUTO_CONNECT}:{LogTags.CONNECT}] Attempting connection", 
                                               extra={
                                                   "address": target_address,
-                                                  "attempt": f"{attempt_info['count'] + 1}/3",
+                                                  "attempt": f"{attempt_info.count + 1}/3",
                                                   "device_name": device_name if target_address != address else None
                                               })
                             
-                            attempt_info['last_attempt'] = current_time
-                            attempt_info['count'] += 1
+                            attempt_info.last_attempt = current_time
+                            attempt_info.count += 1
                             
                             # 캐시된 디바이스 사용해서 연결 시도 (스캔 중복 방지)
                             success = await self.device_manager.connect(target_address, use_cached_device=True)
@@ -799,7 +1114,7 @@ class WebSocketServer:
                                                       "device_name": device_name,
                                                       "connection_type": "auto"
                                                   })
-                                connection_attempts[address]['count'] = 0  # 성공 시 카운터 리셋
+                                attempt_info.count = 0  # 성공 시 카운터 리셋
                                 # 연결 성공 이벤트 브로드캐스트
                                 await self.broadcast_event(EventType.DEVICE_CONNECTED, {
                                     "address": target_address,
@@ -811,7 +1126,7 @@ class WebSocketServer:
                                 device_logger.warning(f"[{LogTags.AUTO_CONNECT}:{LogTags.FAILED}] Auto-connection failed", 
                                                      extra={
                                                          "address": target_address,
-                                                         "attempt": f"{attempt_info['count']}/3"
+                                                         "attempt": f"{attempt_info.count}/3"
                                                      })
                 
                 # 15초마다 체크 (더 긴 간격으로 시스템 부하 감소)
@@ -824,40 +1139,43 @@ class WebSocketServer:
                 device_logger.error(f"[{LogTags.AUTO_CONNECT}:{LogTags.ERROR}] Auto-connect error: {e}", exc_info=True)
                 await asyncio.sleep(15)
 
-    async def handle_client_message(self, websocket: websockets.WebSocketServerProtocol, message: str):
+    async def handle_client_message(self, websocket: websockets.WebSocketServerProtocol, message: Union[str, bytes]):
         """Handle messages from clients"""
         try:
-            logger.info(f"[WEBSOCKET_DEBUG] ===== MESSAGE RECEIVED =====")
-            logger.info(f"[WEBSOCKET_DEBUG] Raw message: {message}")
-            logger.info(f"[WEBSOCKET_DEBUG] Message type: {type(message)}")
-            logger.info(f"[WEBSOCKET_DEBUG] Client address: {websocket.remote_address}")
+            # 매 프레임마다 호출되므로 디버그 로그는 lazy %-포맷 사용 (INFO 레벨에서는 포맷팅 비용 없음)
+            logger.debug("[WEBSOCKET_DEBUG] Message received from %s (%s): %s",
+                         websocket.remote_address, type(message).__name__, message)
             
             # Handle ping/pong first (before JSON parsing)
-            if isinstance(message, str) and message.strip() == "ping":
-                logger.info("[WEBSOCKET_DEBUG] Handling ping, sending pong")
+            if isinstance(message, str):
+                is_ping = message.strip() == "ping"
+            else:
+                is_ping = isinstance(message, (bytes, bytearray)) and message.strip() == b"ping"
+            if is_ping:
+                logger.debug("[WEBSOCKET_DEBUG] Handling ping, sending pong")
                 await websocket.send("pong")
                 return
             
-            # Parse JSON message if it's a string
-            if isinstance(message, str):
+            # Parse JSON message if it's a string (binary 프레임도 디코딩 없이 바로 파싱)
+            if isinstance(message, (str, bytes, bytearray)):
                 try:
-                    data = json.loads(message)
-                    logger.info(f"[WEBSOCKET_DEBUG] Parsed JSON data: {data}")
+                    data = json_loads(message)
+                    logger.debug("[WEBSOCKET_DEBUG] Parsed JSON data: %s", data)
                 except json.JSONDecodeError as e:
                     logger.error(f"[WS_SERVER:ERROR] Invalid JSON string: {message} - Error: {e}")
                     # Send error response to client but don't return - continue processing
                     try:
-                        await websocket.send(json.dumps({
+                        await websocket.send(json_dumps_text({
                             "type": "error",
                             "message": f"Invalid JSON format: {str(e)}",
-                            "original_message": message[:100]  # First 100 chars for debugging
+                            "original_message": str(message[:100])  # First 100 chars for debugging
                         }))
                     except Exception as send_error:
                         logger.error(f"Failed to send JSON error response: {send_error}")
                     return
             else:
                 data = message
-                logger.info(f"[WEBSOCKET_DEBUG] Non-string message data: {data}")
+                logger.debug("[WEBSOCKET_DEBUG] Non-string message data: %s", data)
 
             # Ensure data is a dictionary
             if not isinstance(data, dict):
@@ -866,12 +1184,12 @@ class WebSocketServer:
                 return
 
             message_type = data.get('type')
-            logger.info(f"[WEBSOCKET_DEBUG] Message type extracted: {message_type}")
+            logger.debug("[WEBSOCKET_DEBUG] Message type extracted: %s", message_type)
             
             # Handle heartbeat messages
             if message_type == 'heartbeat':
-                logger.info("[WEBSOCKET_DEBUG] Handling heartbeat, sending heartbeat_response")
-                await websocket.send(json.dumps({
+                logger.debug("[WEBSOCKET_DEBUG] Handling heartbeat, sending heartbeat_response")
+                await websocket.send(json_dumps_text({
                     "type": "heartbeat_response",
                     "timestamp": time.time()
                 }))
@@ -879,8 +1197,8 @@ class WebSocketServer:
             
             # Handle ping messages
             if message_type == 'ping':
-                logger.info("[WEBSOCKET_DEBUG] Handling ping, sending ping_response")
-                await websocket.send(json.dumps({
+                logger.debug("[WEBSOCKET_DEBUG] Handling ping, sending ping_response")
+                await websocket.send(json_dumps_text({
                     "type": "ping_response",
                     "timestamp": time.time(),
                     "original_timestamp": data.get('timestamp')
@@ -889,36 +1207,34 @@ class WebSocketServer:
             
             # Handle subscription messages
             if message_type == 'subscribe':
-                logger.info("[WEBSOCKET_DEBUG] ===== SUBSCRIPTION MESSAGE DETECTED =====")
                 channel = data.get('channel')
-                logger.info(f"[WEBSOCKET_DEBUG] Channel to subscribe: {channel}")
+                logger.debug("[WEBSOCKET_DEBUG] Subscription message, channel: %s", channel)
                 
                 if channel:
                     if websocket not in self.client_subscriptions:
                         self.client_subscriptions[websocket] = set()
-                        logger.info(f"[WEBSOCKET_DEBUG] Created new subscription set for client {websocket.remote_address}")
+                        logger.debug("[WEBSOCKET_DEBUG] Created new subscription set for client %s", websocket.remote_address)
                     
                     self.client_subscriptions[websocket].add(channel)
-                    logger.info(f"[WEBSOCKET_SUBSCRIBE] Client {websocket.remote_address} subscribed to channel: {channel}")
-                    logger.info(f"[WEBSOCKET_SUBSCRIBE] Current subscriptions for this client: {self.client_subscriptions[websocket]}")
-                    logger.info(f"[WEBSOCKET_SUBSCRIBE] Total clients with subscriptions: {len(self.client_subscriptions)}")
+                    logger.info("[WEBSOCKET_SUBSCRIBE] Client %s subscribed to channel: %s", websocket.remote_address, channel)
                     
-                    # 전체 구독 상태 디버깅
-                    logger.info(f"[WEBSOCKET_SUBSCRIBE] === FULL SUBSCRIPTION STATE ===")
-                    logger.info(f"[WEBSOCKET_SUBSCRIBE] Total clients connected: {len(self.clients)}")
-                    logger.info(f"[WEBSOCKET_SUBSCRIBE] Total clients with subscriptions: {len(self.client_subscriptions)}")
-                    for client, channels in self.client_subscriptions.items():
-                        client_addr = getattr(client, 'remote_address', 'unknown')
-                        logger.info(f"[WEBSOCKET_SUBSCRIBE] Client {client_addr}: {channels}")
+                    # 전체 구독 상태 디버깅 (DEBUG 레벨에서만 순회)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[WEBSOCKET_SUBSCRIBE] Current subscriptions for this client: %s", self.client_subscriptions[websocket])
+                        logger.debug("[WEBSOCKET_SUBSCRIBE] Total clients connected: %d, with subscriptions: %d",
+                                     len(self.clients), len(self.client_subscriptions))
+                        for client, channels in self.client_subscriptions.items():
+                            client_addr = getattr(client, 'remote_address', 'unknown')
+                            logger.debug("[WEBSOCKET_SUBSCRIBE] Client %s: %s", client_addr, channels)
                     
                     confirmation_message = {
                         "type": "subscription_confirmed",
                         "channel": channel,
                         "timestamp": time.time()
                     }
-                    logger.info(f"[WEBSOCKET_DEBUG] Sending confirmation: {confirmation_message}")
-                    await websocket.send(json.dumps(confirmation_message))
-                    logger.info(f"[WEBSOCKET_DEBUG] Confirmation sent successfully for channel: {channel}")
+                    logger.debug("[WEBSOCKET_DEBUG] Sending confirmation: %s", confirmation_message)
+                    await websocket.send(json_dumps_text(confirmation_message))
+                    logger.debug("[WEBSOCKET_DEBUG] Confirmation sent successfully for channel: %s", channel)
                 else:
                     logger.warning("[WEBSOCKET_SUBSCRIBE] Subscribe message missing channel")
                     await self.send_error_to_client(websocket, "Subscribe message missing channel")
@@ -926,18 +1242,34 @@ class WebSocketServer:
             
             # Handle unsubscription messages
             if message_type == 'unsubscribe':
-                logger.info("[WEBSOCKET_DEBUG] ===== UNSUBSCRIPTION MESSAGE DETECTED =====")
                 channel = data.get('channel')
                 if channel and websocket in self.client_subscriptions:
                     self.client_subscriptions[websocket].discard(channel)
-                    logger.info(f"[WEBSOCKET_SUBSCRIBE] Client unsubscribed from channel: {channel}")
-                    await websocket.send(json.dumps({
+                    logger.info("[WEBSOCKET_SUBSCRIBE] Client unsubscribed from channel: %s", channel)
+                    await websocket.send(json_dumps_text({
                         "type": "unsubscription_confirmed",
                         "channel": channel,
                         "timestamp": time.time()
                     }))
                 return
-            logger.info(f"[WEBSOCKET_DEBUG] Message type: {message_type}")
+
+            # 클라이언트 수신 기능 설정 (예: {"type": "capabilities", "multi": true})
+            if message_type == 'capabilities':
+                if data.get('multi'):
+                    self._multi_frame_ws.add(websocket)
+                else:
+                    self._multi_frame_ws.discard(websocket)
+                if data.get('binary'):
+                    self._binary_frame_ws.add(websocket)
+                else:
+                    self._binary_frame_ws.discard(websocket)
+                await websocket.send(json_dumps_text({
+                    "type": "capabilities_confirmed",
+                    "multi": websocket in self._multi_frame_ws,
+                    "binary": websocket in self._binary_frame_ws,
+                    "timestamp": time.time()
+                }))
+                return
             if not message_type:
                 logger.warning("Message missing type")
                 await self.send_error_to_client(websocket, "Message missing type")
@@ -946,100 +1278,17 @@ class WebSocketServer:
             if message_type == 'command':
                 command = data.get('command')
                 payload = data.get('payload', {})
-                logger.info(f"[WEBSOCKET_DEBUG] Command: {command}, Payload: {payload}")
                 
                 if not command:
                     logger.warning("Command message missing command")
                     await self.send_error_to_client(websocket, "Command message missing command")
                     return
 
-                # Handle check_device_connection command (maintain client compatibility)
-                if command == "check_device_connection":
-                    logger.info("[WEBSOCKET_DEBUG] Processing check_device_connection command")
-                    try:
-                        # Send simple handshake response for compatibility
-                        response = {
-                            "type": "handshake_response",
-                            "status": "connected",
-                            "message": "WebSocket connection established"
-                        }
-                        await websocket.send(json.dumps(response))
-                        logger.info("[WEBSOCKET_DEBUG] Handshake response sent successfully")
-                    except Exception as e:
-                        logger.error(f"[WEBSOCKET_DEBUG] Error sending handshake response: {e}", exc_info=True)
-                    return
+                logger.info("Processing command: %s with payload: %s", command, payload)
 
-                logger.info(f"Processing command: {command} with payload: {payload}")
-
-                # Command handling logic
-                if command == "check_bluetooth_status":
-                    is_bluetooth_available = await self._check_bluetooth_status()
-                    await self._broadcast_bluetooth_status(is_bluetooth_available)
-                elif command == "scan_devices":
-                    is_bluetooth_available = await self._check_bluetooth_status()
-                    if not is_bluetooth_available:
-                        await self.send_error_to_client(websocket, "Bluetooth is turned off")
-                        return
-                    asyncio.create_task(self._run_scan_and_notify(websocket))
-                elif command == "connect_device":
-                    is_bluetooth_available = await self._check_bluetooth_status()
-                    if not is_bluetooth_available:
-                        await self.send_error_to_client(websocket, "Bluetooth is turned off")
-                        return
-                    address = payload.get("address")
-                    if address:
-                        asyncio.create_task(self._run_connect_and_notify(address))
-                    else:
-                        await self.send_error_to_client(websocket, "Address is required for connect_device command")
-                elif command == "disconnect_device":
-                    asyncio.create_task(self._run_disconnect_and_notify(websocket))
-                elif command == "start_streaming":
-                    await self.start_streaming(websocket)
-                elif command == "stop_streaming":
-                    await self.stop_streaming()
-                elif command == "get_device_status":
-                    # Send current device status as event (for compatibility)
-                    is_connected = self.device_manager.is_connected()
-                    device_info = self.device_manager.get_device_info() if is_connected else None
-                    registered_devices = self.device_registry.get_registered_devices()
-                    
-                    status_data = {
-                        "connected": is_connected,
-                        "device_info": device_info,
-                        "is_streaming": self.is_streaming if is_connected else False,
-                        "registered_devices": registered_devices,
-                        "clients_connected": len(self.clients)
-                    }
-                    
-                    # Add battery info if available
-                    if is_connected and hasattr(self.device_manager, 'battery_level') and self.device_manager.battery_level is not None:
-                        status_data["battery"] = {
-                            "level": self.device_manager.battery_level,
-                            "timestamp": time.time()
-                        }
-                    
-                    await self.send_event_to_client(websocket, EventType.DEVICE_INFO, status_data)
-                elif command == "get_stream_status":
-                    # Send streaming status
-                    stream_status = {
-                        "is_streaming": self.is_streaming,
-                        "connected_clients": len(self.clients),
-                        "device_connected": self.device_manager.is_connected()
-                    }
-                    
-                    if self.is_streaming:
-                        stream_status["stream_stats"] = self.data_stream_stats
-                    
-                    await self.send_event_to_client(websocket, EventType.STATUS, stream_status)
-                elif command == "health_check":
-                    # Send health check response in expected format
-                    await websocket.send(json.dumps({
-                        "type": "health_check_response",
-                        "status": "ok",
-                        "clients_connected": len(self.clients),
-                        "is_streaming": self.is_streaming,
-                        "device_connected": self.device_manager.is_connected()
-                    }))
+                handler = self._cmd_handlers.get(command)
+                if handler is not None:
+                    await handler(websocket, payload)
                 else:
                     logger.warning(f"Unknown command received: {command}")
                     await self.send_error_to_client(websocket, f"Unknown command: {command}")
@@ -1099,6 +1348,96 @@ class WebSocketServer:
             logger.error(f"Error handling client message: {e}", exc_info=True)
             await self.send_error_to_client(websocket, f"Server error processing message: {e}")
 
+    # 클라이언트 command 핸들러 (self._cmd_handlers로 디스패치, 모두 (websocket, payload) 시그니처)
+    async def _cmd_check_device_connection(self, websocket, payload):
+        """Reply with a simple handshake (kept for client compatibility)."""
+        try:
+            response = {
+                "type": "handshake_response",
+                "status": "connected",
+                "message": "WebSocket connection established"
+            }
+            await websocket.send(json_dumps_text(response))
+            logger.info("[WEBSOCKET_DEBUG] Handshake response sent successfully")
+        except Exception as e:
+            logger.error(f"[WEBSOCKET_DEBUG] Error sending handshake response: {e}", exc_info=True)
+
+    async def _cmd_check_bluetooth_status(self, websocket, payload):
+        is_bluetooth_available = await self._check_bluetooth_status()
+        await self._broadcast_bluetooth_status(is_bluetooth_available)
+
+    async def _cmd_scan_devices(self, websocket, payload):
+        is_bluetooth_available = await self._check_bluetooth_status()
+        if not is_bluetooth_available:
+            await self.send_error_to_client(websocket, "Bluetooth is turned off")
+            return
+        asyncio.create_task(self._run_scan_and_notify(websocket))
+
+    async def _cmd_connect_device(self, websocket, payload):
+        is_bluetooth_available = await self._check_bluetooth_status()
+        if not is_bluetooth_available:
+            await self.send_error_to_client(websocket, "Bluetooth is turned off")
+            return
+        address = payload.get("address")
+        if address:
+            asyncio.create_task(self._run_connect_and_notify(address))
+        else:
+            await self.send_error_to_client(websocket, "Address is required for connect_device command")
+
+    async def _cmd_disconnect_device(self, websocket, payload):
+        asyncio.create_task(self._run_disconnect_and_notify(websocket))
+
+    async def _cmd_start_streaming(self, websocket, payload):
+        await self.start_streaming(websocket)
+
+    async def _cmd_stop_streaming(self, websocket, payload):
+        await self.stop_streaming()
+
+    async def _cmd_get_device_status(self, websocket, payload):
+        """Send current device status as a DEVICE_INFO event (for compatibility)."""
+        is_connected = self.device_manager.is_connected()
+        device_info = self.device_manager.get_device_info() if is_connected else None
+        registered_devices = self.device_registry.get_registered_devices()
+        
+        status_data = {
+            "connected": is_connected,
+            "device_info": device_info,
+            "is_streaming": self.is_streaming if is_connected else False,
+            "registered_devices": registered_devices,
+            "clients_connected": len(self.clients)
+        }
+        
+        # Add battery info if available
+        if is_connected and hasattr(self.device_manager, 'battery_level') and self.device_manager.battery_level is not None:
+            status_data["battery"] = {
+                "level": self.device_manager.battery_level,
+                "timestamp": time.time()
+            }
+        
+        await self.send_event_to_client(websocket, EventType.DEVICE_INFO, status_data)
+
+    async def _cmd_get_stream_status(self, websocket, payload):
+        stream_status = {
+            "is_streaming": self.is_streaming,
+            "connected_clients": len(self.clients),
+            "device_connected": self.device_manager.is_connected()
+        }
+        
+        if self.is_streaming:
+            stream_status["stream_stats"] = self.data_stream_stats
+        
+        await self.send_event_to_client(websocket, EventType.STATUS, stream_status)
+
+    async def _cmd_health_check(self, websocket, payload):
+        # Send health check response in expected format
+        await websocket.send(json_dumps_text({
+            "type": "health_check_response",
+            "status": "ok",
+            "clients_connected": len(self.clients),
+            "is_streaming": self.is_streaming,
+            "device_connected": self.device_manager.is_connected()
+        }))
+
     async def _run_scan_and_notify(self, websocket):
         await self.send_event_to_client(websocket, EventType.SCAN_RESULT, {"status": "scanning"})
         try:
@@ -1308,23 +1647,24 @@ class WebSocketServer:
 
         if not self.is_streaming:
             self.is_streaming = True
+            self._reset_stream_log_counters()
+            # 디바이스 ID는 스트림 시작 시 한 번만 조회해 모든 센서 태스크에 전달
+            raw_device_id = self._stream_device_id()
             
             # Start individual streaming tasks for each sensor type
-            if self.stream_tasks['eeg'] is None or self.stream_tasks['eeg'].done():
-                self.stream_tasks['eeg'] = asyncio.create_task(self.stream_eeg_data())
-                logger.info("Created and started EEG stream task.")
-            
-            if self.stream_tasks['ppg'] is None or self.stream_tasks['ppg'].done():
-                self.stream_tasks['ppg'] = asyncio.create_task(self.stream_ppg_data())
-                logger.info("Created and started PPG stream task.")
-            
-            if self.stream_tasks['acc'] is None or self.stream_tasks['acc'].done():
-                self.stream_tasks['acc'] = asyncio.create_task(self.stream_acc_data())
-                logger.info("Created and started ACC stream task.")
+            stream_coros = {
+                'sensors': self.stream_sensor_data,
+                'battery': self.stream_battery_data,
+            }
+            for sensor_type, stream_coro in stream_coros.items():
+                task = self.stream_tasks[sensor_type]
+                if task is None or task.done():
+                    task = asyncio.create_task(stream_coro(raw_device_id), name=f"stream_{sensor_type}")
+                    task.add_done_callback(self._on_stream_task_done)
+                    self.stream_tasks[sensor_type] = task
+                    logger.info("Created and started %s stream task.", sensor_type.upper())
 
-            if self.stream_tasks['battery'] is None or self.stream_tasks['battery'].done():
-                self.stream_tasks['battery'] = asyncio.create_task(self.stream_battery_data())
-                logger.info("Created and started battery stream task.")
+            self._schedule_stream_logs()
 
             await self.broadcast_event(EventType.STREAM_STARTED, {"status": "streaming_started"})
             logger.info("Streaming started flag set.")
@@ -1333,23 +1673,41 @@ class WebSocketServer:
             logger.info("Streaming is already active.")
             return True
 
+    async def _cancel_stream_tasks(self) -> Dict[str, Any]:
+        """Cancel every running stream task and wait for all of them together.
+
+        Returns the gather result (None / exception) keyed by sensor type for the tasks that were set.
+        """
+        running = {sensor_type: task for sensor_type, task in self.stream_tasks.items() if task}
+        for task in running.values():
+            task.cancel()
+        results = await asyncio.gather(*running.values(), return_exceptions=True)
+        for sensor_type in running:
+            self.stream_tasks[sensor_type] = None
+        return dict(zip(running, results))
+
+    @staticmethod
+    def _on_stream_task_done(task: asyncio.Task) -> None:
+        """Log a stream task that ended with an exception instead of leaving it unretrieved."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error("Stream task %s failed: %s", task.get_name(), exc, exc_info=exc)
+
     async def stop_streaming(self):
         """Stop all streaming tasks."""
-        tasks_cancelled = False
         if self.is_streaming:
             self.is_streaming = False
-        # Cancel all streaming tasks regardless of is_streaming
-        for sensor_type, task in self.stream_tasks.items():
-            if task:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    logger.info(f"{sensor_type.upper()} streaming task successfully cancelled.")
-                except Exception as e:
-                    logger.error(f"Error during {sensor_type} stream_task cancellation: {e}")
-                self.stream_tasks[sensor_type] = None
-                tasks_cancelled = True
+        self._cancel_stream_logs()
+        # Cancel all streaming tasks regardless of is_streaming (모두 취소 요청 후 한 번에 대기)
+        running = await self._cancel_stream_tasks()
+        for sensor_type, result in running.items():
+            if isinstance(result, asyncio.CancelledError):
+                logger.info(f"{sensor_type.upper()} streaming task successfully cancelled.")
+            elif isinstance(result, Exception):
+                logger.error(f"Error during {sensor_type} stream_task cancellation: {result}")
+        tasks_cancelled = bool(running)
         if tasks_cancelled:
             await self.broadcast_event(EventType.STREAM_STOPPED, {"status": "streaming_stopped"})
             logger.info("Streaming stopped flag set.")
@@ -1359,574 +1717,366 @@ class WebSocketServer:
             return False
 
     def _update_sampling_rate(self, sensor_type, processed_data):
-        if len(processed_data) < 2:
+        window = self._rate_windows[sensor_type]
+        # 모든 샘플은 "timestamp"를 가진 dict (디바이스 콜백 / 배터리 추정값 모두 동일)
+        window.extend(sample["timestamp"] for sample in processed_data)
+        if not window:
             return
-        timestamps = [sample["timestamp"] for sample in processed_data]
-        intervals = [t2 - t1 for t1, t2 in zip(timestamps[:-1], timestamps[1:])]
-        avg_interval = sum(intervals) / len(intervals)
-        if avg_interval > 0:
-            sampling_rate = 1.0 / avg_interval
-        else:
-            sampling_rate = 0
-        self.device_sampling_stats[sensor_type]["samples_per_sec"] = round(sampling_rate, 2)
-
-    async def stream_eeg_data(self):
-        logger.info("EEG stream task started.")
-        
-        # Windows 디버깅
-        if platform.system() == 'Windows':
-            logger.info(f"[WINDOWS DEBUG] EEG stream task running on Windows")
+        cutoff_time = window[-1] - RATE_WINDOW_SIZE
+        while window[0] <= cutoff_time:
+            window.popleft()
+        self.device_sampling_stats[sensor_type].samples_per_sec = round(self.get_sampling_rate(sensor_type), 2)
+
+    def get_sampling_rate(self, sensor_type: str) -> float:
+        """최근 RATE_WINDOW_SIZE초 윈도우 기준 샘플링 레이트(Hz)"""
+        window = self._rate_windows[sensor_type]
+        if len(window) < 2:
+            return 0.0
+        span = window[-1] - window[0]
+        # 연속 간격의 평균 = span / (n - 1)
+        return (len(window) - 1) / span if span > 0 else 0.0
+
+    def _reset_stream_log_counters(self):
+        for sensor, counters in self.stream_log_counters.items():
+            counters.update(total=0, since_last_log=0, raw_len=0, processed_len=0, level=None)
+            self._rate_windows[sensor].clear()
+
+    def _schedule_stream_logs(self):
+        """스트림별 1초 요약 로그 / 5초 샘플링 레이트 로그 타이머 시작"""
+        self._cancel_stream_logs()
+        loop = asyncio.get_running_loop()
+        for sensor in self.stream_log_counters:
+            self._stream_log_handles[f"{sensor}_summary"] = loop.call_later(
+                STREAM_LOG_INTERVAL, self._log_stream_summary, sensor)
+            self._stream_log_handles[f"{sensor}_rate"] = loop.call_later(
+                RATE_LOG_INTERVAL, self._log_stream_rate, sensor)
+
+    def _cancel_stream_logs(self):
+        for handle in self._stream_log_handles.values():
+            handle.cancel()
+        self._stream_log_handles.clear()
+
+    def _log_stream_summary(self, sensor: str):
+        counters = self.stream_log_counters[sensor]
+        if counters['since_last_log']:
+            if sensor == 'bat':
+                level = counters['level']
+                logger.info("[BAT] Updates/sec: %4d | Total: %6d | Level: %s%%",
+                            counters['since_last_log'], counters['total'],
+                            level if level is not None else 'N/A')
+            else:
+                logger.info("[%s] Samples/sec: %4d | Total: %6d | Raw Buffer: %4d | Processed Buffer: %4d samples",
+                            sensor.upper(), counters['since_last_log'], counters['total'],
+                            counters['raw_len'], counters['processed_len'])
+            counters['since_last_log'] = 0
+        if self.is_streaming:
+            self._stream_log_handles[f"{sensor}_summary"] = asyncio.get_running_loop().call_later(
+                STREAM_LOG_INTERVAL, self._log_stream_summary, sensor)
+
+    def _log_stream_rate(self, sensor: str):
+        if logger.isEnabledFor(logging.INFO) and len(self._rate_windows[sensor]) > 1:
+            window = self._rate_windows[sensor]
+            _, jitter = _interval_stats(np.asarray(window, dtype=np.float64))
+            logger.info("[%s] Actual sampling rate: %.2f Hz, jitter: %.2f ms (based on %d samples in last %ds)",
+                        sensor.upper(), self.get_sampling_rate(sensor), jitter * 1000, len(window), RATE_WINDOW_SIZE)
+        if self.is_streaming:
+            self._stream_log_handles[f"{sensor}_rate"] = asyncio.get_running_loop().call_later(
+                RATE_LOG_INTERVAL, self._log_stream_rate, sensor)
+
+    @staticmethod
+    async def _wait_next_tick(loop: asyncio.AbstractEventLoop, next_tick: float, interval: float) -> float:
+        """다음 틱 시각까지 대기 (처리 시간만큼 주기가 밀리지 않도록 deadline 기준)"""
+        next_tick += interval
+        delay = next_tick - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+            return next_tick
+        # 처리가 주기보다 오래 걸려 밀린 경우 현재 시각으로 재동기화 (이벤트 루프에는 양보)
+        await asyncio.sleep(0)
+        return loop.time()
+
+    @staticmethod
+    def _idle_backoff_interval(base_interval: float, empty_ticks: int) -> float:
+        """연속으로 빈 틱이 이어질수록 대기 주기를 2배씩 늘림 (STREAM_IDLE_MAX_INTERVAL 상한)"""
+        if empty_ticks < STREAM_IDLE_BACKOFF_AFTER:
+            return base_interval
+        return min(base_interval * (1 << min(empty_ticks - STREAM_IDLE_BACKOFF_AFTER + 1, 8)),
+                   STREAM_IDLE_MAX_INTERVAL)
+
+    def _stream_device_id(self) -> str:
+        """Device address used as device_id in stream messages ("unknown_device" if unavailable)."""
+        device_info = self.device_manager.get_device_info() if self.device_manager else None
+        if device_info and isinstance(device_info, dict):
+            return device_info.get('address', 'unknown_device')
+        return "unknown_device"
+
+    def _new_sensor_stream(self, sensor: str, raw_device_id: str, now: float) -> "SensorStream":
+        """스트림 드라이버가 사용할 센서별 상태 생성 (레코드 타입/메시지 prefix는 여기서 한 번만 생성)"""
+        label = sensor.upper()
+        logger.info("%s stream task started.", label)
+
+        # Windows 디버깅 (EEG 스트림에서만 출력)
+        windows_debug = sensor == 'eeg' and platform.system() == 'Windows'
+        if windows_debug:
+            logger.info(f"[WINDOWS DEBUG] {label} stream task running on Windows")
             logger.info(f"[WINDOWS DEBUG] device_manager: {self.device_manager}")
             logger.info(f"[WINDOWS DEBUG] is_streaming: {self.is_streaming}")
-        
-        SEND_INTERVAL = 0.04  # 25Hz (40ms)
-        NO_DATA_TIMEOUT = 5.0 # 5초 동안 데이터 없으면 경고 후 종료
-        last_data_time = time.time()
-        total_samples_sent = 0
-        last_log_time = time.time()
-        samples_since_last_log = 0
-        timestamp_buffer = []
-        WINDOW_SIZE = 60
-        last_rate_log_time = time.time()
-        RATE_LOG_INTERVAL = 5
-        
-        raw_device_id = "unknown_device" 
-        if self.device_manager and self.device_manager.get_device_info():
-            device_info = self.device_manager.get_device_info()
-            if device_info and isinstance(device_info, dict):
-                raw_device_id = device_info.get('address', 'unknown_device')
-        
+
         device_id_for_filename = raw_device_id.replace(":", "-").replace(" ", "_")
+        return SensorStream(
+            sensor=sensor,
+            label=label,
+            send_interval=STREAM_SEND_INTERVALS[sensor],
+            counters=self.stream_log_counters[sensor],
+            raw_record_type=f"{device_id_for_filename}_{sensor}_raw",
+            processed_record_type=f"{device_id_for_filename}_{sensor}_processed",
+            raw_prefix=_stream_frame_prefix('raw', sensor, raw_device_id),
+            processed_prefix=_stream_frame_prefix('processed', sensor, raw_device_id),
+            windows_debug=windows_debug,
+            next_due=now + STREAM_SEND_INTERVALS[sensor],
+            last_data_tick=now,
+        )
 
-        consecutive_no_data = 0
-        
-        try:
-            while self.is_streaming:
-                try:
-                    await asyncio.sleep(SEND_INTERVAL)
-                    
-                    current_time = time.time()
-                    
-                    if not self.is_streaming: break
+    def _poll_sensor_stream(self, stream: "SensorStream", tick: float, recorder,
+                            frames: List[bytes], binaries: Optional[List[Optional[bytes]]]) -> bool:
+        """센서 버퍼를 한 번 가져와 녹화하고 전송할 프레임을 frames(와 binaries)에 추가.
+
+        NO_DATA_TIMEOUT 동안 데이터가 없어 이 센서의 스트림을 끝내야 하면 False를 반환한다.
+        """
+        sensor = stream.sensor
+        label = stream.label
+        # 다음 폴링 시각 (빈 틱이 이어지면 backoff, 처리가 밀렸으면 현재 틱 기준으로 재동기화)
+        interval = self._idle_backoff_interval(stream.send_interval, stream.consecutive_no_data)
+        stream.next_due += interval
+        if stream.next_due <= tick:
+            stream.next_due = tick + interval
+
+        # raw / processed 버퍼를 한 번에 가져옴 (둘 다 suspend 없이 즉시 반환)
+        raw_data, processed_data = self.device_manager.get_and_clear_sensor_buffers(sensor)
+
+        # idle 틱: 길이 계산/디버그 분기 전에 타임아웃만 확인하고 바로 반환
+        if not raw_data and not processed_data:
+            if stream.windows_debug and stream.consecutive_no_data % 25 == 0:
+                logger.info("[WINDOWS DEBUG] %s buffer check - Raw: 0, Processed: 0", label)
+                logger.info("[WINDOWS DEBUG] Device connected: %s", self.device_manager.is_connected())
+            stream.consecutive_no_data += 1
+            if tick - stream.last_data_tick > SENSOR_NO_DATA_TIMEOUT:
+                logger.warning("No %s data received for too long, stopping %s stream task.", label, label)
+                return False
+            return True
 
-                    eeg_buffer = self.device_manager.get_and_clear_eeg_buffer()
-                    
-                    # Processed data는 raw data와 독립적으로 확인
-                    try:
-                        processed_data = await self.device_manager.get_and_clear_processed_eeg_buffer()
-                    except Exception as e:
-                        logger.error(f"Failed to get processed EEG buffer: {e}")
-                        processed_data = None
-                    
-                    # Windows 디버깅
-                    if platform.system() == 'Windows' and (consecutive_no_data == 0 or consecutive_no_data % 25 == 0):
-                        logger.info(f"[WINDOWS DEBUG] EEG buffer check - Raw: {len(eeg_buffer) if eeg_buffer else 0}, Processed: {len(processed_data) if processed_data else 0}")
-                        logger.info(f"[WINDOWS DEBUG] Device connected: {self.device_manager.is_connected()}")
-                    
-                    raw_data_len = len(eeg_buffer) if eeg_buffer else 0
-                    processed_data_len = len(processed_data) if processed_data else 0
-                    # logger.info(f"[STREAM_EEG_DEBUG] Raw data len: {raw_data_len}, Processed data len: {processed_data_len}")
-
-                    if raw_data_len > 0:
-                        logger.debug(f"[STREAM_EEG_DEBUG] First raw sample type: {type(eeg_buffer[0]) if raw_data_len > 0 else 'N/A'}")
-                    if processed_data_len > 0:
-                        logger.debug(f"[STREAM_EEG_DEBUG] First processed sample type: {type(processed_data[0]) if processed_data_len > 0 else 'N/A'}")
-
-                    # 데이터 녹화 로직 - 클라이언트 연결과 독립적으로 실행
-                    # 레코딩 중인 경우 데이터 저장
-                    if self.data_recorder and self.data_recorder.is_recording:
-                        if eeg_buffer:
-                            for sample in eeg_buffer: 
-                                if isinstance(sample, dict):
-                                    self.data_recorder.add_data(
-                                        data_type=f"{device_id_for_filename}_eeg_raw",
-                                        data=sample 
-                                    )
-                        if processed_data:
-                            for sample in processed_data: 
-                                if isinstance(sample, dict):
-                                    self.data_recorder.add_data(
-                                        data_type=f"{device_id_for_filename}_eeg_processed",
-                                        data=sample
-                                    )
-                    
-                    if eeg_buffer:
-                        raw_message = {
-                            "type": "raw_data",
-                            "sensor_type": "eeg",
-                            "device_id": raw_device_id, # Broadcast original device_id
-                            "timestamp": current_time,
-                            "data": eeg_buffer
-                        }
-                        try:
-                            await self.broadcast(json.dumps(raw_message))
-                            # EEG 타임스탬프 추출
-                            sample_timestamps = []
-                            if eeg_buffer:
-                                for sample in eeg_buffer:
-                                    if isinstance(sample, dict) and "timestamp" in sample:
-                                        sample_timestamps.append(sample["timestamp"])
-                            # StreamingMonitor에 데이터 흐름 추적 (타임스탬프 포함)
-                            self.streaming_monitor.track_data_flow('eeg', len(eeg_buffer), sample_timestamps)
-                            total_samples_sent += len(eeg_buffer)
-                            samples_since_last_log += len(eeg_buffer)
-                            
-                            for sample in eeg_buffer:
-                                if isinstance(sample, dict) and "timestamp" in sample:
-                                    timestamp_buffer.append(sample["timestamp"])
-                            cutoff_time = current_time - WINDOW_SIZE
-                            timestamp_buffer = [ts for ts in timestamp_buffer if ts > cutoff_time]
-                            if eeg_buffer and isinstance(eeg_buffer, list) and len(eeg_buffer) > 0 and isinstance(eeg_buffer[0], dict):
-                                self._update_sampling_rate('eeg', eeg_buffer)
-                        except Exception as e:
-                            logger.error(f"Error broadcasting raw EEG data: {e}", exc_info=True)
-
-                    if processed_data:
-                        processed_message = {
-                            "type": "processed_data",
-                            "sensor_type": "eeg",
-                            "device_id": raw_device_id, # Broadcast original device_id
-                            "timestamp": current_time,
-                            "data": processed_data
-                        }
-                        try:
-                            await self.broadcast(json.dumps(processed_message))
-                        except Exception as e:
-                            logger.error(f"Error broadcasting processed EEG data: {e}", exc_info=True)
-
-                    if eeg_buffer or processed_data:
-                        consecutive_no_data = 0  # 데이터가 있으면 카운터 리셋
-                        last_data_time = current_time
-                        if current_time - last_log_time >= 1.0:
-                            logger.info(f"[EEG] Samples/sec: {samples_since_last_log:4d} | "
-                                      f"Total: {total_samples_sent:6d} | "
-                                      f"Raw Buffer: {len(eeg_buffer) if eeg_buffer else 0:4d} | "
-                                      f"Processed Buffer: {len(processed_data) if processed_data else 0:4d} samples")
-                            samples_since_last_log = 0
-                            last_log_time = current_time
-                        if current_time - last_rate_log_time >= RATE_LOG_INTERVAL:
-                            if len(timestamp_buffer) > 1:
-                                intervals = [timestamp_buffer[i+1] - timestamp_buffer[i] for i in range(len(timestamp_buffer)-1)]
-                                if intervals:
-                                    avg_interval = sum(intervals) / len(intervals)
-                                    actual_rate = 1.0 / avg_interval if avg_interval > 0 else 0
-                                    logger.info(f"[EEG] Actual sampling rate: {actual_rate:.2f} Hz "
-                                              f"(based on {len(timestamp_buffer)} samples in last {WINDOW_SIZE}s)")
-                                    if isinstance(self.device_sampling_stats, dict) and 'eeg' in self.device_sampling_stats and isinstance(self.device_sampling_stats['eeg'], dict):
-                                        self.device_sampling_stats['eeg']['samples_per_sec'] = actual_rate
-                        last_rate_log_time = current_time
-                    else:
-                        consecutive_no_data += 1  # 데이터가 없으면 카운터 증가
-                        
-                    if time.time() - last_data_time > NO_DATA_TIMEOUT:
-                        logger.warning("No EEG data received for too long, stopping EEG stream task.")
-                        break # Exit loop if no data
+        # get_and_clear_sensor_buffers는 항상 list를 반환
+        raw_data_len = len(raw_data)
+        processed_data_len = len(processed_data)
+        if stream.windows_debug and stream.consecutive_no_data % 25 == 0:
+            logger.info("[WINDOWS DEBUG] %s buffer check - Raw: %d, Processed: %d", label, raw_data_len, processed_data_len)
+            logger.info("[WINDOWS DEBUG] Device connected: %s", self.device_manager.is_connected())
+        stream.consecutive_no_data = 0
+        stream.last_data_tick = tick
+        current_time = time.time()
+        counters = stream.counters
 
-                except asyncio.CancelledError:
-                    logger.info("EEG stream task received cancellation.")
+        if raw_data_len:
+            logger.debug("[STREAM_%s_DEBUG] First raw sample type: %s", label, type(raw_data[0]))
+        if processed_data_len:
+            logger.debug("[STREAM_%s_DEBUG] First processed sample type: %s", label, type(processed_data[0]))
+
+        # 데이터 녹화 로직 - 클라이언트 연결과 독립적으로 실행
+        if recorder is not None and recorder.is_recording:
+            if raw_data:
+                recorder.add_many(stream.raw_record_type, raw_data)
+            if processed_data:
+                recorder.add_many(stream.processed_record_type, processed_data)
+
+        if raw_data:
+            try:
+                frames.append(stream.raw_prefix + json_dumps(current_time) + b',"data":' + json_dumps(raw_data) + b'}')
+                # StreamingMonitor에 데이터 흐름 추적
+                # EEG 레이트는 배치의 첫/마지막 샘플 타임스탬프만으로 계산 (샘플별 타임스탬프 리스트를 만들지 않음)
+                timestamp_span = ((raw_data[0]["timestamp"], raw_data[-1]["timestamp"])
+                                  if sensor == 'eeg' else None)
+                self.streaming_monitor.track_data_flow(sensor, raw_data_len, timestamp_span=timestamp_span)
+                counters['total'] += raw_data_len
+                counters['since_last_log'] += raw_data_len
+                self._update_sampling_rate(sensor, raw_data)
+            except Exception as e:
+                logger.error(f"Error broadcasting raw {label} data: {e}", exc_info=True)
+            # binary 프레임을 요청한 연결이 있을 때만 raw 샘플을 열 단위 (timestamps + float32 값) binary로 추가 인코딩
+            # 인코딩 실패 시 None (해당 연결은 JSON text 프레임으로 수신), 모니터/카운터 갱신과는 분리
+            if binaries is not None and len(binaries) < len(frames):
+                binary = None
+                try:
+                    binary = _raw_binary_frame({"type": "raw_data", "sensor_type": sensor,
+                                                "timestamp": current_time, "data": raw_data})
                 except Exception as e:
-                    logger.error(f"Error in EEG stream loop: {e}", exc_info=True)
-                finally:
-                    logger.info(f"EEG stream task finished. Total samples sent: {total_samples_sent}")
+                    logger.error("Error encoding binary raw %s frame: %s", label, e, exc_info=True)
+                binaries.append(binary)
 
-        except asyncio.CancelledError:
-            logger.info("EEG stream task received cancellation.")
-        except Exception as e:
-            logger.error(f"Error in EEG stream loop: {e}", exc_info=True)
-        finally:
-            logger.info(f"EEG stream task finished. Total samples sent: {total_samples_sent}")
-
-    async def stream_ppg_data(self):
-        logger.info("PPG stream task started.")
-        SEND_INTERVAL = 0.02  # 50Hz (20ms)
-        NO_DATA_TIMEOUT = 5.0
-        last_data_time = time.time()
-        total_samples_sent = 0
-        last_log_time = time.time()
-        samples_since_last_log = 0
-        timestamp_buffer = []
-        WINDOW_SIZE = 60
-        last_rate_log_time = time.time()
-        RATE_LOG_INTERVAL = 5
-        
-        raw_device_id = "unknown_device"
-        if self.device_manager and self.device_manager.get_device_info():
-            device_info = self.device_manager.get_device_info()
-            if device_info and isinstance(device_info, dict):
-                raw_device_id = device_info.get('address', 'unknown_device')
-        
-        device_id_for_filename = raw_device_id.replace(":", "-").replace(" ", "_")
+        if processed_data:
+            try:
+                frames.append(stream.processed_prefix + json_dumps(current_time) + b',"data":' + json_dumps(processed_data) + b'}')
+                if binaries is not None:
+                    binaries.append(None)
+            except Exception as e:
+                logger.error(f"Error broadcasting processed {label} data: {e}", exc_info=True)
 
-        try:
-            while self.is_streaming:
-                await asyncio.sleep(SEND_INTERVAL)
-                if not self.is_streaming: break
+        counters['raw_len'] = raw_data_len
+        counters['processed_len'] = processed_data_len
+        return True
 
-                raw_data = self.device_manager.get_and_clear_ppg_buffer()
-                processed_data = await self.device_manager.get_and_clear_processed_ppg_buffer()
-                
-                current_time = time.time()
-                
-                # 레코딩 중인 경우 데이터 저장
-                if self.data_recorder and self.data_recorder.is_recording:
-                    if raw_data:
-                        for sample in raw_data:
-                            if isinstance(sample, dict):
-                                self.data_recorder.add_data(
-                                    data_type=f"{device_id_for_filename}_ppg_raw",
-                                    data=sample
-                                )
-                    if processed_data:
-                        for sample in processed_data:
-                            if isinstance(sample, dict):
-                                self.data_recorder.add_data(
-                                    data_type=f"{device_id_for_filename}_ppg_processed",
-                                    data=sample
-                                )
-                
-                if raw_data:
-                    raw_message = {
-                        "type": "raw_data",
-                        "sensor_type": "ppg",
-                        "device_id": raw_device_id,
-                        "timestamp": current_time,
-                        "data": raw_data
-                    }
-                    try:
-                        await self.broadcast(json.dumps(raw_message))
-                        # StreamingMonitor에 데이터 흐름 추적 (실제 브로드캐스트 시점)
-                        self.streaming_monitor.track_data_flow('ppg', len(raw_data))
-                        total_samples_sent += len(raw_data)
-                        samples_since_last_log += len(raw_data)
-                        
-                        for sample in raw_data:
-                            if isinstance(sample, dict) and "timestamp" in sample:
-                                timestamp_buffer.append(sample["timestamp"])
-                        cutoff_time = current_time - WINDOW_SIZE
-                        timestamp_buffer = [ts for ts in timestamp_buffer if ts > cutoff_time]
-                        if raw_data and isinstance(raw_data, list) and len(raw_data) > 0 and isinstance(raw_data[0], dict):
-                            self._update_sampling_rate('ppg', raw_data)
-                    except Exception as e:
-                        logger.error(f"Error broadcasting raw PPG data: {e}", exc_info=True)
-
-                if processed_data:
-                    processed_message = {
-                        "type": "processed_data",
-                        "sensor_type": "ppg",
-                        "device_id": raw_device_id,
-                        "timestamp": current_time,
-                        "data": processed_data
-                    }
-                    try:
-                        await self.broadcast(json.dumps(processed_message))
-                    except Exception as e:
-                        logger.error(f"Error broadcasting processed PPG data: {e}", exc_info=True)
-
-                if raw_data or processed_data:
-                    last_data_time = current_time
-                    if current_time - last_log_time >= 1.0:
-                        logger.info(f"[PPG] Samples/sec: {samples_since_last_log:4d} | "
-                                  f"Total: {total_samples_sent:6d} | "
-                                  f"Raw Buffer: {len(raw_data) if raw_data else 0:4d} | "
-                                  f"Processed Buffer: {len(processed_data) if processed_data else 0:4d} samples")
-                        samples_since_last_log = 0
-                        last_log_time = current_time
-                    if current_time - last_rate_log_time >= RATE_LOG_INTERVAL:
-                        if len(timestamp_buffer) > 1:
-                            intervals = [timestamp_buffer[i+1] - timestamp_buffer[i] for i in range(len(timestamp_buffer)-1)]
-                            if intervals:
-                                avg_interval = sum(intervals) / len(intervals)
-                                actual_rate = 1.0 / avg_interval if avg_interval > 0 else 0
-                                logger.info(f"[PPG] Actual sampling rate: {actual_rate:.2f} Hz "
-                                          f"(based on {len(timestamp_buffer)} samples in last {WINDOW_SIZE}s)")
-                                if isinstance(self.device_sampling_stats, dict) and 'ppg' in self.device_sampling_stats and isinstance(self.device_sampling_stats['ppg'], dict):
-                                    self.device_sampling_stats['ppg']['samples_per_sec'] = actual_rate
-                        last_rate_log_time = current_time
-                elif time.time() - last_data_time > NO_DATA_TIMEOUT:
-                    logger.warning("No PPG data received for too long, stopping PPG stream task.")
-                    break
+    async def _stream_sensors(self, sensors: Tuple[str, ...], raw_device_id: Optional[str] = None):
+        """EEG/PPG/ACC 공통 스트림 드라이버: 하나의 태스크가 센서별 전송 주기에 맞춰 버퍼를 가져와 녹화 후 브로드캐스트.
 
-        except asyncio.CancelledError:
-            logger.info("PPG stream task received cancellation.")
-        except Exception as e:
-            logger.error(f"Error in PPG stream loop: {e}", exc_info=True)
-        finally:
-            logger.info(f"PPG stream task finished. Total samples sent: {total_samples_sent}")
-
-    async def stream_acc_data(self):
-        logger.info("ACC stream task started.")
-        SEND_INTERVAL = 0.033  # ~30Hz (33.3ms)
-        NO_DATA_TIMEOUT = 5.0
-        last_data_time = time.time()
-        total_samples_sent = 0
-        last_log_time = time.time()
-        samples_since_last_log = 0
-        timestamp_buffer = []
-        WINDOW_SIZE = 60
-        last_rate_log_time = time.time()
-        RATE_LOG_INTERVAL = 5
-        
-        raw_device_id = "unknown_device"
-        if self.device_manager and self.device_manager.get_device_info():
-            device_info = self.device_manager.get_device_info()
-            if device_info and isinstance(device_info, dict):
-                raw_device_id = device_info.get('address', 'unknown_device')
-        
-        device_id_for_filename = raw_device_id.replace(":", "-").replace(" ", "_")
+        가장 먼저 도래하는 센서 시각에 한 번 깨어나, STREAM_COALESCE_WINDOW 안에 도래하는 다른 센서도
+        함께 처리하고 그 틱의 프레임을 한 번에 전송한다 (multi 클라이언트는 한 프레임으로 수신).
+        """
+        if raw_device_id is None:
+            raw_device_id = self._stream_device_id()
+        recorder = self.data_recorder  # 서버 수명 동안 바뀌지 않으므로 태스크 시작 시 한 번만 조회
+        loop = asyncio.get_running_loop()
+        streams = [self._new_sensor_stream(sensor, raw_device_id, loop.time()) for sensor in sensors]
 
         try:
-            while self.is_streaming:
-                await asyncio.sleep(SEND_INTERVAL)
+            while self.is_streaming and streams:
+                wake_at = min(stream.next_due for stream in streams)
+                delay = wake_at - loop.time()
+                # 처리가 밀린 경우에도 이벤트 루프에는 양보
+                await asyncio.sleep(delay if delay > 0 else 0)
                 if not self.is_streaming: break
 
-                raw_data = self.device_manager.get_and_clear_acc_buffer()
-                processed_data = await self.device_manager.get_and_clear_processed_acc_buffer()
-                
-                current_time = time.time()
-                
-                # 레코딩 중인 경우 데이터 저장
-                if self.data_recorder and self.data_recorder.is_recording:
-                    if raw_data:
-                        for sample in raw_data:
-                            if isinstance(sample, dict):
-                                self.data_recorder.add_data(
-                                    data_type=f"{device_id_for_filename}_acc_raw",
-                                    data=sample
-                                )
-                    if processed_data:
-                        for sample in processed_data:
-                            if isinstance(sample, dict):
-                                self.data_recorder.add_data(
-                                    data_type=f"{device_id_for_filename}_acc_processed",
-                                    data=sample
-                                )
-                
-                if raw_data:
-                    raw_message = {
-                        "type": "raw_data",
-                        "sensor_type": "acc",
-                        "device_id": raw_device_id,
-                        "timestamp": current_time,
-                        "data": raw_data
-                    }
+                # 타임아웃 판정은 monotonic 루프 시각 기준, time.time()은 메시지 timestamp에만 사용
+                tick = loop.time()
+                due_limit = tick + STREAM_COALESCE_WINDOW
+                frames: List[bytes] = []
+                binaries = [] if len(self._binary_frame_ws) else None
+                for stream in [stream for stream in streams if stream.next_due <= due_limit]:
                     try:
-                        await self.broadcast(json.dumps(raw_message))
-                        # StreamingMonitor에 데이터 흐름 추적 (실제 브로드캐스트 시점)
-                        self.streaming_monitor.track_data_flow('acc', len(raw_data))
-                        total_samples_sent += len(raw_data)
-                        samples_since_last_log += len(raw_data)
-                        
-                        for sample in raw_data:
-                            if isinstance(sample, dict) and "timestamp" in sample:
-                                timestamp_buffer.append(sample["timestamp"])
-                        cutoff_time = current_time - WINDOW_SIZE
-                        timestamp_buffer = [ts for ts in timestamp_buffer if ts > cutoff_time]
-                        if raw_data and isinstance(raw_data, list) and len(raw_data) > 0 and isinstance(raw_data[0], dict):
-                            self._update_sampling_rate('acc', raw_data)
+                        if not self._poll_sensor_stream(stream, tick, recorder, frames, binaries):
+                            streams.remove(stream)
+                            logger.info("%s stream task finished. Total samples sent: %d", stream.label, stream.counters['total'])
                     except Exception as e:
-                        logger.error(f"Error broadcasting raw ACC data: {e}", exc_info=True)
-
-                if processed_data:
-                    processed_message = {
-                        "type": "processed_data",
-                        "sensor_type": "acc",
-                        "device_id": raw_device_id,
-                        "timestamp": current_time,
-                        "data": processed_data
-                    }
+                        logger.error(f"Error in {stream.label} stream loop: {e}", exc_info=True)
+
+                if frames:
                     try:
-                        await self.broadcast(json.dumps(processed_message))
+                        self._broadcast_frames(frames, binaries)
                     except Exception as e:
-                        logger.error(f"Error broadcasting processed ACC data: {e}", exc_info=True)
-
-                if raw_data or processed_data:
-                    last_data_time = current_time
-                    if current_time - last_log_time >= 1.0:
-                        logger.info(f"[ACC] Samples/sec: {samples_since_last_log:4d} | "
-                                  f"Total: {total_samples_sent:6d} | "
-                                  f"Raw Buffer: {len(raw_data) if raw_data else 0:4d} | "
-                                  f"Processed Buffer: {len(processed_data) if processed_data else 0:4d} samples")
-                        samples_since_last_log = 0
-                        last_log_time = current_time
-                    if current_time - last_rate_log_time >= RATE_LOG_INTERVAL:
-                        if len(timestamp_buffer) > 1:
-                            intervals = [timestamp_buffer[i+1] - timestamp_buffer[i] for i in range(len(timestamp_buffer)-1)]
-                            if intervals:
-                                avg_interval = sum(intervals) / len(intervals)
-                                actual_rate = 1.0 / avg_interval if avg_interval > 0 else 0
-                                logger.info(f"[ACC] Actual sampling rate: {actual_rate:.2f} Hz "
-                                          f"(based on {len(timestamp_buffer)} samples in last {WINDOW_SIZE}s)")
-                                if isinstance(self.device_sampling_stats, dict) and 'acc' in self.device_sampling_stats and isinstance(self.device_sampling_stats['acc'], dict):
-                                    self.device_sampling_stats['acc']['samples_per_sec'] = actual_rate
-                        last_rate_log_time = current_time
-                elif time.time() - last_data_time > NO_DATA_TIMEOUT:
-                    logger.warning("No ACC data received for too long, stopping ACC stream task.")
-                    break
+                        logger.error(f"Error broadcasting sensor data: {e}", exc_info=True)
 
         except asyncio.CancelledError:
-            logger.info("ACC stream task received cancellation.")
+            for stream in streams:
+                logger.info("%s stream task received cancellation.", stream.label)
         except Exception as e:
-            logger.error(f"Error in ACC stream loop: {e}", exc_info=True)
+            logger.error(f"Error in sensor stream driver: {e}", exc_info=True)
         finally:
-            logger.info(f"ACC stream task finished. Total samples sent: {total_samples_sent}")
+            for stream in streams:
+                logger.info("%s stream task finished. Total samples sent: %d", stream.label, stream.counters['total'])
+
+    async def stream_sensor_data(self, raw_device_id: Optional[str] = None):
+        """EEG/PPG/ACC를 하나의 드라이버 태스크로 스트리밍"""
+        await self._stream_sensors(('eeg', 'ppg', 'acc'), raw_device_id)
+
+    async def stream_eeg_data(self, raw_device_id: Optional[str] = None):
+        await self._stream_sensors(('eeg',), raw_device_id)
+
+    async def stream_ppg_data(self, raw_device_id: Optional[str] = None):
+        await self._stream_sensors(('ppg',), raw_device_id)
 
-    async def stream_battery_data(self):
+    async def stream_acc_data(self, raw_device_id: Optional[str] = None):
+        await self._stream_sensors(('acc',), raw_device_id)
+
+    async def stream_battery_data(self, raw_device_id: Optional[str] = None):
         logger.info("Battery stream task started.")
         SEND_INTERVAL = 0.1  # 100ms마다 체크 (10Hz)
         NO_DATA_TIMEOUT = 10.0 
-        last_data_time = time.time()
-        total_samples_sent = 0
-        last_log_time = time.time()
-        samples_since_last_log = 0
+        counters = self.stream_log_counters['bat']
         last_battery_level_reported = None 
         
-        timestamp_buffer = [] 
-        WINDOW_SIZE = 60 
-        last_rate_log_time = time.time()
-        RATE_LOG_INTERVAL = 5  
-        
-        raw_device_id = "unknown_device"
-        if self.device_manager and self.device_manager.get_device_info():
-            device_info = self.device_manager.get_device_info()
-            if device_info and isinstance(device_info, dict): 
-                raw_device_id = device_info.get('address', 'unknown_device')
-        
+        if raw_device_id is None:
+            raw_device_id = self._stream_device_id()
         device_id_for_filename = raw_device_id.replace(":", "-").replace(" ", "_")
+        bat_record_type = f"{device_id_for_filename}_bat"
+        recorder = self.data_recorder  # 서버 수명 동안 바뀌지 않으므로 태스크 시작 시 한 번만 조회
+        message = self._msg_templates['bat']
+        message['device_id'] = raw_device_id
+        consecutive_no_data = 0
+        loop = asyncio.get_running_loop()
+        # 타임아웃 판정은 루프의 monotonic 틱 시각(next_tick) 기준, time.time()은 메시지 timestamp에만 사용
+        next_tick = last_data_tick = loop.time()
 
         try:
             while self.is_streaming:
-                await asyncio.sleep(SEND_INTERVAL)
+                next_tick = await self._wait_next_tick(
+                    loop, next_tick, self._idle_backoff_interval(SEND_INTERVAL, consecutive_no_data))
                 if not self.is_streaming: break
 
-                current_time = time.time()
                 actual_battery_data_list = self.device_manager.get_and_clear_battery_buffer() 
-                
-                # 강화된 디버깅 로그 (PPG/ACC와 동일)
-                logger.info(f"[STREAM_BAT_DEBUG] === Battery Recording Check ===")
-                logger.info(f"[STREAM_BAT_DEBUG] DataRecorder object exists: {self.data_recorder is not None}")
-                if self.data_recorder:
-                    logger.info(f"[STREAM_BAT_DEBUG] DataRecorder.is_recording: {self.data_recorder.is_recording}")
-                else:
-                    logger.warning(f"[STREAM_BAT_DEBUG] DataRecorder is None!")
-                
-                actual_battery_data_len = len(actual_battery_data_list) if actual_battery_data_list else 0
-                logger.info(f"[STREAM_BAT_DEBUG] Actual battery data len: {actual_battery_data_len}")
-                
-                # 레코딩 조건 상세 체크
-                recording_condition = self.data_recorder and self.data_recorder.is_recording
-                logger.info(f"[STREAM_BAT_DEBUG] Recording condition met: {recording_condition}")
-                if not recording_condition:
-                    if not self.data_recorder:
-                        logger.warning(f"[STREAM_BAT_DEBUG] Recording failed: DataRecorder is None")
-                    elif not self.data_recorder.is_recording:
-                        logger.warning(f"[STREAM_BAT_DEBUG] Recording failed: is_recording is False")
-                if actual_battery_data_len > 0 :
-                     logger.debug(f"[STREAM_BAT_DEBUG] First battery sample type: {type(actual_battery_data_list[0]) if actual_battery_data_len > 0 else 'N/A'}")
-
-                if self.data_recorder and self.data_recorder.is_recording:
-                    logger.info(f"[STREAM_BAT_DEBUG] REC_CONDITION_MET. Actual battery data len: {actual_battery_data_len}")
-                    if actual_battery_data_list: 
-                        for i, sample in enumerate(actual_battery_data_list): 
-                            if isinstance(sample, dict):
-                                self.data_recorder.add_data(
-                                    data_type=f"{device_id_for_filename}_bat", 
-                                    data=sample 
-                                )
-                                if 'level' in sample: # Update last reported level from actual data
-                                     last_battery_level_reported = sample['level']
-                            else:
-                                logger.warning(f"Skipping non-dict actual battery sample at index {i} for recording. Type: {type(sample)}, Data: {str(sample)[:100]}...")
-                
+
+                # 새 데이터도, 추정에 쓸 이전 레벨도 없으면 idle 틱 - 이후 분기는 모두 건너뜀
+                if not actual_battery_data_list and last_battery_level_reported is None:
+                    consecutive_no_data += 1
+                    if next_tick - last_data_tick > NO_DATA_TIMEOUT: # 배터리 데이터가 일정 시간 동안 없을 때
+                        logger.warning("No Battery data (real or estimated) for too long, stopping battery stream task.")
+                        break # 루프 종료
+                    continue
+                consecutive_no_data = 0
+                current_time = time.time()
+
+                # 녹화 여부는 틱마다 한 번만 확인하고, 녹화 중일 때만 녹화/디버그 블록 실행
+                # (레벨 갱신은 아래 브로드캐스트 단계에서 실제 데이터 기준으로 처리)
+                if actual_battery_data_list and recorder is not None and recorder.is_recording:
+                    logger.debug("[STREAM_BAT_DEBUG] Recording %d battery samples", len(actual_battery_data_list))
+                    recorder.add_many(bat_record_type, actual_battery_data_list)
+
                 # 브로드캐스트는 추정된 값이라도 할 수 있도록 기존 로직 유지 (단, 저장과는 별개)
                 display_battery_data = actual_battery_data_list
                 if not display_battery_data and last_battery_level_reported is not None:
                      display_battery_data = [{"timestamp": current_time, "level": last_battery_level_reported, "source": "estimated"}]
                 
                 if display_battery_data: # display_battery_data 사용
-                    last_data_time = current_time
-                    if display_battery_data and isinstance(display_battery_data[-1], dict) and 'level' in display_battery_data[-1]:
-                        current_level_for_log = display_battery_data[-1]['level']
-                        if 'source' not in display_battery_data[-1] or display_battery_data[-1]['source'] != 'estimated':
-                             last_battery_level_reported = current_level_for_log # 실제 데이터일 때만 업데이트
-                    else:
-                        current_level_for_log = last_battery_level_reported # 이전 값 사용
+                    last_data_tick = next_tick
+                    # 배터리 샘플은 항상 'level'을 가진 dict (추정값 포함)
+                    latest_sample = display_battery_data[-1]
+                    current_level_for_log = latest_sample.get('level', last_battery_level_reported)
+                    if latest_sample.get('source') != 'estimated':
+                        last_battery_level_reported = current_level_for_log # 실제 데이터일 때만 업데이트
 
                     
-                    for sample in display_battery_data: # display_battery_data 사용
-                        if isinstance(sample, dict) and 'timestamp' in sample:
-                            timestamp_buffer.append(sample['timestamp'])
+                    message['timestamp'] = current_time
+                    message['data'] = display_battery_data # display_battery_data 사용
                     
-                    cutoff_time = current_time - WINDOW_SIZE
-                    timestamp_buffer = [ts for ts in timestamp_buffer if ts > cutoff_time]
-                    
-                    message = {
-                        "type": "sensor_data",
-                        "sensor_type": "bat",
-                        "device_id": raw_device_id,
-                        "timestamp": current_time,
-                        "data": display_battery_data # display_battery_data 사용
-                    }
-                    
-                    if display_battery_data and isinstance(display_battery_data, list) and len(display_battery_data) > 0 and isinstance(display_battery_data[0], dict):
-                        self._update_sampling_rate('bat', display_battery_data) 
+                    self._update_sampling_rate('bat', display_battery_data)
                     
                     try:
-                        await self.broadcast(json.dumps(message))
+                        await self.broadcast(json_dumps(message))
                         # StreamingMonitor에 데이터 흐름 추적 (실제 브로드캐스트 시점)
-                        data_count = len(display_battery_data) if display_battery_data else 1  # 배터리 레벨 업데이트도 카운트
+                        data_count = len(display_battery_data)
                         self.streaming_monitor.track_data_flow('bat', data_count)
-                        total_samples_sent += len(display_battery_data) # display_battery_data 사용
-                        samples_since_last_log += len(display_battery_data) # display_battery_data 사용
-                        
-                        if current_time - last_log_time >= 1.0:
-                            logger.info(f"[BAT] Updates/sec: {samples_since_last_log:4d} | "
-                                      f"Total: {total_samples_sent:6d} | "
-                                      f"Level: {current_level_for_log if current_level_for_log is not None else 'N/A'}%")
-                            samples_since_last_log = 0
-                            last_log_time = current_time
+                        counters['total'] += data_count
+                        counters['since_last_log'] += data_count
+                        counters['level'] = current_level_for_log
                             
-                        # Update battery level in device_sampling_stats immediately when we have data
-                        if current_level_for_log is not None and isinstance(self.device_sampling_stats, dict):
-                            self.device_sampling_stats['bat_level'] = current_level_for_log
-                        
-                        if current_time - last_rate_log_time >= RATE_LOG_INTERVAL:
-                            if timestamp_buffer:
-                                intervals = [timestamp_buffer[i+1] - timestamp_buffer[i] 
-                                           for i in range(len(timestamp_buffer)-1)]
-                                if intervals:
-                                    avg_interval = sum(intervals) / len(intervals)
-                                    actual_rate = 1.0 / avg_interval if avg_interval > 0 else 0
-                                    logger.info(f"[BAT] Actual sampling rate: {actual_rate:.2f} Hz "
-                                              f"(based on {len(timestamp_buffer)} samples in last {WINDOW_SIZE}s)")
-                                    if isinstance(self.device_sampling_stats, dict) and 'bat' in self.device_sampling_stats and isinstance(self.device_sampling_stats['bat'], dict):
-                                        self.device_sampling_stats['bat']['samples_per_sec'] = actual_rate
-                            last_rate_log_time = current_time
+                        # Update battery level immediately when we have data
+                        if current_level_for_log is not None:
+                            self.bat_level = current_level_for_log
                             
                     except Exception as e:
                         logger.error(f"Error broadcasting battery data: {e}", exc_info=True)
-                elif time.time() - last_data_time > NO_DATA_TIMEOUT: # 배터리 데이터가 일정 시간 동안 없을 때
-                    logger.warning("No Battery data (real or estimated) for too long, stopping battery stream task.")
-                    break # 루프 종료
 
         except asyncio.CancelledError:
             logger.info("Battery stream task received cancellation.")
         except Exception as e:
             logger.error(f"Error in battery stream loop: {e}", exc_info=True)
         finally:
-            logger.info(f"Battery stream task finished. Total updates sent: {total_samples_sent}")
+            logger.info(f"Battery stream task finished. Total updates sent: {counters['total']}")
 
     async def send_event_to_client(self, websocket: websockets.WebSocketServerProtocol, event_type: EventType, data: Dict[str, Any]):
         """Send an event message to a specific client."""
         if not websocket:
             logger.warning("Attempted to send event to None websocket.")
             return
-        message = {
-            "type": "event",
-            "event_type": event_type.value,
-            "data": data
-        }
         try:
-            await websocket.send(json.dumps(message))
+            await websocket.send(_event_frame(event_type, data), text=True)
         except websockets.exceptions.ConnectionClosed:
             logger.warning(f"Connection closed while sending event to {websocket.remote_address}")
             self.clients.discard(websocket)
@@ -1939,132 +2089,121 @@ class WebSocketServer:
 
     async def broadcast_event(self, event_type: EventType, data: Dict[str, Any]):
         """Broadcast an event message to all connected clients."""
-        message = {
-            "type": "event",
-            "event_type": event_type.value,
-            "data": data
-        }
-        await self.broadcast(json.dumps(message))
-
-    async def broadcast(self, message: str):
-        """Broadcast message to all connected clients with improved error handling for Windows."""
+        if event_type in _STATUS_CHANGING_EVENTS:
+            self._status_dirty.set()
+        # 수신자가 없으면 프레임을 만들지 않음 (이벤트 콜백은 여기서 호출되지 않음)
         if not self.clients:
             return
+        await self.broadcast(_event_frame(event_type, data))
 
-        # 연결이 끊어진 클라이언트를 추적
-        disconnected_clients = set()
-        
-        # 클라이언트 목록을 복사하여 순회 중 수정 방지
-        clients_copy = list(self.clients)
+    async def broadcast(self, message: Union[str, bytes]):
+        """Broadcast message to all connected clients.
 
-        # 각 클라이언트에 메시지 전송 시도
-        for client in clients_copy:
-            try:
-                # 클라이언트 연결 상태 확인 (Windows 호환성)
-                is_closed = getattr(client, 'closed', None)
-                if is_closed is None:
-                    # closed 속성이 없는 경우 state로 확인
-                    try:
-                        state = getattr(client, 'state', None)
-                        is_closed = state is None or state != 1  # 1은 OPEN 상태
-                    except:
-                        is_closed = False
-                
-                if is_closed:
-                    disconnected_clients.add(client)
-                    continue
-                    
-                # 메시지 전송 (타임아웃 설정)
-                await asyncio.wait_for(client.send(message), timeout=1.0)
-                
-            except (websockets.exceptions.ConnectionClosed, ConnectionResetError, asyncio.TimeoutError):
-                disconnected_clients.add(client)
-            except OSError as e:
-                # Handle Windows-specific OS errors
-                if e.errno in (995, 10054):  # WinError 995 or WSAECONNRESET
-                    pass
-                disconnected_clients.add(client)
-            except Exception as e:
-                logger.error(f"Error sending message to client: {e}")
-                disconnected_clients.add(client)
+        message는 이미 직렬화된 JSON이어야 한다 (가능하면 json_dumps의 bytes를 그대로 전달).
+        각 연결의 전송 버퍼에 바로 기록한다 (클라이언트별 await 없음).
+        닫힌 연결은 건너뛰며, 정리는 _reap_dead_clients 태스크가 담당한다.
+        """
+        if not self.clients:
+            return
+        # bytes(orjson 출력)는 디코딩 없이 text 프레임으로 전송
+        _broadcast_text(self.clients, message if isinstance(message, bytes) else message.encode('utf-8'))
+
+    def _broadcast_frames(self, frames: List[bytes], binaries: Optional[List[Optional[bytes]]] = None) -> None:
+        """Broadcast several encoded messages produced in the same tick.
+
+        {"type":"capabilities","multi":true}를 보낸 클라이언트는 {"type":"multi","items":[...]} 한 프레임으로,
+        나머지 클라이언트는 기존처럼 메시지마다 한 프레임씩 받는다.
+        binaries는 frames와 같은 길이의 리스트로, binary 프레임을 요청한 클라이언트는 값이 있는 메시지를
+        binary 프레임으로, 나머지 메시지는 text로 하나씩 받는다.
+        """
+        clients = self.clients
+        if not clients:
+            return
+        if binaries is not None and any(binary is not None for binary in binaries):
+            binary_clients = [client for client in self._binary_frame_ws if client in clients]
+            if binary_clients:
+                for frame, binary in zip(frames, binaries):
+                    if binary is not None:
+                        _broadcast_frame(binary_clients, binary, binary=True)
+                    else:
+                        _broadcast_text(binary_clients, frame)
+                clients = clients.difference(binary_clients)
+                if not clients:
+                    return
+        multi_clients = [client for client in self._multi_frame_ws if client in clients]
+        legacy_clients = clients.difference(multi_clients) if multi_clients else clients
+        if legacy_clients:
+            for frame in frames:
+                _broadcast_text(legacy_clients, frame)
+        if multi_clients:
+            if len(frames) == 1:
+                _broadcast_text(multi_clients, frames[0])
+            else:
+                _broadcast_text(multi_clients, b'{"type":"multi","items":[' + b','.join(frames) + b']}')
 
-        # 연결이 끊어진 클라이언트 정리
-        for client in disconnected_clients:
-            if client in self.clients:
-                self.clients.remove(client)
-                # 구독 정보도 정리
-                if client in self.client_subscriptions:
-                    del self.client_subscriptions[client]
-                try:
-                    if not getattr(client, 'closed', False):
-                        await client.close(code=1000, reason="Client cleanup")
-                except Exception:
-                    pass
+    async def _reap_dead_clients(self):
+        """Periodically drop clients that were marked dead by a failed send.
 
-    async def broadcast_priority(self, message: str):
-        """Priority broadcast for critical messages like monitoring_metrics with longer timeout."""
+        정상 종료된 연결은 handle_client에서 바로 제거되고, websockets.broadcast는
+        닫힌 연결을 건너뛰므로 표시된 클라이언트가 없으면 아무 작업도 하지 않는다.
+        """
+        while True:
+            await asyncio.sleep(CLIENT_REAP_INTERVAL)
+            if not self._dead_clients:
+                continue
+            dead_clients, self._dead_clients = self._dead_clients, set()
+            self.clients.difference_update(dead_clients)
+            for client in dead_clients:
+                self.client_subscriptions.pop(client, None)
+            # 아직 열려 있는 연결은 동시에 닫아, 응답 없는 연결의 close 타임아웃이 누적되지 않도록 한다
+            closing = [client.close(code=1000, reason="Client cleanup")
+                       for client in dead_clients if client.state is State.OPEN]
+            if closing:
+                await asyncio.gather(*closing, return_exceptions=True)
+            logger.info("Reaped %d dead client connection(s)", len(dead_clients))
+
+    async def broadcast_priority(self, message: Union[str, bytes]):
+        """Priority broadcast for critical messages like monitoring_metrics with longer timeout.
+
+        message는 이미 직렬화된 JSON (str 또는 UTF-8 bytes), 전송 전에 한 번만 bytes로 인코딩한다.
+        """
         logger.info(f"[PRIORITY_BROADCAST] Starting priority broadcast to {len(self.clients)} clients")
         
         if not self.clients:
             logger.warning(f"[PRIORITY_BROADCAST] No clients connected, skipping broadcast")
             return
 
-        # 연결이 끊어진 클라이언트를 추적
-        disconnected_clients = set()
-        
-        # 클라이언트 목록을 복사하여 순회 중 수정 방지
-        clients_copy = list(self.clients)
+        # 이미 닫힌 연결은 전송 없이 정리 대상으로 표시
+        open_clients = [client for client in self.clients if client.state is State.OPEN]
+        disconnected_clients = self.clients.difference(open_clients)
 
-        # 각 클라이언트에 메시지 전송 시도 (더 긴 타임아웃)
-        for client in clients_copy:
-            try:
-                # 클라이언트 연결 상태 확인 (Windows 호환성)
-                is_closed = getattr(client, 'closed', None)
-                if is_closed is None:
-                    # closed 속성이 없는 경우 state로 확인
-                    try:
-                        state = getattr(client, 'state', None)
-                        is_closed = state is None or state != 1  # 1은 OPEN 상태
-                    except:
-                        is_closed = False
-                
-                if is_closed:
-                    disconnected_clients.add(client)
-                    continue
-                    
-                # 우선순위 메시지는 더 긴 타임아웃 (5초)
-                await asyncio.wait_for(client.send(message), timeout=5.0)
+        # str을 클라이언트마다 인코딩하지 않도록 한 번만 bytes로 만들어 text 프레임으로 전송
+        data = message.encode('utf-8') if isinstance(message, str) else message
+        # 모든 클라이언트에 동시에 전송 (우선순위 메시지는 더 긴 타임아웃 5초), 실패는 전송 후 한 번에 처리
+        results = await asyncio.gather(
+            *(asyncio.wait_for(client.send(data, text=True), timeout=5.0) for client in open_clients),
+            return_exceptions=True
+        )
+        for client, result in zip(open_clients, results):
+            if result is None:
                 logger.info(f"[PRIORITY_BROADCAST] Successfully sent to client {getattr(client, 'remote_address', 'unknown')}")
-                
-            except (websockets.exceptions.ConnectionClosed, ConnectionResetError):
-                disconnected_clients.add(client)
-            except asyncio.TimeoutError:
+            elif isinstance(result, asyncio.TimeoutError):
                 # 타임아웃이 발생해도 클라이언트를 제거하지 않음 (중요한 메시지이므로)
+                # TimeoutError는 OSError의 하위 클래스이므로 먼저 확인
                 logger.warning(f"Priority message timeout for client {getattr(client, 'remote_address', 'unknown')}")
-            except OSError as e:
-                # Handle Windows-specific OS errors
-                if e.errno in (995, 10054):  # WinError 995 or WSAECONNRESET
-                    pass
+            elif isinstance(result, (websockets.exceptions.ConnectionClosed, ConnectionResetError, OSError)):
+                # OSError에는 Windows 전용 오류(WinError 995, WSAECONNRESET)도 포함
                 disconnected_clients.add(client)
-            except Exception as e:
-                logger.error(f"Error sending priority message to client: {e}")
+            else:
                 # 우선순위 메시지에서는 연결 에러가 아닌 경우 클라이언트를 제거하지 않음
+                logger.error(f"Error sending priority message to client: {result}")
 
-        # 실제 연결 에러가 발생한 클라이언트만 정리
-        for client in disconnected_clients:
-            if client in self.clients:
-                self.clients.remove(client)
-                # 구독 정보도 정리
-                if client in self.client_subscriptions:
-                    del self.client_subscriptions[client]
-                try:
-                    if not getattr(client, 'closed', False):
-                        await client.close(code=1000, reason="Client cleanup")
-                except Exception:
-                    pass
+        # 실제 연결 에러가 발생한 클라이언트만 정리 대상으로 표시
+        if disconnected_clients:
+            self._dead_clients.update(disconnected_clients)
 
-    async def broadcast_to_channel(self, channel: str, message: str):
-        """특정 채널을 구독한 클라이언트에게만 브로드캐스트"""
+    async def broadcast_to_channel(self, channel: str, message: Union[str, bytes]):
+        """특정 채널을 구독한 클라이언트에게만 브로드캐스트 (message는 이미 직렬화된 JSON)"""
         if not self.clients:
             return
 
@@ -2080,39 +2219,23 @@ class WebSocketServer:
         if not subscribed_clients:
             return
         
-        disconnected_clients = []
-        
-        for client in subscribed_clients:
-            try:
-                # Check if client is still connected
-                is_closed = getattr(client, 'closed', None)
-                if is_closed is None:
-                    try:
-                        state = getattr(client, 'state', None)
-                        is_closed = state is None or state != 1
-                    except:
-                        is_closed = False
-                
-                if is_closed:
-                    disconnected_clients.append(client)
-                    continue
-                
-                await asyncio.wait_for(client.send(message), timeout=1.0)
-                
-            except (websockets.exceptions.ConnectionClosed, Exception):
-                disconnected_clients.append(client)
+        open_clients = [client for client in subscribed_clients if client.state is State.OPEN]
+        disconnected_clients = [client for client in subscribed_clients if client.state is not State.OPEN]
+
+        # str을 클라이언트마다 인코딩하지 않도록 한 번만 bytes로 만들어 text 프레임으로 전송
+        data = message.encode('utf-8') if isinstance(message, str) else message
+        # 구독 클라이언트에 동시에 전송하고, 실패한 연결은 전송이 모두 끝난 뒤 한 번에 표시
+        results = await asyncio.gather(
+            *(asyncio.wait_for(client.send(data, text=True), timeout=1.0) for client in open_clients),
+            return_exceptions=True
+        )
+        disconnected_clients.extend(
+            client for client, result in zip(open_clients, results) if isinstance(result, Exception)
+        )
         
-        # Remove disconnected clients
-        for client in disconnected_clients:
-            if client in self.clients:
-                self.clients.remove(client)
-            if client in self.client_subscriptions:
-                del self.client_subscriptions[client]
-            try:
-                if not getattr(client, 'closed', False):
-                    await client.close(code=1000, reason="Client cleanup")
-            except Exception:
-                pass
+        # Mark disconnected clients for the reaper
+        if disconnected_clients:
+            self._dead_clients.update(disconnected_clients)
 
     def get_connected_clients(self) -> int:
         """Get the number of currently connected clients"""
@@ -2131,13 +2254,12 @@ class WebSocketServer:
 
     async def _broadcast_bluetooth_status(self, is_available: bool):
         """블루투스 상태를 모든 클라이언트에게 전달합니다."""
-        await self.broadcast_event(EventType.BLUETOOTH_STATUS, {
-            "available": is_available,
-            "message": "Bluetooth is available" if is_available else "Bluetooth is turned off"
-        })
+        await self.broadcast(_BLUETOOTH_STATUS_FRAMES[bool(is_available)])
 
     def register_device(self, device_info: dict) -> bool:
-        return self.device_registry.register_device(device_info)
+        registered = self.device_registry.register_device(device_info)
+        self._status_dirty.set()
+        return registered
 
     def unregister_device(self, address: str) -> bool:
         # 현재 연결된 디바이스인 경우 연결 해제
@@ -2160,7 +2282,9 @@ class WebSocketServer:
                     asyncio.create_task(coro)
                 else:
                     loop.run_until_complete(self.device_manager.disconnect())
-        return self.device_registry.unregister_device(address)
+        unregistered = self.device_registry.unregister_device(address)
+        self._status_dirty.set()
+        return unregistered
 
     def get_registered_devices(self):
         return self.device_registry.get_registered_devices()
@@ -2179,7 +2303,7 @@ class WebSocketServer:
             "ppg_sampling_rate": streaming_status['sensor_details']['ppg']['sampling_rate'],
             "acc_sampling_rate": streaming_status['sensor_details']['acc']['sampling_rate'],
             "bat_sampling_rate": streaming_status['sensor_details']['bat']['sampling_rate'],
-            "bat_level": self.device_sampling_stats.get('bat_level', 0),
+            "bat_level": self.bat_level,
             # 추가 정보
             "active_sensors": streaming_status['active_sensors'],
             "data_flow_health": streaming_status['data_flow_health'],
@@ -2223,44 +2347,29 @@ class WebSocketServer:
 
     def get_device_status(self):
         try:
-            logger.info("get_device_status called")
+            # 모니터링 루프와 프론트엔드가 주기적으로 호출하므로 호출마다 INFO 로그를 남기지 않음
             info = self.device_manager.get_device_info()
-            logger.info(f"device_info: {info}")
+            logger.debug("get_device_status: device_info=%s", info)
             status = {}
 
             if info:
-                logger.info("Device info exists, getting stream status")
-                
-                # Check if streaming is active and we have actual sampling data
-                stream_status = self.get_stream_status()
-                logger.info(f"stream_status: {stream_status}")
-                
                 # Determine if we should use actual rates or expected rates
-                has_actual_eeg_rate = (self.is_streaming and 
-                                     self.device_sampling_stats.get('eeg', {}).get('samples_per_sec', 0) > 0)
-                has_actual_ppg_rate = (self.is_streaming and 
-                                     self.device_sampling_stats.get('ppg', {}).get('samples_per_sec', 0) > 0)
-                has_actual_acc_rate = (self.is_streaming and 
-                                     self.device_sampling_stats.get('acc', {}).get('samples_per_sec', 0) > 0)
-                has_actual_bat_rate = (self.is_streaming and 
-                                     self.device_sampling_stats.get('bat', {}).get('samples_per_sec', 0) > 0)
-                
-                # Expected sampling rates for Link Band devices when connected but not streaming
-                expected_rates = {
-                    'eeg': 250.0,  # EEG expected rate
-                    'ppg': 50.0,   # PPG expected rate  
-                    'acc': 30.0,   # ACC expected rate
-                    'bat': 1.0     # Battery expected rate
-                }
+                sampling_stats = self.device_sampling_stats
+                has_actual_eeg_rate = self.is_streaming and sampling_stats['eeg'].samples_per_sec > 0
+                has_actual_ppg_rate = self.is_streaming and sampling_stats['ppg'].samples_per_sec > 0
+                has_actual_acc_rate = self.is_streaming and sampling_stats['acc'].samples_per_sec > 0
+                has_actual_bat_rate = self.is_streaming and sampling_stats['bat'].samples_per_sec > 0
                 
                 # Use actual rates if available and streaming, otherwise use expected rates
-                eeg_rate = self.device_sampling_stats.get('eeg', {}).get('samples_per_sec', expected_rates['eeg']) if has_actual_eeg_rate else expected_rates['eeg']
-                ppg_rate = self.device_sampling_stats.get('ppg', {}).get('samples_per_sec', expected_rates['ppg']) if has_actual_ppg_rate else expected_rates['ppg']
-                acc_rate = self.device_sampling_stats.get('acc', {}).get('samples_per_sec', expected_rates['acc']) if has_actual_acc_rate else expected_rates['acc']
-                bat_rate = self.device_sampling_stats.get('bat', {}).get('samples_per_sec', expected_rates['bat']) if has_actual_bat_rate else expected_rates['bat']
+                expected_rates = EXPECTED_SAMPLING_RATES
+                eeg_rate = sampling_stats['eeg'].samples_per_sec if has_actual_eeg_rate else expected_rates['eeg']
+                ppg_rate = sampling_stats['ppg'].samples_per_sec if has_actual_ppg_rate else expected_rates['ppg']
+                acc_rate = sampling_stats['acc'].samples_per_sec if has_actual_acc_rate else expected_rates['acc']
+                bat_rate = sampling_stats['bat'].samples_per_sec if has_actual_bat_rate else expected_rates['bat']
                 
                 # For battery level, try to get actual level or use null
-                battery_level = stream_status.get('bat_level', 0)
+                # get_stream_status()와 같은 값 (스트리밍 모니터 상태 계산 없이 직접 읽음)
+                battery_level = self.bat_level
                 if battery_level == 0 and not has_actual_bat_rate:
                     # Try to get battery level from device manager if available
                     if hasattr(self.device_manager, 'battery_level') and self.device_manager.battery_level is not None:
@@ -2280,10 +2389,8 @@ class WebSocketServer:
                     "bat_sampling_rate": bat_rate
                 }
                 
-                logger.info(f"Final status: {status}")
-                logger.info(f"Streaming active: {self.is_streaming}, Using actual rates: EEG={has_actual_eeg_rate}, PPG={has_actual_ppg_rate}, ACC={has_actual_acc_rate}, BAT={has_actual_bat_rate}")
+                logger.debug("get_device_status: %s (streaming=%s)", status, self.is_streaming)
             else:
-                logger.info("No device info, returning disconnected status")
                 status = {
                     "is_connected": False,
                     "device_address": None,
@@ -2316,7 +2423,7 @@ class WebSocketServer:
         client_id = str(uuid.uuid4())
         try:
             await websocket.accept()
-            self.connected_clients[client_id] = websocket
+            self._register_fastapi_client(client_id, websocket)
             ws_logger = get_websocket_logger(__name__)
             ws_logger.info(f"[{LogTags.WEBSOCKET_SERVER}:{LogTags.CONNECT}] WebSocket client connected", 
                           extra={"client_id": client_id})
@@ -2326,7 +2433,7 @@ class WebSocketServer:
 
             while True:
                 try:
-                    data = await websocket.receive_json()
+                    data = json_loads(await websocket.receive_text())
                     await self.handle_fastapi_client_message(client_id, websocket, data)
                 except WebSocketDisconnect:
                     break
@@ -2339,14 +2446,14 @@ class WebSocketServer:
         except Exception as e:
             logger.error(f"Error in websocket connection for client {client_id}: {e}")
         finally:
-            await self.handle_client_disconnect(client_id)
+            self.handle_client_disconnect(client_id)
 
     async def handle_processed_websocket_connection(self, websocket: WebSocket):
         """Handle WebSocket connections for processed data."""
         client_id = str(uuid.uuid4())
         try:
             await websocket.accept()
-            self.connected_clients[client_id] = websocket
+            self._register_fastapi_client(client_id, websocket)
             ws_logger = get_websocket_logger(__name__)
             ws_logger.info(f"[{LogTags.WEBSOCKET_SERVER}:{LogTags.CONNECT}] Processed data client connected", 
                           extra={"client_id": client_id})
@@ -2354,10 +2461,10 @@ class WebSocketServer:
             # Add data callback for this client
             async def data_callback(data: Dict[str, Any]):
                 try:
-                    await websocket.send_json(data)
+                    await websocket.send_text(json_dumps_text(data))
                 except Exception as e:
                     logger.error(f"Error sending processed data to client {client_id}: {e}")
-                    await self.handle_client_disconnect(client_id)
+                    self.handle_client_disconnect(client_id)
 
             self.stream_engine.add_data_callback(data_callback)
 
@@ -2374,7 +2481,7 @@ class WebSocketServer:
             logger.error(f"Error in processed websocket connection for client {client_id}: {e}")
         finally:
             self.stream_engine.remove_data_callback(data_callback)
-            await self.handle_client_disconnect(client_id)
+            self.handle_client_disconnect(client_id)
 
     async def handle_fastapi_client_message(self, client_id: str, websocket: WebSocket, data: Dict[str, Any]):
         """Handle incoming messages from FastAPI clients."""
@@ -2383,8 +2490,7 @@ class WebSocketServer:
             if isinstance(data, str):
                 # 문자열인 경우 JSON 파싱 시도
                 try:
-                    import json
-                    data = json.loads(data)
+                    data = json_loads(data)
                 except json.JSONDecodeError:
                     ws_logger = get_websocket_logger(__name__)
                     ws_logger.error(f"[{LogTags.WEBSOCKET_SERVER}:{LogTags.ERROR}] Invalid JSON string", 
@@ -2424,7 +2530,7 @@ class WebSocketServer:
                         "channel": channel,
                         "timestamp": time.time()
                     }
-                    await websocket.send_json(confirmation_message)
+                    await websocket.send_text(json_dumps_text(confirmation_message))
                     logger.info(f"[FASTAPI_WS_SUBSCRIBE] Confirmation sent to client {client_id}")
                 else:
                     logger.warning(f"[FASTAPI_WS_SUBSCRIBE] Subscribe message missing channel from client {client_id}")
@@ -2444,15 +2550,29 @@ class WebSocketServer:
                         "channel": channel,
                         "timestamp": time.time()
                     }
-                    await websocket.send_json(confirmation_message)
+                    await websocket.send_text(json_dumps_text(confirmation_message))
                     logger.info(f"[FASTAPI_WS_UNSUBSCRIBE] Unsubscription confirmed for client {client_id}")
                 return
             
+            # 클라이언트 수신 기능 설정 (예: {"type": "capabilities", "multi": true})
+            if message_type == 'capabilities':
+                if data.get('multi'):
+                    self._multi_frame_clients.add(client_id)
+                else:
+                    self._multi_frame_clients.discard(client_id)
+                await websocket.send_text(json_dumps_text({
+                    "type": "capabilities_confirmed",
+                    "multi": client_id in self._multi_frame_clients,
+                    "timestamp": time.time()
+                }))
+                return
+            
             # health_check는 로그하지 않음 (너무 빈번함)
             if data.get('command') != 'health_check':
                 ws_logger = get_websocket_logger(__name__)
-                ws_logger.debug(f"[{LogTags.WEBSOCKET_SERVER}] Client message", 
-                               extra={"client_id": client_id, "command": data.get('command', 'unknown')})
+                if ws_logger.isEnabledFor(logging.DEBUG):
+                    ws_logger.debug("[%s] Client message", LogTags.WEBSOCKET_SERVER,
+                                   extra={"client_id": client_id, "command": data.get('command', 'unknown')})
         except Exception as e:
             ws_logger = get_websocket_logger(__name__)
             ws_logger.error(f"[{LogTags.WEBSOCKET_SERVER}:{LogTags.ERROR}] Client message error", 
@@ -2480,82 +2600,151 @@ class WebSocketServer:
             # Process the data
             processed_data = await self.signal_processor.process_data(data)
             
-            # Broadcast processed data
-            await self.broadcast_event(EventType.DATA_RECEIVED, processed_data)
+            # Broadcast processed data (한 번만 직렬화, 수신자가 없으면 건너뜀 - 녹화 전용 모드)
+            if self.clients or self._client_queues:
+                payload = _event_frame(EventType.DATA_RECEIVED, processed_data)
+                await self.broadcast(payload)
+                await self._broadcast_bytes(payload)
             
-            # Update stream engine stats
+            # Update stream engine stats (지역 변수 + 위치 인자로 한 번에 호출)
+            get = data.get
             self.stream_engine.update_stats(
-                eeg=len(data.get('eeg', [])),
-                ppg=len(data.get('ppg', [])),
-                acc=len(data.get('acc', [])),
-                bat=len(data.get('battery', [])),
-                bat_level=data.get('battery_level')
+                len(get('eeg', _EMPTY)),
+                len(get('ppg', _EMPTY)),
+                len(get('acc', _EMPTY)),
+                len(get('battery', _EMPTY)),
+                get('battery_level')
             )
 
         except Exception as e:
-            logger.error(f"Error handling data from client {client_id}: {e}")
+            logger.error("Error handling data from client %s: %s", client_id, e)
             await self.broadcast_event(EventType.ERROR, {"error": str(e)})
 
-    async def handle_client_disconnect(self, client_id: str):
-        """Handle client disconnection."""
-        if client_id in self.connected_clients:
-            del self.connected_clients[client_id]
-            
+    def handle_client_disconnect(self, client_id: str):
+        """Handle client disconnection (synchronous: nothing here awaits)."""
+        self._client_queues.pop(client_id, None)
+        self._multi_frame_clients.discard(client_id)
+        writer = self._client_writers.pop(client_id, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        if self.connected_clients.pop(client_id, None) is not None:
             # FastAPI 구독 정보도 정리
-            if hasattr(self, 'fastapi_client_subscriptions') and client_id in self.fastapi_client_subscriptions:
-                del self.fastapi_client_subscriptions[client_id]
-                logger.info(f"[FASTAPI_WS_DISCONNECT] Cleaned up subscriptions for client {client_id}")
+            if hasattr(self, 'fastapi_client_subscriptions') and self.fastapi_client_subscriptions.pop(client_id, None) is not None:
+                logger.info("[FASTAPI_WS_DISCONNECT] Cleaned up subscriptions for client %s", client_id)
             
             ws_logger = get_websocket_logger(__name__)
-            ws_logger.info(f"[{LogTags.WEBSOCKET_SERVER}:{LogTags.DISCONNECT}] WebSocket client disconnected", 
+            ws_logger.info("[%s:%s] WebSocket client disconnected", LogTags.WEBSOCKET_SERVER, LogTags.DISCONNECT,
                           extra={"client_id": client_id})
 
+    def _register_fastapi_client(self, client_id: str, websocket: WebSocket):
+        """FastAPI 클라이언트를 등록하고 전용 송신 큐/writer 태스크를 생성"""
+        self.connected_clients[client_id] = websocket
+        queue = asyncio.Queue(maxsize=CLIENT_SEND_QUEUE_SIZE)
+        self._client_queues[client_id] = queue
+        self._client_writers[client_id] = asyncio.create_task(self._client_writer(client_id, websocket, queue))
+
+    async def _client_writer(self, client_id: str, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain a client's send queue so a slow client never blocks the broadcaster."""
+        try:
+            while True:
+                message = await queue.get()
+                if client_id in self._multi_frame_clients and not queue.empty():
+                    # 밀린 메시지를 {"type":"multi","items":[...]} 한 프레임으로 합쳐 전송 (재직렬화 없이 문자열 결합)
+                    drained = [message]
+                    while not queue.empty() and len(drained) < MULTI_FRAME_MAX_ITEMS:
+                        drained.append(queue.get_nowait())
+                    message = '{"type":"multi","items":[' + ','.join(drained) + ']}'
+                await websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Error sending data to client %s: %s", client_id, e)
+        self.handle_client_disconnect(client_id)
+
+    async def _broadcast_bytes(self, payload: bytes):
+        """Queue a pre-encoded JSON payload for every FastAPI WebSocket client."""
+        if not self._client_queues:
+            return
+        # 프론트엔드는 JSON.parse(event.data)를 사용하므로 binary가 아닌 text 프레임으로 전송
+        self._enqueue_for_fastapi(payload.decode('utf-8'))
+
+    def _enqueue_for_fastapi(self, text: str, client_ids: Optional[List[str]] = None) -> int:
+        """Put an encoded JSON text message on FastAPI clients' send queues (all clients, or only client_ids).
+
+        전송은 클라이언트별 _client_writer 태스크가 담당하므로 같은 소켓에 동시에 send하지 않는다.
+        Returns the number of client queues the message was put on.
+        """
+        if client_ids is None:
+            queues = self._client_queues.values()
+        else:
+            queues = [self._client_queues[client_id] for client_id in client_ids if client_id in self._client_queues]
+        for queue in queues:
+            try:
+                queue.put_nowait(text)
+            except asyncio.QueueFull:
+                # 느린 클라이언트: 가장 오래된 메시지를 버리고 최신 메시지 유지
+                queue.get_nowait()
+                queue.put_nowait(text)
+        return len(queues)
+
     async def send_to_client(self, client_id: str, data: Dict[str, Any]):
         """Send data to a specific client."""
-        if client_id in self.connected_clients:
+        websocket = self.connected_clients.get(client_id)
+        if websocket is not None:
             try:
-                await self.connected_clients[client_id].send_json(data)
+                await websocket.send_text(json_dumps_text(data))
             except Exception as e:
-                logger.error(f"Error sending data to client {client_id}: {e}")
-                await self.handle_client_disconnect(client_id)
+                logger.error("Error sending data to client %s: %s", client_id, e)
+                self.handle_client_disconnect(client_id)
 
     async def send_status(self, websocket: WebSocket):
         """Send current status to a client."""
-        status = {
-            'type': 'status',
-            'timestamp': time.time(),
-            'data': {
-                'connected_devices': 1 if self.device_manager.is_connected() else 0,
-                'connected_clients': len(self.connected_clients),
-                'stream_engine_status': getattr(self, 'stream_engine', {}).get_status() if hasattr(self, 'stream_engine') else {}
-            }
-        }
-        await websocket.send_json(status)
+        engine_status = json_dumps_text(self.stream_engine.get_status()) if hasattr(self, 'stream_engine') else '{}'
+        await websocket.send_text(_STATUS_TEMPLATE % (
+            time.time(),
+            1 if self.device_manager.is_connected() else 0,
+            len(self.connected_clients),
+            engine_status
+        ))
 
     def add_event_callback(self, event_type: str, callback: Callable):
         """Add a callback for a specific event type."""
-        if event_type in self.event_callbacks:
-            self.event_callbacks[event_type].append(callback)
+        callbacks = self.event_callbacks.get(event_type)
+        if callbacks is not None:
+            self.event_callbacks[event_type] = callbacks + (callback,)
 
     def remove_event_callback(self, event_type: str, callback: Callable):
         """Remove a callback for a specific event type."""
-        if event_type in self.event_callbacks and callback in self.event_callbacks[event_type]:
-            self.event_callbacks[event_type].remove(callback)
+        callbacks = self.event_callbacks.get(event_type)
+        if callbacks and callback in callbacks:
+            index = callbacks.index(callback)
+            self.event_callbacks[event_type] = callbacks[:index] + callbacks[index + 1:]
 
     async def start(self):
         """Start the WebSocket server."""
+        # Python 3.12+: 곧바로 끝나는 코루틴(큐 put, 작은 send 등)은 스케줄러 왕복 없이 즉시 실행
+        eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+        if eager_task_factory is not None:
+            loop = asyncio.get_running_loop()
+            if loop.get_task_factory() is None:
+                loop.set_task_factory(eager_task_factory)
+                logger.info("Eager task factory enabled for the event loop")
         if not self.server:
             await self.initialize()
+        else:
+            # stop() 이후 다시 시작된 경우 initialize()를 건너뛰므로 drain 태스크만 다시 시작
+            self._start_processed_drain()
         # WebSocket 서버 시작 로그는 main.py에서 출력됨
 
     async def stop(self):
         """Stop the WebSocket server."""
         # Remove callback before stopping
         self.device_manager.remove_processed_data_callback(self._handle_processed_data)
+        self._stop_processed_drain()
         
         # Cleanup connections
         for client_id in list(self.connected_clients.keys()):
-            await self.handle_client_disconnect(client_id)
+            self.handle_client_disconnect(client_id)
         
         # Stop stream engine
         if hasattr(self, 'stream_engine'):
@@ -2566,26 +2755,66 @@ class WebSocketServer:
     async def _handle_processed_data(self, data_type: str, processed_data: dict):
         """Handle processed data from device manager"""
         try:
-            # Raw data 직접 브로드캐스트 처리
-            if data_type == "raw_data_broadcast":
-                # 클라이언트가 기대하는 raw_data 형식으로 직접 브로드캐스트
-                await self.broadcast(json.dumps(processed_data))
-                return
-            
-            # Processed data 직접 브로드캐스트 처리
-            if data_type == "processed_data_broadcast":
-                # 클라이언트가 기대하는 processed_data 형식으로 직접 브로드캐스트
-                await self.broadcast(json.dumps(processed_data))
+            # 연결된 클라이언트가 없으면 payload를 만들지 않음
+            if not (self.clients or self._client_queues):
                 return
-            
-            # 기존 event 방식 (하위 호환성)
-            await self.broadcast_event(EventType.DATA_RECEIVED, {
-                'type': data_type,
-                'data': processed_data,
-                'timestamp': time.time()
-            })
+            # raw_data_broadcast / processed_data_broadcast는 클라이언트가 기대하는 형식 그대로 브로드캐스트
+            if data_type in _PASSTHROUGH_DATA_TYPES:
+                payload = json_dumps(processed_data)
+            else:
+                # 기존 event 방식 (하위 호환성)
+                payload = _data_received_frame(data_type, processed_data, time.time())
+            # binary 프레임을 요청한 연결이 있을 때만 raw 데이터를 float32 binary로 추가 인코딩
+            binary = None
+            if data_type == "raw_data_broadcast" and len(self._binary_frame_ws):
+                binary = _raw_binary_frame(processed_data)
+            # 한 번 직렬화한 payload를 큐에 넣고 전송은 drain 태스크가 묶어서 처리
+            item = (payload, binary)
+            try:
+                self._processed_queue.put_nowait(item)
+            except asyncio.QueueFull:
+                # 전송이 밀리면 가장 오래된 메시지를 버리고 최신 메시지 유지
+                self._processed_queue.get_nowait()
+                self._processed_queue.put_nowait(item)
         except Exception as e:
-            logger.error(f"Error handling processed data: {e}")
+            logger.error("Error handling processed data: %s", e)
+
+    async def _drain_processed_data(self):
+        """Forward queued device payloads, sending everything already queued in one pass.
+
+        multi 프레임을 요청한 클라이언트는 묶음을 {"type":"multi","items":[...]} 한 프레임으로 받고,
+        binary 프레임을 요청한 클라이언트는 raw 데이터를 binary 프레임으로 (그 외 메시지는 text로) 받으며,
+        나머지 클라이언트는 기존처럼 메시지를 하나씩 받는다.
+        """
+        queue = self._processed_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < PROCESSED_BATCH_MAX_ITEMS and not queue.empty():
+                batch.append(queue.get_nowait())
+            payloads = [payload for payload, _ in batch]
+            try:
+                if self.clients:
+                    clients = self.clients
+                    binary_clients = [client for client in self._binary_frame_ws if client in clients]
+                    if binary_clients:
+                        for payload, binary in batch:
+                            if binary is not None:
+                                _broadcast_frame(binary_clients, binary, binary=True)
+                            else:
+                                _broadcast_text(binary_clients, payload)
+                        clients = clients.difference(binary_clients)
+                    multi_clients = [client for client in self._multi_frame_ws if client in clients]
+                    legacy_clients = clients.difference(multi_clients) if multi_clients else clients
+                    if legacy_clients:
+                        for payload in payloads:
+                            _broadcast_text(legacy_clients, payload)
+                    if multi_clients:
+                        _broadcast_text(multi_clients, b'{"type":"multi","items":[' + b','.join(payloads) + b']}')
+                if self._client_queues:
+                    for payload in payloads:
+                        self._enqueue_for_fastapi(payload.decode('utf-8'))
+            except Exception as e:
+                logger.error("Error broadcasting processed data batch: %s", e)
 
     # 에러 핸들링이 강화된 로버스트 스트리밍 함수들
     async def stream_eeg_data_robust(self):
@@ -2649,19 +2878,9 @@ class WebSocketServer:
         # 데이터 레코딩
         if self.data_recorder and self.data_recorder.is_recording:
             if eeg_buffer:
-                for sample in eeg_buffer:
-                    if isinstance(sample, dict):
-                        self.data_recorder.add_data(
-                            data_type=f"{device_id_for_filename}_eeg_raw",
-                            data=sample
-                        )
+                self.data_recorder.add_many(f"{device_id_for_filename}_eeg_raw", eeg_buffer)
             if processed_data:
-                for sample in processed_data:
-                    if isinstance(sample, dict):
-                        self.data_recorder.add_data(
-                            data_type=f"{device_id_for_filename}_eeg_processed",
-                            data=sample
-                        )
+                self.data_recorder.add_many(f"{device_id_for_filename}_eeg_processed", processed_data)
         
         # WebSocket 브로드캐스트
         if eeg_buffer:
@@ -2675,7 +2894,7 @@ class WebSocketServer:
                 "timestamp": current_time,
                 "data": eeg_buffer
             }
-            await self.broadcast(json.dumps(raw_message))
+            await self.broadcast(json_dumps_text(raw_message))
         
         if processed_data:
             processed_message = {
@@ -2685,7 +2904,7 @@ class WebSocketServer:
                 "timestamp": current_time,
                 "data": processed_data
             }
-            await self.broadcast(json.dumps(processed_message))
+            await self.broadcast(json_dumps_text(processed_message))
 
     async def _stream_ppg_data_core(self):
         """PPG 스트리밍 핵심 로직"""
@@ -2712,19 +2931,9 @@ class WebSocketServer:
         if self.data_recorder and self.data_recorder.is_recording:
             logger.info(f"[STREAM_PPG_DEBUG] Recording PPG data - Raw: {len(raw_data) if raw_data else 0}, Processed: {len(processed_data) if processed_data else 0}")
             if raw_data:
-                for sample in raw_data:
-                    if isinstance(sample, dict):
-                        self.data_recorder.add_data(
-                            data_type=f"{device_id_for_filename}_ppg_raw",
-                            data=sample
-                        )
+                self.data_recorder.add_many(f"{device_id_for_filename}_ppg_raw", raw_data)
             if processed_data:
-                for sample in processed_data:
-                    if isinstance(sample, dict):
-                        self.data_recorder.add_data(
-                            data_type=f"{device_id_for_filename}_ppg_processed",
-                            data=sample
-                        )
+                self.data_recorder.add_many(f"{device_id_for_filename}_ppg_processed", processed_data)
         
         # WebSocket 브로드캐스트
         if raw_data:
@@ -2738,7 +2947,7 @@ class WebSocketServer:
                 "timestamp": current_time,
                 "data": raw_data
             }
-            await self.broadcast(json.dumps(raw_message))
+            await self.broadcast(json_dumps_text(raw_message))
         
         if processed_data:
             processed_message = {
@@ -2748,7 +2957,7 @@ class WebSocketServer:
                 "timestamp": current_time,
                 "data": processed_data
             }
-            await self.broadcast(json.dumps(processed_message))
+            await self.broadcast(json_dumps_text(processed_message))
 
     async def _stream_acc_data_core(self):
         """ACC 스트리밍 핵심 로직"""
@@ -2775,19 +2984,9 @@ class WebSocketServer:
         if self.data_recorder and self.data_recorder.is_recording:
             logger.info(f"[STREAM_ACC_DEBUG] Recording ACC data - Raw: {len(raw_data) if raw_data else 0}, Processed: {len(processed_data) if processed_data else 0}")
             if raw_data:
-                for sample in raw_data:
-                    if isinstance(sample, dict):
-                        self.data_recorder.add_data(
-                            data_type=f"{device_id_for_filename}_acc_raw",
-                            data=sample
-                        )
+                self.data_recorder.add_many(f"{device_id_for_filename}_acc_raw", raw_data)
             if processed_data:
-                for sample in processed_data:
-                    if isinstance(sample, dict):
-                        self.data_recorder.add_data(
-                            data_type=f"{device_id_for_filename}_acc_processed",
-                            data=sample
-                        )
+                self.data_recorder.add_many(f"{device_id_for_filename}_acc_processed", processed_data)
         
         # WebSocket 브로드캐스트
         if raw_data:
@@ -2801,7 +3000,7 @@ class WebSocketServer:
                 "timestamp": current_time,
                 "data": raw_data
             }
-            await self.broadcast(json.dumps(raw_message))
+            await self.broadcast(json_dumps_text(raw_message))
         
         if processed_data:
             processed_message = {
@@ -2811,7 +3010,7 @@ class WebSocketServer:
                 "timestamp": current_time,
                 "data": processed_data
             }
-            await self.broadcast(json.dumps(processed_message))
+            await self.broadcast(json_dumps_text(processed_message))
 
     async def _stream_battery_data_core(self):
         """배터리 스트리밍 핵심 로직"""
@@ -2838,12 +3037,7 @@ class WebSocketServer:
         if self.data_recorder and self.data_recorder.is_recording:
             logger.info(f"[STREAM_BATTERY_DEBUG] Recording battery data - Buffer: {len(battery_buffer) if battery_buffer else 0}, Level: {battery_level}")
             if battery_buffer:
-                for sample in battery_buffer:
-                    if isinstance(sample, dict):
-                        self.data_recorder.add_data(
-                            data_type=f"{device_id_for_filename}_battery",
-                            data=sample
-                        )
+                self.data_recorder.add_many(f"{device_id_for_filename}_battery", battery_buffer)
         
         # WebSocket 브로드캐스트
         if battery_buffer or battery_level is not None:
@@ -2859,4 +3053,4 @@ class WebSocketServer:
                 "data": battery_buffer if battery_buffer else [],
                 "battery_level": battery_level
             }
-            await self.broadcast(json.dumps(battery_message))
+            await self.broadcast(json_dumps_text(battery_message))
@@ -7,6 +7,8 @@ import heartpy as hp
 from collections import deque
 import time
 import asyncio
+from functools import lru_cache
+from numpy.lib.stride_tricks import sliding_window_view
 
 # MNE 라이브러리 사용 가능 여부 확인
 try:
@@ -39,31 +41,40 @@ PROCESSING_INTERVALS = {
 
 
 
-def bandpass_filter(data: np.ndarray, low_freq: float, high_freq: float, fs: float = 250) -> np.ndarray:
-    """Apply bandpass filter to the input data"""
+@lru_cache(maxsize=16)
+def _bandpass_sos(low_freq: float, high_freq: float, fs: float) -> np.ndarray:
+    """Butterworth bandpass coefficients in second-order sections (cached per band/fs)"""
     nyquist = fs / 2
-    low = low_freq / nyquist
-    high = high_freq / nyquist
-    b, a = signal.butter(4, [low, high], btype='band')
-    return signal.filtfilt(b, a, data)
+    return signal.butter(4, [low_freq / nyquist, high_freq / nyquist], btype='band', output='sos')
+
+def bandpass_filter(data: np.ndarray, low_freq: float, high_freq: float, fs: float = 250) -> np.ndarray:
+    """Apply bandpass filter to the input data (1D or (channels, samples), filtered along the last axis)"""
+    return signal.sosfiltfilt(_bandpass_sos(low_freq, high_freq, fs), data, axis=-1)
+
+def _spread_window_values(window_values: np.ndarray, n_samples: int, window_size: int) -> np.ndarray:
+    """Map per-window values back to samples: each sample takes the value of the last window covering it"""
+    return window_values[np.minimum(np.arange(n_samples), n_samples - window_size)]
 
 def notch_filter(data: np.ndarray, notch_freq: float, fs: float = 250, quality_factor: float = 30.0) -> np.ndarray:
-    """Apply notch filter to remove specific frequency"""
+    """Apply notch filter to remove specific frequency (1D or (channels, samples))"""
     if not MNE_AVAILABLE:
         logger.warning("MNE not available. Using scipy notch filter instead.")
         # Fallback to scipy notch filter
         nyquist = fs / 2
         w = notch_freq / nyquist
         b, a = signal.iirnotch(w, quality_factor)
-        return signal.filtfilt(b, a, data)
+        return signal.filtfilt(b, a, data, axis=-1)
     
     try:
-        ch_names = ['ch1']
-        ch_types = ['eeg']
-        info = mne.create_info(ch_names=ch_names, sfreq=fs, ch_types=ch_types)
-        raw = mne.io.RawArray(data.reshape(1, -1), info)
-        raw.notch_filter(freqs=[notch_freq], picks='all', method='fir', phase='zero')
-        return raw.get_data()[0]
+        # 모든 채널을 하나의 RawArray로 묶어 FIR 설계/필터링을 한 번만 수행
+        channels = np.atleast_2d(data)
+        ch_names = [f'ch{i + 1}' for i in range(channels.shape[0])]
+        ch_types = ['eeg'] * channels.shape[0]
+        info = mne.create_info(ch_names=ch_names, sfreq=fs, ch_types=ch_types, verbose=False)
+        raw = mne.io.RawArray(channels, info, verbose=False)
+        raw.notch_filter(freqs=[notch_freq], picks='all', method='fir', phase='zero', verbose=False)
+        filtered = raw.get_data()
+        return filtered[0] if data.ndim == 1 else filtered
     except Exception as e:
         logger.error(f"Error applying notch filter: {e}")
         return data
@@ -122,28 +133,27 @@ class SignalProcessor:
     def calculate_amplitude_sqi(self, data: np.ndarray, threshold: float = 100) -> np.ndarray:
         """Calculate Signal Quality Index based on signal amplitude"""
         window_size = 10
-        sqi_values = np.zeros_like(data)
-        for i in range(0, len(data) - window_size + 1):
-            window = data[i:i + window_size]
-            good_samples = np.sum(np.abs(window) < threshold)
-            window_sqi = good_samples / window_size
-            sqi_values[i:i + window_size] = window_sqi
-        return sqi_values
+        if len(data) < window_size:
+            return np.zeros_like(data)
+        # 모든 슬라이딩 윈도우를 한 번에 계산 (샘플별 Python 루프 제거)
+        windows = sliding_window_view(np.abs(data) < threshold, window_size)
+        window_sqi = windows.sum(axis=-1) / window_size
+        return _spread_window_values(window_sqi, len(data), window_size)
 
     def calculate_frequency_sqi(self, data: np.ndarray, fs: float = 250, 
                               low_freq: float = 1, high_freq: float = 45) -> np.ndarray:
         """Calculate Signal Quality Index based on frequency content"""
         window_size = 50
-        sqi_values = np.zeros_like(data)
-        for i in range(0, len(data) - window_size + 1):
-            window = data[i:i + window_size]
-            freqs, psd = signal.welch(window, fs, nperseg=min(32, window_size))
-            mask = (freqs >= low_freq) & (freqs <= high_freq)
-            band_power = np.sum(psd[mask])
-            total_power = np.sum(psd)
-            window_sqi = band_power / total_power if total_power > 0 else 0
-            sqi_values[i:i + window_size] = window_sqi
-        return sqi_values
+        if len(data) < window_size:
+            return np.zeros_like(data)
+        # 윈도우별 welch 호출 대신 (windows, samples) 배열에 대해 한 번만 호출
+        windows = sliding_window_view(data, window_size)
+        freqs, psd = signal.welch(windows, fs, nperseg=min(32, window_size), axis=-1)
+        mask = (freqs >= low_freq) & (freqs <= high_freq)
+        band_power = psd[:, mask].sum(axis=-1)
+        total_power = psd.sum(axis=-1)
+        window_sqi = np.divide(band_power, total_power, out=np.zeros_like(total_power), where=total_power > 0)
+        return _spread_window_values(window_sqi, len(data), window_size)
 
     def calculate_combined_sqi(self, amplitude_sqi: np.ndarray, frequency_sqi: np.ndarray) -> np.ndarray:
         """Combine amplitude and frequency SQI"""
@@ -152,13 +162,11 @@ class SignalProcessor:
     def calculate_ppg_sqi(self, data: np.ndarray, threshold: float = 250) -> np.ndarray:
         """Calculate amplitude-based SQI for PPG"""
         window_size = 25
-        sqi_values = np.zeros_like(data)
-        for i in range(0, len(data) - window_size + 1):
-            window = data[i:i + window_size]
-            good_samples = np.sum(np.abs(window) < threshold)
-            window_sqi = good_samples / window_size
-            sqi_values[i:i + window_size] = window_sqi
-        return sqi_values
+        if len(data) < window_size:
+            return np.zeros_like(data)
+        windows = sliding_window_view(np.abs(data) < threshold, window_size)
+        window_sqi = windows.sum(axis=-1) / window_size
+        return _spread_window_values(window_sqi, len(data), window_size)
 
     @staticmethod
     def compute_band_powers(power_db, freqs, bands=None):
@@ -189,6 +197,41 @@ class SignalProcessor:
         lf_hf = lf / hf if hf > 0 else 0
         return lf, hf, lf_hf
 
+    def _filter_eeg_channels(self, ch1_data: np.ndarray, ch2_data: np.ndarray):
+        """Notch + bandpass filter both EEG channels and compute their combined SQI (runs in a worker thread)."""
+        fs = self.sampling_rate
+        # (channels, samples) 배열로 두 채널을 한 번에 필터링
+        channels = np.vstack([ch1_data, ch2_data])
+        ch1_filtered, ch2_filtered = bandpass_filter(notch_filter(channels, notch_freq=60, fs=fs), 1, 45, fs=fs)
+        ch1_sqi = self.calculate_combined_sqi(
+            self.calculate_amplitude_sqi(ch1_filtered),
+            self.calculate_frequency_sqi(ch1_filtered, fs=fs)
+        )
+        ch2_sqi = self.calculate_combined_sqi(
+            self.calculate_amplitude_sqi(ch2_filtered),
+            self.calculate_frequency_sqi(ch2_filtered, fs=fs)
+        )
+        return ch1_filtered, ch2_filtered, ch1_sqi, ch2_sqi
+
+    def _filter_ppg_signal(self, red_data: np.ndarray, sampling_rate: int):
+        """Bandpass filter the PPG signal and compute its SQI (runs in a worker thread)."""
+        filtered_ppg = hp.filter_signal(
+            red_data,
+            cutoff=[0.5, 5.0],
+            sample_rate=sampling_rate,
+            order=2,
+            filtertype='bandpass'
+        )
+        return filtered_ppg, self.calculate_ppg_sqi(filtered_ppg)
+
+    @staticmethod
+    def _compute_movement(x_data: np.ndarray, y_data: np.ndarray, z_data: np.ndarray):
+        """Per-axis ACC gradients and their magnitude (runs in a worker thread)."""
+        x_change = np.gradient(x_data)
+        y_change = np.gradient(y_data)
+        z_change = np.gradient(z_data)
+        return x_change, y_change, z_change, np.sqrt(x_change**2 + y_change**2 + z_change**2)
+
     def add_to_buffer(self, data_type: str, data: List[Dict[str, Any]]):
         """Add data to the appropriate buffer"""
         if data_type in self.buffers:
@@ -240,20 +283,10 @@ class SignalProcessor:
             # Run CPU-intensive tasks in a thread pool
             loop = asyncio.get_event_loop()
             
-            # Apply filters
-            ch1_notched = await loop.run_in_executor(None, lambda: notch_filter(ch1_data, notch_freq=60, fs=self.sampling_rate))
-            ch2_notched = await loop.run_in_executor(None, lambda: notch_filter(ch2_data, notch_freq=60, fs=self.sampling_rate))
-            
-            ch1_filtered = await loop.run_in_executor(None, lambda: bandpass_filter(ch1_notched, 1, 45, fs=self.sampling_rate))
-            ch2_filtered = await loop.run_in_executor(None, lambda: bandpass_filter(ch2_notched, 1, 45, fs=self.sampling_rate))
-            
-            # Calculate SQI
-            ch1_amplitude_sqi = await loop.run_in_executor(None, lambda: self.calculate_amplitude_sqi(ch1_filtered))
-            ch2_amplitude_sqi = await loop.run_in_executor(None, lambda: self.calculate_amplitude_sqi(ch2_filtered))
-            ch1_frequency_sqi = await loop.run_in_executor(None, lambda: self.calculate_frequency_sqi(ch1_filtered, fs=self.sampling_rate))
-            ch2_frequency_sqi = await loop.run_in_executor(None, lambda: self.calculate_frequency_sqi(ch2_filtered, fs=self.sampling_rate))
-            ch1_sqi = await loop.run_in_executor(None, lambda: self.calculate_combined_sqi(ch1_amplitude_sqi, ch1_frequency_sqi))
-            ch2_sqi = await loop.run_in_executor(None, lambda: self.calculate_combined_sqi(ch2_amplitude_sqi, ch2_frequency_sqi))
+            # 필터링 + SQI 계산을 한 번의 executor 호출로 실행 (단계별 스레드 왕복 제거)
+            ch1_filtered, ch2_filtered, ch1_sqi, ch2_sqi = await loop.run_in_executor(
+                None, self._filter_eeg_channels, ch1_data, ch2_data
+            )
             
             # Create quality masks
             ch1_quality_mask = ch1_sqi >= 0.7
@@ -410,17 +443,10 @@ class SignalProcessor:
                 # Run CPU-intensive tasks in a thread pool
                 loop = asyncio.get_event_loop()
                 
-                # Filter PPG signal
-                filtered_ppg = await loop.run_in_executor(None, lambda: hp.filter_signal(
-                    red_data,
-                    cutoff=[0.5, 5.0],
-                    sample_rate=sampling_rate,
-                    order=2,
-                    filtertype='bandpass'
-                ))
-                
-                # Calculate SQI
-                ppg_sqi = await loop.run_in_executor(None, lambda: self.calculate_ppg_sqi(filtered_ppg))
+                # Filter PPG signal + calculate SQI (한 번의 executor 호출)
+                filtered_ppg, ppg_sqi = await loop.run_in_executor(
+                    None, self._filter_ppg_signal, red_data, sampling_rate
+                )
                 good_mask = ppg_sqi >= 0.95
                 good_quality_samples = np.sum(good_mask)
                 good_sample_ratio = good_quality_samples / len(filtered_ppg)
@@ -561,10 +587,9 @@ class SignalProcessor:
             loop = asyncio.get_event_loop()
             
             # Calculate movement
-            x_change = await loop.run_in_executor(None, lambda: np.gradient(x_data))
-            y_change = await loop.run_in_executor(None, lambda: np.gradient(y_data))
-            z_change = await loop.run_in_executor(None, lambda: np.gradient(z_data))
-            movement_magnitude = await loop.run_in_executor(None, lambda: np.sqrt(x_change**2 + y_change**2 + z_change**2))
+            x_change, y_change, z_change, movement_magnitude = await loop.run_in_executor(
+                None, self._compute_movement, x_data, y_data, z_data
+            )
             
             # Calculate statistics
             avg_movement = float(np.mean(movement_magnitude))
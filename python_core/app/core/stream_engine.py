@@ -1,19 +1,23 @@
 import asyncio
 import logging
 import time
-import json
+import numpy as np
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from enum import Enum
 from app.core.server import WebSocketServer
 from app.core.signal_processing import SignalProcessor
 from app.core.event_types import EventType
+from app.core.serialization import dumps_text as json_dumps_text
 
 # Link Band SDK 통합 로깅 사용
 from .logging_config import get_stream_logger, LogTags
 
 logger = get_stream_logger(__name__)
 
+# update_stats 호출 이력을 담는 링 버퍼 크기 (eeg, ppg, acc, bat 샘플 수)
+STATS_HISTORY_SIZE = 4096
+
 class StreamStatus(Enum):
     STOPPED = "stopped"
     STARTING = "starting"
@@ -55,6 +59,11 @@ class StreamEngine:
         self.data_callbacks: List[callable] = []
         self._update_task: Optional[asyncio.Task] = None
         self.signal_processor = SignalProcessor()
+        # 패킷별 샘플 수를 미리 할당한 numpy 링 버퍼에 기록 (리스트 append 대신)
+        self._stats_counts = np.zeros((STATS_HISTORY_SIZE, 4), dtype=np.int64)
+        self._stats_times = np.zeros(STATS_HISTORY_SIZE, dtype=np.float64)
+        self._stats_index = 0
+        self._stats_filled = False
         self._initialized_internally = True
 
     async def init_stream(self, host: str = "localhost", port: int = 18765) -> bool:
@@ -103,6 +112,7 @@ class StreamEngine:
         try:
             self.status = StreamStatus.STARTING
             self.stats = StreamStats(start_time=time.time())
+            self._reset_stats_history()
             self._update_task = asyncio.create_task(self._update_stats())
             self.status = StreamStatus.RUNNING
             logger.info("Stream engine started successfully")
@@ -130,6 +140,7 @@ class StreamEngine:
 
             self.connected_clients.clear()
             self.stats = StreamStats()
+            self._reset_stats_history()
             self.status = StreamStatus.STOPPED
             logger.info("Stream engine stopped successfully")
             return True
@@ -169,34 +180,58 @@ class StreamEngine:
             return
 
         try:
-            await self.ws_server.broadcast(json.dumps(data))
+            await self.ws_server.broadcast(json_dumps_text(data))
             logger.info(f"StreamEngine broadcasted data via ws_server: {data.get('type')}")
         except Exception as e:
             logger.error(f"Error in StreamEngine broadcasting data via ws_server: {e}")
 
-    def update_stats(self, eeg: int = 0, ppg: int = 0, acc: int = 0, bat: int = 0, bat_level: Optional[int] = None):
-        """Update streaming statistics."""
-        self.stats.eeg_samples = eeg
-        self.stats.ppg_samples = ppg
-        self.stats.acc_samples = acc
-        self.stats.bat_samples = bat
-        self.stats.bat_level = bat_level
-        self.stats.last_update = time.time()
+    def update_stats(self, eeg: int, ppg: int, acc: int, bat: int, bat_level: Optional[int] = None):
+        """Update streaming statistics with per-packet sample counts (positional, hot path)."""
+        now = time.time()
+        stats = self.stats
+        stats.eeg_samples = eeg
+        stats.ppg_samples = ppg
+        stats.acc_samples = acc
+        stats.bat_samples = bat
+        stats.bat_level = bat_level
+        stats.last_update = now
+
+        i = self._stats_index
+        self._stats_counts[i] = (eeg, ppg, acc, bat)
+        self._stats_times[i] = now
+        i += 1
+        if i == STATS_HISTORY_SIZE:
+            i = 0
+            self._stats_filled = True
+        self._stats_index = i
+
+    def _reset_stats_history(self):
+        """Clear the per-packet stats ring buffer."""
+        self._stats_index = 0
+        self._stats_filled = False
+
+    def _recent_rates(self, now: float) -> np.ndarray:
+        """Samples/sec for (eeg, ppg, acc, bat) over the entries currently in the ring buffer."""
+        n = STATS_HISTORY_SIZE if self._stats_filled else self._stats_index
+        if n == 0:
+            return np.zeros(4)
+        span = now - self._stats_times[:n].min()
+        if span <= 0:
+            return np.zeros(4)
+        return self._stats_counts[:n].sum(axis=0) / span
 
     async def _update_stats(self):
         """Periodically update and broadcast statistics."""
         while True:
             try:
-                elapsed = time.time() - self.stats.start_time
+                now = time.time()
+                elapsed = now - self.stats.start_time
                 if elapsed > 0 and self.status == StreamStatus.RUNNING:
-                    eeg_rate = self.stats.eeg_samples / elapsed
-                    ppg_rate = self.stats.ppg_samples / elapsed
-                    acc_rate = self.stats.acc_samples / elapsed
-                    bat_rate = self.stats.bat_samples / elapsed
+                    eeg_rate, ppg_rate, acc_rate, bat_rate = self._recent_rates(now).tolist()
 
                     stats_data = {
                         'type': 'engine_stats',
-                        'timestamp': time.time(),
+                        'timestamp': now,
                         'eeg_rate': round(eeg_rate, 2),
                         'ppg_rate': round(ppg_rate, 2),
                         'acc_rate': round(acc_rate, 2),
@@ -238,7 +273,7 @@ class StreamEngine:
                 'data': processed_data
             }
             logger.info(f"Attempting to broadcast {data_type} data via StreamEngine's ws_server")
-            await self.ws_server.broadcast(json.dumps(message))
+            await self.ws_server.broadcast(json_dumps_text(message))
             logger.info(f"Successfully broadcast {data_type} data through StreamEngine's ws_server")
 
         except Exception as e:
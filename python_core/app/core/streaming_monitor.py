@@ -1,6 +1,6 @@
 import time
 import threading
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
 import logging
@@ -86,9 +86,21 @@ class StreamingMonitor:
             return 0.0
         return self.initialization_phase_duration - self.get_time_since_initialization()
     
-    def track_data_flow(self, sensor_type: str, data_count: int, sample_timestamps: list = None):
-        """실시간 데이터 흐름 추적 및 자동 재초기화"""
-        logger.info(f"[STREAMING_MONITOR] track_data_flow called: {sensor_type}, count: {data_count}, timestamps: {len(sample_timestamps) if sample_timestamps else 0}")
+    def track_data_flow(self, sensor_type: str, data_count: int, sample_timestamps: list = None,
+                        timestamp_span: Optional[Tuple[float, float]] = None):
+        """실시간 데이터 흐름 추적 및 자동 재초기화
+
+        EEG 레이트 계산에는 배치의 첫/마지막 타임스탬프만 필요하므로, 전체 타임스탬프 리스트
+        (sample_timestamps) 대신 timestamp_span=(첫 샘플, 마지막 샘플)과 data_count를 넘겨도 된다.
+        """
+        if sample_timestamps and len(sample_timestamps) >= 2:
+            timestamp_span = (sample_timestamps[0], sample_timestamps[-1])
+            span_count = len(sample_timestamps)
+        else:
+            span_count = data_count
+        # 스트림 틱마다 호출되므로 진단 로그는 DEBUG + 지연 포맷팅
+        logger.debug("[STREAMING_MONITOR] track_data_flow called: %s, count: %d, timestamps: %d",
+                     sensor_type, data_count, span_count if timestamp_span else 0)
         
         if sensor_type not in self.data_flow_tracker:
             logger.warning(f"[STREAMING_MONITOR] Unknown sensor type: {sensor_type}")
@@ -109,13 +121,14 @@ class StreamingMonitor:
             time_delta = current_time - flow_data.last_update
             if time_delta > 0:
                 # EEG 타임스탬프 기반 계산 우선 적용
-                if sensor_type == 'eeg' and sample_timestamps and len(sample_timestamps) >= 2:
+                if sensor_type == 'eeg' and timestamp_span and span_count >= 2:
                     # 타임스탬프 기반 정확한 샘플링 레이트 계산
-                    time_span = sample_timestamps[-1] - sample_timestamps[0]
+                    time_span = timestamp_span[1] - timestamp_span[0]
                     if time_span > 0:
-                        timestamp_based_rate = (len(sample_timestamps) - 1) / time_span
+                        timestamp_based_rate = (span_count - 1) / time_span
                         flow_data.samples_per_second = timestamp_based_rate
-                        logger.info(f"[STREAMING_MONITOR] EEG: Using timestamp-based rate: {timestamp_based_rate:.1f} Hz (batch: {data_count} samples)")
+                        logger.debug("[STREAMING_MONITOR] EEG: Using timestamp-based rate: %.1f Hz (batch: %d samples)",
+                                     timestamp_based_rate, data_count)
                     else:
                         # 폴백: 기존 방식
                         current_rate = data_count / time_delta
@@ -137,9 +150,9 @@ class StreamingMonitor:
                 threshold = self.streaming_threshold.get(sensor_type, 0)
                 flow_data.is_active = flow_data.samples_per_second >= threshold
                 
-                logger.info(f"[STREAMING_MONITOR] {sensor_type.upper()}: {data_count} samples, "
-                           f"rate: {flow_data.samples_per_second:.1f}/sec, "
-                           f"active: {flow_data.is_active}, threshold: {threshold}")
+                logger.debug("[STREAMING_MONITOR] %s: %d samples, rate: %.1f/sec, active: %s, threshold: %s",
+                             sensor_type.upper(), data_count, flow_data.samples_per_second,
+                             flow_data.is_active, threshold)
                 
                 # 🔍 데이터 흐름 감지 로그만 남기고 자동 재초기화는 비활성화
                 if (sensor_type == 'eeg' and 
@@ -247,8 +260,8 @@ class StreamingMonitor:
             self._cached_status = status
             self.last_status_calculation = current_time
             
-            logger.debug(f"[STREAMING_MONITOR] Status calculated: active={is_streaming_active}, "
-                        f"sensors={active_sensors}, health={data_flow_health}, phase={phase}")
+            logger.debug("[STREAMING_MONITOR] Status calculated: active=%s, sensors=%s, health=%s, phase=%s",
+                         is_streaming_active, active_sensors, data_flow_health, phase)
             
             return status
     
@@ -0,0 +1,39 @@
+import sys
+from typing import Any, Dict
+
+# uvloop 사용 가능 여부 확인 (Windows 미지원, 없으면 표준 asyncio 루프 사용)
+try:
+    import uvloop  # noqa: F401
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# httptools 사용 가능 여부 확인 (없으면 h11 파서 사용)
+try:
+    import httptools  # noqa: F401
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
+
+def get_uvicorn_options() -> Dict[str, Any]:
+    """Performance-related uvicorn options shared by the server launchers.
+
+    Ping frames on the FastAPI /ws endpoint are disabled: connection liveness
+    is already tracked by the device heartbeat and the client-side reconnect
+    logic, and server pings only add wakeups to the broadcast loop.
+    permessage-deflate is off so an identical broadcast frame is not
+    compressed once per client.
+    """
+    return {
+        "loop": "uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        "http": "httptools" if HTTPTOOLS_AVAILABLE else "h11",
+        "ws": "websockets",
+        "ws_max_size": 16 * 1024 * 1024,
+        # 브로드캐스트마다 클라이언트별로 같은 프레임을 다시 압축하지 않도록 permessage-deflate 비활성화
+        "ws_per_message_deflate": False,
+        "ws_ping_interval": None,
+        "ws_ping_timeout": None,
+        "backlog": 2048,
+        "timeout_keep_alive": 30,
+    }
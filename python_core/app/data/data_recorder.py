@@ -232,6 +232,20 @@ class DataRecorder:
             self.data_buffers[data_type] = []
         self.data_buffers[data_type].append(data)
 
+    def add_many(self, data_type: str, samples: List[Dict[str, Any]]):
+        """Append a batch of sample dicts for one data_type.
+
+        Unlike add_data, samples are not type-checked one by one: callers pass
+        sensor buffers, which only ever contain sample dicts.
+        """
+        if not self.is_recording or not samples:
+            return
+
+        buffer = self.data_buffers.get(data_type)
+        if buffer is None:
+            buffer = self.data_buffers[data_type] = []
+        buffer.extend(samples)
+
     def _get_file_extension(self) -> str:
         """설정된 데이터 형식에 따른 파일 확장자 반환"""
         data_format = self.meta.get("data_format", "JSON").upper()
@@ -30,6 +30,12 @@ else:
     
 if platform.system() == 'Windows':
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+else:
+    # uvloop이 설치되어 있으면 이후 생성되는 이벤트 루프도 uvloop 사용 (uvicorn 루프는 실행 옵션에서 설정)
+    from app.core.uvicorn_config import UVLOOP_AVAILABLE
+    if UVLOOP_AVAILABLE:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 # Link Band SDK 통합 로그 시스템 초기화
 from app.core.logging_config import linkband_logger, get_system_logger, LogTags
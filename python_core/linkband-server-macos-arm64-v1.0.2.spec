@@ -53,6 +53,11 @@ a = Analysis(
         'uvicorn.protocols.http.auto',
         'uvicorn.protocols.websockets',
         'uvicorn.protocols.websockets.auto',
+        'uvicorn.loops.uvloop',
+        'uvicorn.protocols.http.httptools_impl',
+        'uvicorn.protocols.websockets.websockets_impl',
+        'uvloop',
+        'httptools',
         'uvicorn.lifespan',
         'uvicorn.lifespan.on',
         'fastapi',
@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('app', 'app'), ('database', 'database')],
-    hiddenimports=['sqlite3', 'bleak', 'bleak.backends', 'bleak.backends.corebluetooth', 'bleak.backends.corebluetooth.client', 'bleak.backends.corebluetooth.scanner', 'heartpy', 'fastapi', 'fastapi.middleware', 'fastapi.middleware.cors', 'fastapi.staticfiles', 'uvicorn', 'websockets', 'aiohttp', 'aiohttp.web', 'aiohttp.client', 'numpy', 'scipy', 'scipy.signal', 'scipy.stats', 'scipy.fft', 'scipy.interpolate', 'scipy.optimize', 'scipy.sparse', 'scipy.special', 'scipy.integrate', 'scipy.linalg', 'scipy.ndimage', 'psutil', 'aiosqlite', 'asyncio', 'concurrent.futures'],
+    hiddenimports=['sqlite3', 'bleak', 'bleak.backends', 'bleak.backends.corebluetooth', 'bleak.backends.corebluetooth.client', 'bleak.backends.corebluetooth.scanner', 'heartpy', 'fastapi', 'fastapi.middleware', 'fastapi.middleware.cors', 'fastapi.staticfiles', 'uvicorn', 'uvicorn.loops.uvloop', 'uvicorn.protocols.http.httptools_impl', 'uvicorn.protocols.websockets.websockets_impl', 'uvloop', 'httptools', 'websockets', 'aiohttp', 'aiohttp.web', 'aiohttp.client', 'numpy', 'scipy', 'scipy.signal', 'scipy.stats', 'scipy.fft', 'scipy.interpolate', 'scipy.optimize', 'scipy.sparse', 'scipy.special', 'scipy.integrate', 'scipy.linalg', 'scipy.ndimage', 'psutil', 'aiosqlite', 'asyncio', 'concurrent.futures'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -53,6 +53,9 @@ a = Analysis(
         'uvicorn.protocols.http.auto',
         'uvicorn.protocols.websockets',
         'uvicorn.protocols.websockets.auto',
+        'uvicorn.protocols.http.httptools_impl',
+        'uvicorn.protocols.websockets.websockets_impl',
+        'httptools',
         'uvicorn.lifespan',
         'uvicorn.lifespan.on',
         'fastapi',
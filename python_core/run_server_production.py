@@ -73,15 +73,17 @@ def start_server():
         try:
             # 직접 app 모듈에서 서버 시작
             from app.main import app
+            from app.core.uvicorn_config import get_uvicorn_options
             import uvicorn
             
-            # 프로덕션 모드로 uvicorn 실행
+            # 프로덕션 모드로 uvicorn 실행 (가능하면 uvloop/httptools 사용)
             uvicorn.run(
                 app,
                 host="127.0.0.1",
                 port=8121,
                 reload=False,  # 프로덕션에서는 reload 비활성화
-                log_level="info"
+                log_level="info",
+                **get_uvicorn_options()
             )
             
         except KeyboardInterrupt:
@@ -105,6 +107,7 @@ def start_server():
         
         try:
             from app.main import app
+            from app.core.uvicorn_config import get_uvicorn_options
             import uvicorn
             
             uvicorn.run(
@@ -112,7 +115,8 @@ def start_server():
                 host="127.0.0.1",
                 port=8121,
                 reload=False,
-                log_level="info"
+                log_level="info",
+                **get_uvicorn_options()
             )
             
         except KeyboardInterrupt:
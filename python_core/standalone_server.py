@@ -127,6 +127,8 @@ def main():
         logger.info(f"Working directory: {os.getcwd()}")
         logger.info(f"Python path: {sys.path[:3]}...")  # Show first 3 paths
 
+        from app.core.uvicorn_config import get_uvicorn_options
+
         # Run uvicorn directly with the app module
         uvicorn.run(
             "app.main:app",
@@ -134,7 +136,8 @@ def main():
             port=8121,
             reload=False,
             log_level="info",
-            access_log=True
+            access_log=True,
+            **get_uvicorn_options()
         )
         
     except ImportError as e:
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+미리 인코딩한 이벤트/스트림 메시지 prefix 검증
+prefix + payload 결합 결과가 전체 dict를 직렬화한 JSON과 같은지 확인
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app.core.serialization import dumps, loads
+from app.core.server import (
+    EventType,
+    _event_frame,
+    _data_received_frame,
+    _stream_frame_prefix,
+)
+
+SAMPLE_DATA = {
+    "status": "connected",
+    "device": {"name": "LXB-01", "address": "AA:BB:CC:DD:EE:FF"},
+    "levels": [80, 79.5, None],
+    "한글": "값",
+}
+
+
+def test_event_frame_matches_full_encoding():
+    for event_type in EventType:
+        for data in (SAMPLE_DATA, {}, None):
+            expected = dumps({"type": "event", "event_type": event_type.value, "data": data})
+            assert _event_frame(event_type, data) == expected, event_type
+
+
+def test_data_received_frame_matches_full_encoding():
+    samples = [{"timestamp": 1700000000.123456, "ch1": 1.5, "ch2": -2.25}]
+    for data_type in ("eeg", "ppg", "acc", "battery", "custom_type"):
+        frame = _data_received_frame(data_type, samples, 1700000000.5)
+        expected = dumps({
+            "type": "event",
+            "event_type": EventType.DATA_RECEIVED.value,
+            "data": {"type": data_type, "data": samples, "timestamp": 1700000000.5},
+        })
+        assert frame == expected, data_type
+
+
+def test_stream_frame_prefix_matches_full_encoding():
+    samples = [{"timestamp": 1700000000.0, "x": 1, "y": 2, "z": 3}]
+    prefix = _stream_frame_prefix("raw", "acc", "AA:BB:CC:DD:EE:FF")
+    frame = prefix + dumps(1700000000.25) + b',"data":' + dumps(samples) + b'}'
+    assert loads(frame) == {
+        "type": "raw_data",
+        "sensor_type": "acc",
+        "device_id": "AA:BB:CC:DD:EE:FF",
+        "timestamp": 1700000000.25,
+        "data": samples,
+    }
+
+
+if __name__ == "__main__":
+    test_event_frame_matches_full_encoding()
+    test_data_received_frame_matches_full_encoding()
+    test_stream_frame_prefix_matches_full_encoding()
+    print("✅ event/stream frame prefix tests passed")
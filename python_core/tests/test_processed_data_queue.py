@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+FastAPI 전용 모드(port=None) 디바이스 콜백 데이터 전달 확인
+_handle_processed_data로 넣은 데이터가 drain 태스크를 거쳐 FastAPI 클라이언트 송신 큐에 도착하는지 확인
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from app.core.device import DeviceManager
+from app.core.server import WebSocketServer
+
+
+async def _run_fastapi_only():
+    server = WebSocketServer(port=None, device_manager=DeviceManager(None))
+    # FastAPI 클라이언트 등록 대신 송신 큐만 직접 추가 (writer 태스크 없이 큐 내용을 확인)
+    client_queue = asyncio.Queue()
+    server._client_queues["test-client"] = client_queue
+    await server.initialize()
+    try:
+        samples = [{"timestamp": 1700000000.0, "ch1": 1.5, "ch2": -2.25}]
+        await server._handle_processed_data("eeg", samples)
+        message = await asyncio.wait_for(client_queue.get(), timeout=1.0)
+        return json.loads(message)
+    finally:
+        await server.stop()
+
+
+def test_processed_data_reaches_fastapi_client_without_standalone_port():
+    message = asyncio.run(_run_fastapi_only())
+    assert message["type"] == "event"
+    assert message["event_type"] == "data_received"
+    assert message["data"]["type"] == "eeg"
+    assert message["data"]["data"] == [{"timestamp": 1700000000.0, "ch1": 1.5, "ch2": -2.25}]
+
+
+if __name__ == "__main__":
+    test_processed_data_reaches_fastapi_client_without_standalone_port()
+    print("✅ FastAPI-only processed data delivery test passed")